@@ -0,0 +1 @@
+"""Benchmarks for bricks and the brick tooling."""
@@ -0,0 +1,65 @@
+"""Benchmark: bytes and microseconds per response for format_response."""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples" / "transform"))
+from format_response import format_response
+from format_stream import format_stream
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+TYPICAL = {"id": 42, "name": "Alice", "email": "alice@example.com",
+           "roles": ["admin", "user"], "active": True, "score": 97.5}
+LARGE = [dict(TYPICAL, id=i) for i in range(10000)]
+XML_WIDE = {f"field_{i}": f"value <{i}> & more" for i in range(5000)}
+
+
+def measure(func, repeat):
+    """Return (bytes, microseconds per call) for func()."""
+    body = func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    return len(body.encode("utf-8")), elapsed / repeat * 1e6
+
+
+def cases():
+    """Yield (name, callable, repeat) benchmark cases."""
+    for label, data, repeat in [("typical", TYPICAL, 20000),
+                                ("large", LARGE, 20)]:
+        yield (f"{label} json pretty",
+               lambda d=data: format_response(d, pretty=True)["body"], repeat)
+        yield (f"{label} json compact",
+               lambda d=data: format_response(d, pretty=False)["body"], repeat)
+        if orjson is not None:
+            yield (f"{label} json orjson",
+                   lambda d=data: format_response(d, pretty=False, encoder=orjson.dumps)["body"],
+                   repeat)
+        if isinstance(data, list):
+            yield (f"{label} json stream",
+                   lambda d=data: "".join(format_stream(d)["chunks"]), repeat)
+    yield ("typical xml", lambda: format_response(
+        TYPICAL, format_type="xml")["body"], 20000)
+    yield ("wide xml (5000 keys)", lambda: format_response(
+        XML_WIDE, format_type="xml")["body"], 50)
+
+
+def main():
+    """Run all cases and print a results table."""
+    print(f"{'case':<28}{'bytes':>12}{'us/response':>14}")
+    print("-" * 54)
+    for name, func, repeat in cases():
+        size, micros = measure(func, repeat)
+        print(f"{name:<28}{size:>12}{micros:>14.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Benchmark: peak memory of http_post uploads to a local sink server.
+
+    python -m benchmarks.bench_http_post [megabytes]    # default 64
+"""
+
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples" / "api"))
+from http_post import http_post
+
+
+CHUNK = 1 << 16
+# Streaming uploads must stay under this peak regardless of body size
+STREAM_LIMIT = 8 << 20
+
+
+class Sink(BaseHTTPRequestHandler):
+    """Read and discard the request body (Content-Length or chunked)."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                self.rfile.read(size + 2)
+                if not size:
+                    break
+        else:
+            remaining = int(self.headers.get("Content-Length") or 0)
+            while remaining:
+                remaining -= len(self.rfile.read(min(remaining, CHUNK)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def chunks(size):
+    """Yield size bytes of compressible data in CHUNK pieces."""
+    block = (b"0123456789abcdef" * (CHUNK // 16))
+    for _ in range(size // CHUNK):
+        yield block
+
+
+def measure(url, make_body, **kwargs):
+    """Return (peak traced bytes, seconds) for one upload."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = http_post(url, make_body(), **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert result["status"] == 200, result
+    return peak, elapsed
+
+
+def main():
+    """Print peak memory per body type; exit 1 if a streaming upload buffers."""
+    size = int(sys.argv[1] if len(sys.argv) > 1 else 64) << 20
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Sink)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/upload"
+
+    with tempfile.TemporaryFile() as f:
+        for block in chunks(size):
+            f.write(block)
+        cases = [
+            ("bytes (buffered)", lambda: b"".join(chunks(size)), {}, False),
+            ("file object", lambda: f.seek(0) or f, {}, True),
+            ("generator (chunked)", lambda: chunks(size), {}, True),
+            ("generator + gzip", lambda: chunks(size), {"compress": True}, True),
+        ]
+        print(f"Uploading {size >> 20} MB\n")
+        print(f"{'body':<24}{'peak MB':>10}{'MB/s':>10}")
+        print("-" * 44)
+        code = 0
+        for name, make_body, kwargs, streaming in cases:
+            peak, elapsed = measure(url, make_body, **kwargs)
+            print(f"{name:<24}{peak / 2**20:>10.1f}{size / 2**20 / elapsed:>10.0f}")
+            if streaming and peak > STREAM_LIMIT:
+                code = 1
+    server.shutdown()
+    server.server_close()
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Benchmark: brick validate/inspect tooling over a synthetic corpus.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_inspector --count 500 --output results.json
+    python -m benchmarks.bench_inspector --compare results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from pathlib import Path
+
+from benchmarks.corpus import generate_corpus
+from bricks.inspector import inspect_brick
+from tools import cli_validate
+from tools.inspect_contract import inspect_contract
+from tools.inspect_dependencies import inspect_dependencies
+from tools.inspect_performance import inspect_performance
+from tools.inspect_quality import inspect_quality
+from tools.inspect_security import inspect_security
+
+
+PER_FILE_TARGETS = {
+    "inspect_security": inspect_security,
+    "inspect_contract": inspect_contract,
+    "inspect_quality": inspect_quality,
+    "inspect_dependencies": inspect_dependencies,
+    "inspect_performance": inspect_performance,
+    "inspect_brick": inspect_brick,
+}
+
+
+def time_call(func, repeat):
+    """Return the best wall time in seconds of func() over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def record(seconds, files):
+    """Build one result entry."""
+    return {"seconds": seconds, "files": files,
+            "us_per_file": seconds / files * 1e6 if files else 0.0}
+
+
+def run_validate(files, jobs):
+    """Run cli_validate.run end to end with its output discarded."""
+    args = Namespace(brick_file=[str(f) for f in files], format="jsonl", jobs=jobs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli_validate.run(args)
+
+
+def benchmark(files, pathological, repeat):
+    """Time every target over the corpus and each pathological file."""
+    results = {}
+    for name, func in PER_FILE_TARGETS.items():
+        seconds = time_call(lambda: [func(f) for f in files], repeat)
+        results[name] = record(seconds, len(files))
+        for path in pathological:
+            seconds = time_call(lambda: func(path), repeat)
+            results[f"{name}[{path.stem}]"] = record(seconds, 1)
+    for jobs in (1, None):
+        label = "cli_validate.run[serial]" if jobs == 1 else "cli_validate.run[pool]"
+        seconds = time_call(lambda: run_validate(files + pathological, jobs), repeat)
+        results[label] = record(seconds, len(files) + len(pathological))
+    return results
+
+
+def environment(count, seed):
+    """Describe the run so results from different commits can be compared."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {"commit": commit or None, "python": platform.python_version(),
+            "platform": platform.platform(), "count": count, "seed": seed}
+
+
+def compare(baseline, current, threshold):
+    """Return [(name, old_s, new_s)] for results slower than threshold."""
+    regressions = []
+    for name, entry in current.items():
+        old = baseline.get(name)
+        if old and entry["seconds"] > old["seconds"] * (1 + threshold):
+            regressions.append((name, old["seconds"], entry["seconds"]))
+    return regressions
+
+
+def main(argv=None):
+    """Generate a corpus, run the benchmarks and report or compare results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200, help="Synthetic bricks")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per target (best kept)")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed slowdown before a result counts as a regression")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bricks = generate_corpus(tmp, args.count, seed=args.seed)
+        files = [p for p in bricks if p.parent.name != "pathological"]
+        pathological = [p for p in bricks if p.parent.name == "pathological"]
+        results = benchmark(files, pathological, args.repeat)
+
+    print(f"{'target':<48}{'seconds':>10}{'us/file':>12}")
+    print("-" * 70)
+    for name, entry in results.items():
+        print(f"{name:<48}{entry['seconds']:>10.4f}{entry['us_per_file']:>12.1f}")
+
+    if args.output:
+        payload = {"environment": environment(args.count, args.seed), "results": results}
+        Path(args.output).write_text(json.dumps(payload, indent=2))
+        print(f"\n✓ Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+        regressions = compare(baseline, results, args.threshold)
+        for name, old, new in regressions:
+            print(f"✗ {name}: {old:.4f}s -> {new:.4f}s ({new / old - 1:+.0%})")
+        if regressions:
+            return 1
+        print(f"✓ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
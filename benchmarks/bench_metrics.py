@@ -0,0 +1,66 @@
+"""Benchmark: per-call overhead of bricks.metrics instrumentation."""
+
+import sys
+import threading
+import time
+
+from bricks.metrics import Metrics
+
+
+CALLS = 500000
+
+
+def brick(value):
+    """Trivial brick so the measurement is dominated by instrumentation."""
+    return {"value": value, "error": None}
+
+
+def per_call_ns(func, calls=CALLS, repeat=5):
+    """Return the best-of-repeat nanoseconds per func(1) call."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            func(1)
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best
+
+
+def overhead_ns():
+    """Return (bare ns, instrumented ns, overhead ns) per call."""
+    metrics = Metrics()
+    bare = per_call_ns(brick)
+    wrapped = per_call_ns(metrics.wrap(brick, "bench_v1"))
+    return bare, wrapped, wrapped - bare
+
+
+def threaded_calls_per_second(threads=4, calls=100000):
+    """Return aggregate instrumented calls/s with threads recording at once."""
+    metrics = Metrics()
+    wrapped = metrics.wrap(brick, "bench_v1")
+    workers = [threading.Thread(target=per_call_ns, args=(wrapped, calls, 1))
+               for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    assert metrics.snapshot()["bench_v1"]["calls"] == threads * calls
+    return threads * calls / elapsed
+
+
+def main():
+    """Print the overhead table; exit 1 if overhead reaches 1 µs per call."""
+    bare, wrapped, overhead = overhead_ns()
+    print(f"{'case':<28}{'ns/call':>12}")
+    print("-" * 40)
+    print(f"{'bare brick':<28}{bare:>12.0f}")
+    print(f"{'instrumented brick':<28}{wrapped:>12.0f}")
+    print(f"{'overhead':<28}{overhead:>12.0f}")
+    print(f"\n4 threads: {threaded_calls_per_second():,.0f} instrumented calls/s")
+    return 0 if overhead < 1000 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Benchmark: bulk query_update/query_delete against per-row loops.
+
+Each mode runs on a fresh file-backed database (so commits pay for their
+journal writes) holding ROWS rows:
+
+    python -m benchmarks.bench_query_bulk [rows]    # default 5000
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples" / "data"))
+from query_delete import query_delete
+from query_update import query_update
+
+
+def make_db(path, rows):
+    """Create a users table with rows rows at path and return its connection."""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, active INTEGER)")
+    conn.executemany("INSERT INTO users VALUES (?, ?, 1)", [(i, f"u{i}") for i in range(rows)])
+    conn.commit()
+    return conn
+
+
+MODES = {
+    "update: per-row loop": lambda conn, ids: [
+        query_update(conn, "users", {"active": 0}, keys=[i]) for i in ids],
+    "update: chunked IN": lambda conn, ids: query_update(conn, "users", {"active": 0}, keys=ids),
+    "update: executemany rows": lambda conn, ids: query_update(
+        conn, "users", [{"id": i, "name": f"n{i}"} for i in ids]),
+    "delete: per-row loop": lambda conn, ids: [query_delete(conn, "users", [i]) for i in ids],
+    "delete: chunked IN": lambda conn, ids: query_delete(conn, "users", ids),
+    "delete: executemany": lambda conn, ids: query_delete(conn, "users", ids, executemany=True),
+}
+
+
+def main():
+    """Print rows/s per mode and the speedup over the matching per-row loop."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    ids = list(range(rows))
+    print(f"{rows} rows, file-backed SQLite {sqlite3.sqlite_version}\n")
+    print(f"{'mode':<28}{'seconds':>10}{'rows/s':>12}{'speedup':>10}")
+    print("-" * 60)
+    loop_seconds = None
+    with tempfile.TemporaryDirectory() as directory:
+        for number, (name, mode) in enumerate(MODES.items()):
+            conn = make_db(Path(directory) / f"bench{number}.db", rows)
+            start = time.perf_counter()
+            mode(conn, ids)
+            seconds = time.perf_counter() - start
+            conn.close()
+            if name.endswith("per-row loop"):
+                loop_seconds = seconds
+            print(f"{name:<28}{seconds:>10.3f}{rows / seconds:>12,.0f}"
+                  f"{loop_seconds / seconds:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Benchmark: hit ratio and latency saved by query_select_cached.
+
+Replays a read-heavy mix (a handful of hot query shapes, one insert per
+WRITE_EVERY reads) against query_select and query_select_cached.
+"""
+
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples" / "data"))
+import query_select_cached as cached_module
+from query_insert import query_insert
+from query_select import query_select
+from query_select_cached import query_select_cached
+
+
+ROWS = 50000
+READS = 20000
+WRITE_EVERY = 500
+# (columns, where, limit): hot shapes seen in request handlers
+SHAPES = [
+    (["id", "name"], {"id": 42}, None),
+    (["id", "name"], {"id": 4242}, None),
+    (["name", "email"], {"status": "active", "plan": "pro"}, 20),
+    (["id"], {"status": "disabled"}, 50),
+]
+
+
+def make_db():
+    """Return an in-memory DB of ROWS users (id is the only index)."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, "
+                 "status TEXT, plan TEXT)")
+    conn.executemany("INSERT INTO users VALUES (?, ?, ?, ?, ?)",
+                     [(i, f"user{i}", f"user{i}@example.com",
+                       ("active", "disabled")[i % 7 == 0], ("free", "pro")[i % 3 == 0])
+                      for i in range(ROWS)])
+    conn.commit()
+    return conn
+
+
+def replay(select):
+    """Run the read/write mix through select(conn, columns, where, limit); return µs per read."""
+    conn = make_db()
+    elapsed = 0
+    for i in range(READS):
+        if i and i % WRITE_EVERY == 0:
+            query_insert(conn, "users", {"name": f"new{i}", "status": "active", "plan": "pro"})
+        columns, where, limit = SHAPES[i % len(SHAPES)]
+        start = time.perf_counter_ns()
+        select(conn, columns, where, limit)
+        elapsed += time.perf_counter_ns() - start
+    conn.close()
+    return elapsed / READS / 1000
+
+
+def main():
+    """Print per-read latency with and without the cache and the hit ratio."""
+    plain = replay(lambda conn, c, w, l: query_select(conn, "users", c, w, l))
+    cache = OrderedDict()
+    cached = replay(lambda conn, c, w, l: query_select_cached(conn, cache, "users", c, w, l))
+    stats = cached_module.cache_stats
+    ratio = stats["hit"] / (stats["hit"] + stats["miss"])
+
+    print(f"{READS} reads, 1 insert per {WRITE_EVERY}, {len(SHAPES)} query shapes\n")
+    print(f"{'mode':<24}{'µs/read':>12}")
+    print("-" * 36)
+    print(f"{'query_select':<24}{plain:>12.1f}")
+    print(f"{'query_select_cached':<24}{cached:>12.1f}")
+    print(f"\nhit ratio {ratio:.1%}, {plain / cached:.1f}x faster, "
+          f"{plain - cached:.1f} µs saved per read")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Benchmark: search_text (FTS5, bm25) against LIKE '%term%' scans.
+
+Builds a file-backed notes table of synthetic text, indexes it with
+search_index, then times the first page of results for common, rare and
+multi-word queries. Ranked FTS5 scores every match with bm25, so it is
+also timed unranked (rowid order) for the common terms:
+
+    python -m benchmarks.bench_search [rows]    # default 1000000
+"""
+
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples" / "data"))
+from search_index import search_index
+from search_text import search_text
+
+
+WORDS = [f"w{i:04d}" for i in range(5000)]
+QUERIES = ["w0001", "w4999", "w0001 w0002", "w9999"]  # common, rare, two words, absent
+PAGE = 20
+REPEAT = 5
+
+
+def build(path, rows):
+    """Create notes(id, title, body) with Zipf-ish word frequencies; return the connection."""
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, title TEXT, body TEXT)")
+    for start in range(0, rows, 50000):
+        count = min(50000, rows - start)
+        words = rng.choices(WORDS, weights, k=count * 14)
+        conn.executemany("INSERT INTO notes (title, body) VALUES (?, ?)",
+                         ((" ".join(words[i * 14:i * 14 + 2]), " ".join(words[i * 14 + 2:i * 14 + 14]))
+                          for i in range(count)))
+    conn.commit()
+    return conn
+
+
+def best_ms(func):
+    """Return the best of REPEAT wall times in ms, plus the last result."""
+    best, result = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def like(conn, query):
+    """First page of rows whose body contains every word, via LIKE scans."""
+    clause = " AND ".join("body LIKE ?" for _ in query.split())
+    return conn.execute(f"SELECT id, title FROM notes WHERE {clause} LIMIT {PAGE}",
+                        [f"%{word}%" for word in query.split()]).fetchall()
+
+
+def main():
+    """Print LIKE vs FTS5 (ranked and unranked) latency per query."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        conn = build(Path(directory) / "notes.db", rows)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        assert search_index(conn, "notes", ["title", "body"])["error"] is None
+        indexed = time.perf_counter() - start
+        print(f"{rows:,} rows: built in {built:.1f}s, FTS5 index in {indexed:.1f}s\n")
+
+        print(f"{'query':<16}{'LIKE ms':>10}{'ranked ms':>12}{'unranked ms':>13}{'matches':>10}")
+        print("-" * 61)
+        for query in QUERIES:
+            like_ms, _ = best_ms(lambda: like(conn, query))
+            timings = []
+            for ranked in (True, False):
+                ms, result = best_ms(lambda: search_text(conn, "notes", query, ["id", "title"],
+                                                         limit=PAGE, ranked=ranked))
+                assert result["error"] is None, result
+                timings.append(ms)
+            matches = conn.execute("SELECT COUNT(*) FROM notes_fts WHERE notes_fts MATCH ?",
+                                   (" ".join(f'"{word}"' for word in query.split()),)).fetchone()[0]
+            print(f"{query:<16}{like_ms:>10.2f}{timings[0]:>12.2f}{timings[1]:>13.2f}{matches:>10,}")
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
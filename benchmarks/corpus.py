@@ -0,0 +1,116 @@
+"""Deterministic synthetic brick corpus for tooling benchmarks.
+
+Bricks are modelled on examples/: a module docstring, stdlib or
+third-party imports, one brick function returning an error envelope,
+an optional .meta.json sidecar and a companion test_<name>.py file.
+"""
+
+import json
+import random
+from pathlib import Path
+
+
+CATEGORIES = ["auth", "data", "api", "transform"]
+IMPORTS = ["json", "re", "time", "hashlib", "sqlite3", "requests",
+           "bcrypt", "jwt", "csv", "pickle"]
+
+
+def generate_corpus(root, count, seed=0, pathological=True):
+    """
+    Write count synthetic bricks under root.
+
+    Args:
+        root: Output directory (created if missing)
+        count: Number of regular bricks to generate
+        seed: Random seed; the same seed always yields identical files
+        pathological: Also emit a 10k-line brick and a long single-line brick
+
+    Returns:
+        list[Path]: Paths of the generated brick files (tests excluded)
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    bricks = []
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        name = f"{category}_brick_{i:05d}"
+        folder = root / category
+        folder.mkdir(parents=True, exist_ok=True)
+        imports = rng.sample(IMPORTS, rng.randint(0, 3))
+        body_lines = rng.choice([5, 10, 20, 35, 60])
+        docstring = rng.random() > 0.1
+        path = folder / f"{name}.py"
+        path.write_text(brick_source(name, imports, body_lines, docstring))
+        if rng.random() > 0.05:
+            write_meta(folder / f"{name}.meta.json", name, imports)
+        (folder / f"test_{name}.py").write_text(test_source(name))
+        bricks.append(path)
+    if pathological:
+        bricks.extend(pathological_bricks(root / "pathological"))
+    return bricks
+
+
+def brick_source(name, imports, body_lines, docstring=True):
+    """Return the source of one synthetic brick."""
+    lines = []
+    if docstring:
+        lines += [f'"""Synthetic brick {name}.', "",
+                  "Returns:", "    dict: {'result': int, 'error': str|None}",
+                  '"""']
+    lines += [f"import {module}" for module in sorted(imports)]
+    lines += ["", "", f"def {name}(value, factor=2):"]
+    if docstring:
+        lines.append(f'    """Compute {name} for value."""')
+    lines += ["    try:", "        total = 0"]
+    for step in range(body_lines):
+        lines.append(f"        total += value * factor + {step}")
+    lines += ["        return {'result': total, 'error': None}",
+              "    except Exception as e:",
+              "        return {'result': None, 'error': str(e)}", ""]
+    return "\n".join(lines)
+
+
+def test_source(name):
+    """Return the companion test module for a synthetic brick."""
+    return (f'"""Tests for {name} brick."""\n'
+            f"from {name} import {name}\n\n\n"
+            f"def test_{name}():\n"
+            f'    """Test the happy path."""\n'
+            f"    result = {name}(1)\n"
+            f"    assert result['error'] is None\n")
+
+
+def write_meta(path, name, imports):
+    """Write a .meta.json sidecar shaped like the examples."""
+    metadata = {
+        "brick_id": f"{name}_v1",
+        "generated": "2025-11-06T12:00:00Z",
+        "model": "synthetic",
+        "interface": {
+            "inputs": {"value": "int", "factor": "int"},
+            "outputs": {"result": "int|null", "error": "string|null"},
+        },
+        "dependencies": sorted(imports),
+        "tests": [f"test_{name}"],
+        "modified": False,
+        "lineage": [],
+        "inspector_score": None,
+    }
+    path.write_text(json.dumps(metadata, indent=2))
+
+
+def pathological_bricks(folder):
+    """Write bricks that stress size and line-length handling."""
+    folder.mkdir(parents=True, exist_ok=True)
+    huge = folder / "huge_10k_lines.py"
+    huge.write_text(brick_source("huge_10k_lines", ["json"], 10000))
+    write_meta(folder / "huge_10k_lines.meta.json", "huge_10k_lines", ["json"])
+
+    long_line = folder / "long_single_line.py"
+    payload = ", ".join(f"'item_{i}'" for i in range(50000))
+    long_line.write_text('"""Brick with one very long line."""\n\n\n'
+                         "def long_single_line():\n"
+                         '    """Return a large literal."""\n'
+                         f"    return {{'result': [{payload}], 'error': None}}\n")
+    write_meta(folder / "long_single_line.meta.json", "long_single_line", [])
+    return [huge, long_line]
@@ -8,20 +8,53 @@ Commands:
   validate    Validate brick compliance
   inspect     Inspect brick security and quality
   test        Run brick tests
+  dedupe      Find duplicate bricks and tests
+  index       Build and query the metadata manifest
+  bench       Benchmark bricks against stored baselines
+  plan        Flag full table scans and suggest indexes
 """
 
 import sys
 import argparse
-from pathlib import Path
 
-# Add tools to path
-sys.path.insert(0, str(Path(__file__).parent / "tools"))
 
-from cli_init import run as init_run
-from cli_generate import run as generate_run
-from cli_validate import run as validate_run
-from cli_inspect import run as inspect_run
-from cli_test import run as test_run
+def load_command(name):
+    """
+    Import a subcommand module on first use and return its run().
+
+    Subcommands are imported only when dispatched, so `brick validate`
+    does not pay for yaml or the inspector stack.
+    """
+    if name == "init":
+        from tools import cli_init as command
+    elif name == "generate":
+        from tools import cli_generate as command
+    elif name == "validate":
+        from tools import cli_validate as command
+    elif name == "inspect":
+        from tools import cli_inspect as command
+    elif name == "test":
+        from tools import cli_test as command
+    elif name == "dedupe":
+        from tools import cli_dedupe as command
+    elif name == "index":
+        from tools import cli_index as command
+    elif name == "bench":
+        from tools import cli_bench as command
+    elif name == "plan":
+        from tools import cli_plan as command
+    return command.run
+
+
+def run_profiled(command, args):
+    """Run a subcommand under the profiler and print the phase breakdown."""
+    from tools.profiling import Profiler, phase
+
+    with Profiler(pstats_path=args.profile_out) as profiler:
+        with phase(args.command):
+            code = command(args) or 0
+    profiler.print_report(file=sys.stderr)
+    return code
 
 
 def main():
@@ -33,27 +66,106 @@ def main():
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
+    # --profile is shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile", action="store_true",
+                        help="Print per-phase wall time and allocation peaks")
+    common.add_argument("--profile-out", metavar="PSTATS",
+                        help="With --profile, also dump cProfile stats to this file")
+
+    # --since narrows validate/inspect/test to bricks affected by a git diff
+    since = argparse.ArgumentParser(add_help=False)
+    since.add_argument("--since", metavar="GIT_REF",
+                       help="Only bricks changed since GIT_REF and their dependents")
+
     # brick init
-    init_parser = subparsers.add_parser("init", help="Initialize new brick project")
+    init_parser = subparsers.add_parser("init", parents=[common], help="Initialize new brick project")
     init_parser.add_argument("project_name", help="Name of the project")
 
     # brick generate
-    gen_parser = subparsers.add_parser("generate", help="Generate brick from spec")
-    gen_parser.add_argument("brick_name", help="Name of the brick")
-    gen_parser.add_argument("--spec", required=True, help="Path to spec file")
+    gen_parser = subparsers.add_parser("generate", parents=[common], help="Generate brick from spec")
+    gen_parser.add_argument("brick_name", nargs="?", help="Name of the brick (with --spec)")
+    spec_source = gen_parser.add_mutually_exclusive_group(required=True)
+    spec_source.add_argument("--spec", help="Path to spec file")
+    spec_source.add_argument("--spec-dir", help="Generate metadata for every spec in a directory")
     gen_parser.add_argument("--output", default=".", help="Output directory")
+    gen_parser.add_argument("--jobs", type=int, default=None,
+                            help="With --spec-dir, worker processes (default: CPU count)")
+    gen_parser.add_argument("--force", action="store_true",
+                            help="With --spec-dir, rewrite metadata even if prompt_hash matches")
 
     # brick validate
-    val_parser = subparsers.add_parser("validate", help="Validate brick")
-    val_parser.add_argument("brick_file", help="Path to brick file")
+    val_parser = subparsers.add_parser("validate", parents=[common, since], help="Validate brick")
+    val_parser.add_argument("brick_file", nargs="*",
+                            help="Brick files or directories to validate")
+    val_parser.add_argument("--format", choices=["text", "jsonl", "sarif"],
+                            default="text", help="Output format")
+    val_parser.add_argument("--jobs", type=int, default=None,
+                            help="Worker processes (default: CPU count)")
 
     # brick inspect
-    ins_parser = subparsers.add_parser("inspect", help="Inspect brick")
-    ins_parser.add_argument("brick_file", help="Path to brick file")
+    ins_parser = subparsers.add_parser("inspect", parents=[common, since], help="Inspect brick")
+    ins_parser.add_argument("brick_file", nargs="*", help="Path to brick file(s)")
+    ins_parser.add_argument("--plan", action="store_true",
+                            help="Also run each brick's tests and score full table scans")
 
     # brick test
-    test_parser = subparsers.add_parser("test", help="Run brick tests")
-    test_parser.add_argument("brick_file", help="Path to brick file")
+    test_parser = subparsers.add_parser("test", parents=[common, since], help="Run brick tests")
+    test_parser.add_argument("brick_file", nargs="*", help="Path to brick file(s)")
+
+    # brick dedupe
+    dedupe_parser = subparsers.add_parser("dedupe", parents=[common],
+                                          help="Find duplicate bricks and tests")
+    dedupe_parser.add_argument("paths", nargs="+", help="Files or directories to scan")
+    dedupe_parser.add_argument("--threshold", type=float, default=0.8,
+                               help="Similarity (0-1) for near duplicates")
+    dedupe_parser.add_argument("--format", choices=["text", "json"], default="text",
+                               help="Output format")
+
+    # brick index
+    index_parser = subparsers.add_parser("index", parents=[common],
+                                         help="Build and query the metadata manifest")
+    index_parser.add_argument("root", nargs="?", default=".", help="Directory to index")
+    index_parser.add_argument("--db", help="Manifest path (default: ROOT/.brick_manifest.db)")
+    index_parser.add_argument("--rebuild", action="store_true",
+                              help="Re-read every .meta.json instead of syncing changes")
+    index_parser.add_argument("--score", action="store_true",
+                              help="Fill missing inspector_score by running the inspector")
+    index_parser.add_argument("--id", dest="brick_id", help="Query: exact brick_id")
+    index_parser.add_argument("--depends-on", metavar="NAME",
+                              help="Query: bricks listing NAME in dependencies")
+    index_parser.add_argument("--field", help="Query: bricks with this interface field")
+    index_parser.add_argument("--direction", choices=["inputs", "outputs"],
+                              help="With --field, only match inputs or outputs")
+    index_parser.add_argument("--min-score", type=int, help="Query: inspector_score >= N")
+    index_parser.add_argument("--max-score", type=int, help="Query: inspector_score <= N")
+    index_parser.add_argument("--format", choices=["text", "json"], default="text",
+                              help="Output format")
+
+    # brick bench
+    bench_parser = subparsers.add_parser("bench", parents=[common],
+                                         help="Benchmark bricks against stored baselines")
+    bench_parser.add_argument("brick_file", nargs="+", help="Path to brick file(s)")
+    bench_parser.add_argument("--samples", type=int, default=30, help="Timed samples")
+    bench_parser.add_argument("--warmup", type=int, default=3, help="Warmup passes")
+    bench_parser.add_argument("--threshold", type=float, default=0.2,
+                              help="Allowed p50/p99 slowdown (0.2 = 20%%)")
+    bench_parser.add_argument("--baseline", help="Baseline file (default: .brick_bench.json)")
+    bench_parser.add_argument("--update", action="store_true",
+                              help="Overwrite stored baselines with this run")
+
+    # brick plan
+    plan_parser = subparsers.add_parser("plan", parents=[common],
+                                        help="Flag full table scans and suggest indexes")
+    plan_parser.add_argument("brick_file", nargs="*", help="Bricks whose tests' SQL to explain")
+    plan_parser.add_argument("--log", help="Query log to explain instead (one statement per line)")
+    plan_parser.add_argument("--db", help="With --log, the SQLite database to explain against")
+    plan_parser.add_argument("--min-rows", type=int, default=None,
+                             help="Ignore smaller tables (default: 1000 with --log, else 0)")
+    plan_parser.add_argument("--create", action="store_true",
+                             help="With --log, create the suggested indexes")
+    plan_parser.add_argument("--format", choices=["text", "json"], default="text",
+                             help="Output format")
 
     args = parser.parse_args()
 
@@ -63,16 +175,10 @@ def main():
 
     # Route to command
     try:
-        if args.command == "init":
-            return init_run(args) or 0
-        elif args.command == "generate":
-            return generate_run(args) or 0
-        elif args.command == "validate":
-            return validate_run(args) or 0
-        elif args.command == "inspect":
-            return inspect_run(args) or 0
-        elif args.command == "test":
-            return test_run(args) or 0
+        command = load_command(args.command)
+        if not args.profile:
+            return command(args) or 0
+        return run_profiled(command, args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
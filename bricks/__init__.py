@@ -0,0 +1 @@
+"""Reference bricks: inspector and registry."""
@@ -1,23 +1,22 @@
 """Main inspector combining all inspection modules."""
 
-import sys
-from pathlib import Path
+from tools.inspect_security import inspect_security
+from tools.inspect_contract import inspect_contract
+from tools.inspect_quality import inspect_quality
+from tools.inspect_dependencies import inspect_dependencies
+from tools.inspect_performance import inspect_performance
+from tools.inspect_query_plan import inspect_query_plan
+from tools.profiling import phase
 
-# Add tools to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 
-from inspect_security import inspect_security
-from inspect_contract import inspect_contract
-from inspect_quality import inspect_quality
-from inspect_dependencies import inspect_dependencies
-
-
-def inspect_brick(brick_file):
+def inspect_brick(brick_file, plan=False):
     """
     Run all inspections and return combined score.
 
     Args:
         brick_file: Path to brick file
+        plan: Also run the brick's tests to score full table scans
+              (executes code, so off for the static gate)
 
     Returns:
         dict: {score: int, rating: str, issues: list}
@@ -26,22 +25,36 @@ def inspect_brick(brick_file):
     all_issues = []
 
     # Run all inspections
-    security = inspect_security(brick_file)
-    contract = inspect_contract(brick_file)
-    quality = inspect_quality(brick_file)
-    deps = inspect_dependencies(brick_file)
+    with phase("inspect_security"):
+        security = inspect_security(brick_file)
+    with phase("inspect_contract"):
+        contract = inspect_contract(brick_file)
+    with phase("inspect_quality"):
+        quality = inspect_quality(brick_file)
+    with phase("inspect_dependencies"):
+        deps = inspect_dependencies(brick_file)
+    with phase("inspect_performance"):
+        perf = inspect_performance(brick_file)
+    plan_result = {"score_deduction": 0, "issues": []}
+    if plan:
+        with phase("inspect_query_plan"):
+            plan_result = inspect_query_plan(brick_file)
 
     # Deduct scores
     score -= security["score_deduction"]
     score -= contract["score_deduction"]
     score -= quality["score_deduction"]
     score -= deps["score_deduction"]
+    score -= perf["score_deduction"]
+    score -= plan_result["score_deduction"]
 
     # Collect issues
     all_issues.extend(security.get("violations", []))
     all_issues.extend(contract.get("violations", []))
     all_issues.extend(quality.get("issues", []))
     all_issues.extend(deps.get("issues", []))
+    all_issues.extend(perf.get("issues", []))
+    all_issues.extend(plan_result.get("issues", []))
 
     # Determine rating
     if score >= 90:
@@ -0,0 +1,185 @@
+"""Request-scoped batching loader (DataLoader-style) for point lookups.
+
+Callers ask for one key at a time; the loader collects the keys issued in
+the same scope and fetches them with a single batch call, then hands each
+caller its value. Values are memoised for the loader's lifetime, so create
+one loader per request.
+
+    from bricks.loader import Loader
+
+    users = Loader(lambda ids: query_select_many(conn, "users", cols, "id", ids))
+
+    # threads / plain code: load() queues, calling the thunk dispatches
+    alice, bob = users.load(1), users.load(2)
+    alice()                                  # one query for both ids
+
+    # asyncio: keys awaited in the same loop tick share one batch, run on the
+    # default executor so a blocking batch_fn never stalls the loop (a sqlite3
+    # connection used there needs check_same_thread=False)
+    rows = await asyncio.gather(*(users.load_async(i) for i in ids))
+
+batch_fn(keys) returns values aligned with keys, either as a list or as a
+brick envelope ``{"rows": [...], "error": None}``. An error envelope or an
+exception fails every key in that batch (other batches are unaffected);
+failures are not memoised.
+"""
+
+import asyncio
+import threading
+
+
+class Loader:
+    """
+    Batch and memoise lookups through batch_fn.
+
+    Attributes:
+        batch_fn: Callable taking a list of keys, returning aligned values
+        max_batch: Most keys per batch_fn call (None: no limit)
+        stats: {loads, batches, keys} counters
+    """
+
+    def __init__(self, batch_fn, max_batch=None):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.stats = {"loads": 0, "batches": 0, "keys": 0}
+        self._values = {}
+        self._pending = {}  # key -> None, insertion ordered
+        self._waiters = {}  # key -> [asyncio.Future]
+        self._errors = {}  # key -> exception from its last failed batch
+        self._scheduled = False
+        self._lock = threading.RLock()
+
+    def load(self, key):
+        """
+        Queue key and return a thunk for its value.
+
+        Calling the thunk dispatches everything queued so far (if key is
+        not already loaded) and returns the value or raises the failure.
+        """
+        with self._lock:
+            self.stats["loads"] += 1
+            if key not in self._values:
+                self._pending[key] = None
+        return lambda: self._value(key)
+
+    def load_many(self, keys):
+        """Return the values for keys, fetching the missing ones in one dispatch."""
+        thunks = [self.load(key) for key in keys]
+        return [thunk() for thunk in thunks]
+
+    async def load_async(self, key):
+        """Await key's value; keys requested in the same loop tick share a batch."""
+        with self._lock:
+            self.stats["loads"] += 1
+            if key in self._values:
+                return self._values[key]
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._waiters.setdefault(key, []).append(future)
+            self._pending[key] = None
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch_soon)
+        return await future
+
+    def prime(self, key, value):
+        """Memoise a value fetched elsewhere (e.g. by a list query)."""
+        with self._lock:
+            self._values[key] = value
+
+    def clear(self, key=None):
+        """Forget one memoised key, or all of them (e.g. after a write)."""
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+    def dispatch(self):
+        """Fetch every queued key now, max_batch keys per batch_fn call."""
+        with self._lock:
+            keys, self._pending = list(self._pending), {}
+            size = self.max_batch or len(keys) or 1
+            errors = []
+            for start in range(0, len(keys), size):
+                try:
+                    self._fetch(keys[start:start + size])
+                except Exception as e:
+                    errors.append(e)  # later batches still run and wake their waiters
+        if errors:
+            raise errors[0]
+
+    def _fetch(self, keys):
+        """
+        Run one batch, memoise its values and wake async waiters.
+
+        Futures are settled through their own loop's call_soon_threadsafe,
+        as the dispatching thread may not be the loop's thread.
+        """
+        self.stats["batches"] += 1
+        self.stats["keys"] += len(keys)
+        try:
+            values = self.batch_fn(keys)
+            if isinstance(values, dict):
+                if values.get("error") is not None:
+                    raise LookupError(values["error"])
+                values = values["rows"]
+            if len(values) != len(keys):
+                raise ValueError(f"batch_fn returned {len(values)} values for {len(keys)} keys")
+        except Exception as e:
+            for key in keys:
+                self._errors[key] = e
+                for future in self._waiters.pop(key, ()):
+                    _settle(future, error=e)
+            raise
+        for key, value in zip(keys, values):
+            self._values[key] = value
+            self._errors.pop(key, None)
+            for future in self._waiters.pop(key, ()):
+                _settle(future, value)
+
+    def _dispatch_soon(self):
+        """Loop callback: dispatch the keys gathered during this tick off the loop."""
+        self._scheduled = False
+        asyncio.get_running_loop().run_in_executor(None, self._dispatch_quietly)
+
+    def _dispatch_quietly(self):
+        """Dispatch on an executor thread; failures reach the awaiting futures."""
+        try:
+            self.dispatch()
+        except Exception:
+            pass  # already delivered to the awaiting futures
+
+    def _value(self, key):
+        """
+        Return key's value, dispatching (or retrying a failed key) if needed.
+
+        Only the failure of key's own batch is raised; a failure in another
+        batch of the same dispatch does not hide a value that loaded.
+        """
+        with self._lock:
+            if key not in self._values:
+                self._errors.pop(key, None)
+                self._pending[key] = None
+                try:
+                    self.dispatch()
+                except Exception as e:
+                    if key not in self._values:
+                        raise self._errors.pop(key, e)
+            return self._values[key]
+
+
+def _settle(future, value=None, error=None):
+    """Resolve future from any thread via its loop."""
+    def resolve():
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    try:
+        future.get_loop().call_soon_threadsafe(resolve)
+    except RuntimeError:
+        pass  # loop already closed; nobody is waiting
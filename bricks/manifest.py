@@ -0,0 +1,224 @@
+"""SQLite manifest of brick metadata, kept in sync with .meta.json files."""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+
+
+MANIFEST_FILE = ".brick_manifest.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bricks (
+    meta_path TEXT PRIMARY KEY,
+    brick_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    meta_mtime_ns INTEGER NOT NULL,
+    meta_size INTEGER NOT NULL,
+    meta_hash TEXT NOT NULL,
+    source_mtime_ns INTEGER,
+    source_size INTEGER,
+    inspector_score INTEGER,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    meta_path TEXT NOT NULL REFERENCES bricks(meta_path) ON DELETE CASCADE,
+    dependency TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS interface_fields (
+    meta_path TEXT NOT NULL REFERENCES bricks(meta_path) ON DELETE CASCADE,
+    direction TEXT NOT NULL,
+    field TEXT NOT NULL,
+    type TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_bricks_brick_id ON bricks(brick_id);
+CREATE INDEX IF NOT EXISTS idx_bricks_score ON bricks(inspector_score);
+CREATE INDEX IF NOT EXISTS idx_dependencies ON dependencies(dependency, meta_path);
+CREATE INDEX IF NOT EXISTS idx_dependencies_brick ON dependencies(meta_path);
+CREATE INDEX IF NOT EXISTS idx_fields ON interface_fields(field, direction, meta_path);
+CREATE INDEX IF NOT EXISTS idx_fields_brick ON interface_fields(meta_path);
+"""
+
+COLUMNS = "brick_id, path, inspector_score"
+
+
+class MetadataStore:
+    """
+    Indexed SQLite copy of every .meta.json under a root directory.
+
+    sync() is incremental: files whose mtime and size are unchanged are
+    skipped, and files whose content hash is unchanged only have their
+    stat refreshed. Query methods return lists of
+    {brick_id, path, inspector_score} dicts.
+    """
+
+    def __init__(self, root, db_path=None):
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path else self.root / MANIFEST_FILE
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def sync(self, scorer=None):
+        """
+        Bring the manifest in line with the tree.
+
+        Args:
+            scorer: Optional callable(brick_path) -> int used to fill
+                    inspector_score when metadata leaves it null; only
+                    unscored bricks and changed sources are re-scored
+
+        Returns:
+            dict: {added, updated, unchanged, removed} counts
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        known = {row["meta_path"]: row for row in self.conn.execute(
+            "SELECT meta_path, meta_mtime_ns, meta_size, meta_hash, "
+            "source_mtime_ns, source_size, inspector_score FROM bricks")}
+        seen = set()
+
+        with self.conn:
+            for meta_file in self.root.rglob("*.meta.json"):
+                meta_path = meta_file.relative_to(self.root).as_posix()
+                seen.add(meta_path)
+                stat = meta_file.stat()
+                source = meta_file.with_name(meta_file.name[:-len(".meta.json")] + ".py")
+                source_stat = source.stat() if source.exists() else None
+                row = known.get(meta_path)
+                if row is not None and _unchanged(row, stat, source_stat, scorer):
+                    stats["unchanged"] += 1
+                    continue
+                raw = meta_file.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                if (row is not None and row["meta_hash"] == digest
+                        and _scored(row, source_stat, scorer)):
+                    self.conn.execute(
+                        "UPDATE bricks SET meta_mtime_ns = ?, meta_size = ? WHERE meta_path = ?",
+                        (stat.st_mtime_ns, stat.st_size, meta_path))
+                    stats["unchanged"] += 1
+                    continue
+                try:
+                    metadata = json.loads(raw)
+                except ValueError:
+                    seen.discard(meta_path)
+                    continue
+                score = metadata.get("inspector_score")
+                if score is None and scorer is not None and source_stat is not None:
+                    score = scorer(source)
+                self._replace(meta_path, source, stat, source_stat, digest, score, metadata)
+                stats["updated" if row is not None else "added"] += 1
+
+            for meta_path in set(known) - seen:
+                self.conn.execute("DELETE FROM bricks WHERE meta_path = ?", (meta_path,))
+                stats["removed"] += 1
+        return stats
+
+    def clear(self):
+        """Drop every indexed brick so the next sync rebuilds from scratch."""
+        with self.conn:
+            self.conn.execute("DELETE FROM bricks")
+
+    def _replace(self, meta_path, source, stat, source_stat, digest, score, metadata):
+        """Rewrite one brick's rows."""
+        self.conn.execute("DELETE FROM bricks WHERE meta_path = ?", (meta_path,))
+        self.conn.execute(
+            "INSERT INTO bricks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (meta_path, metadata.get("brick_id", source.stem),
+             source.relative_to(self.root).as_posix(),
+             stat.st_mtime_ns, stat.st_size, digest,
+             source_stat.st_mtime_ns if source_stat else None,
+             source_stat.st_size if source_stat else None,
+             score, json.dumps(metadata)))
+        self.conn.executemany(
+            "INSERT INTO dependencies VALUES (?, ?)",
+            [(meta_path, str(dep)) for dep in metadata.get("dependencies", [])])
+        interface = metadata.get("interface") or {}
+        self.conn.executemany(
+            "INSERT INTO interface_fields VALUES (?, ?, ?, ?)",
+            [(meta_path, direction, field, str(kind))
+             for direction in ("inputs", "outputs")
+             for field, kind in (interface.get(direction) or {}).items()])
+
+    def find(self, brick_id=None, dependency=None, field=None, direction=None,
+             min_score=None, max_score=None):
+        """
+        Return bricks matching every given filter, ordered by brick_id.
+
+        Args:
+            brick_id: Exact brick_id
+            dependency: Name listed in metadata dependencies
+            field: Interface field name (e.g. "error")
+            direction: Restrict field to "inputs" or "outputs"
+            min_score, max_score: Inclusive inspector_score bounds
+        """
+        clauses, params = [], []
+        if brick_id is not None:
+            clauses.append("brick_id = ?")
+            params.append(brick_id)
+        if dependency is not None:
+            clauses.append("meta_path IN (SELECT meta_path FROM dependencies WHERE dependency = ?)")
+            params.append(dependency)
+        if field is not None:
+            subquery = "SELECT meta_path FROM interface_fields WHERE field = ?"
+            params.append(field)
+            if direction:
+                subquery += " AND direction = ?"
+                params.append(direction)
+            clauses.append(f"meta_path IN ({subquery})")
+        if min_score is not None:
+            clauses.append("inspector_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("inspector_score <= ?")
+            params.append(max_score)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [dict(row) for row in self.conn.execute(
+            f"SELECT {COLUMNS} FROM bricks{where} ORDER BY brick_id, path", params)]
+
+    def depends_on(self, dependency):
+        """Return bricks whose metadata lists dependency."""
+        return self.find(dependency=dependency)
+
+    def with_field(self, field, direction=None):
+        """Return bricks whose interface has field (inputs, outputs or either)."""
+        return self.find(field=field, direction=direction)
+
+    def metadata(self, brick_id):
+        """Return the stored metadata dict for brick_id, or None."""
+        row = self.conn.execute(
+            "SELECT metadata FROM bricks WHERE brick_id = ?", (brick_id,)).fetchone()
+        return json.loads(row["metadata"]) if row else None
+
+
+def _same_source(row, source_stat):
+    """True if the brick source stat matches what was recorded."""
+    if source_stat is None:
+        return row["source_mtime_ns"] is None
+    return (row["source_mtime_ns"], row["source_size"]) == (
+        source_stat.st_mtime_ns, source_stat.st_size)
+
+
+def _scored(row, source_stat, scorer):
+    """True unless scoring is on and the stored score is missing or stale."""
+    if not _same_source(row, source_stat):
+        return False
+    return scorer is None or source_stat is None or row["inspector_score"] is not None
+
+
+def _unchanged(row, stat, source_stat, scorer):
+    """True if the sidecar is untouched and no (re)scoring is needed."""
+    if (row["meta_mtime_ns"], row["meta_size"]) != (stat.st_mtime_ns, stat.st_size):
+        return False
+    return _scored(row, source_stat, scorer)
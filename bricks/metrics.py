@@ -0,0 +1,261 @@
+"""Runtime metrics for bricks: call counts, error rates and latency histograms.
+
+Wrap a brick with ``instrument`` (or register ``metrics.wrap`` on a
+BrickRegistry) and every call is counted under its brick_id. A call fails
+when it raises or returns a dict whose ``error`` is not None.
+
+    from bricks import metrics
+
+    @metrics.instrument("http_get_v1")
+    def http_get(url): ...
+
+    metrics.serve(port=9464)            # GET /metrics, Prometheus text format
+    metrics.write_textfile("bricks.prom")
+
+The hot path only touches per-thread state (no locks); shards are merged
+when metrics are exported, and a thread's shard is folded into a shared
+total when the thread exits. Latencies go into an HDR-style log-linear
+histogram with 16 sub-buckets per power of two (at most 6.25% error).
+"""
+
+import functools
+import os
+import threading
+import weakref
+from time import perf_counter_ns
+
+
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+# Enough buckets for any 64-bit nanosecond duration
+NUM_BUCKETS = (64 - SUB_BITS) * SUB_BUCKETS
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def bucket_index(ns):
+    """Map a duration in ns to its log-linear histogram bucket."""
+    if ns < SUB_BUCKETS:
+        return ns
+    shift = ns.bit_length() - SUB_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (ns >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index):
+    """Return the [low, high) ns range covered by a bucket."""
+    if index < SUB_BUCKETS:
+        return index, index + 1
+    shift = index // SUB_BUCKETS - 1
+    low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return low, low + (1 << shift)
+
+
+class Metrics:
+    """
+    Per-brick counters and histograms with per-thread shards.
+
+    Each shard maps brick_id -> [errors, total_ns, buckets]; the call
+    count is the sum of the buckets. A thread registers its shard on first
+    record (the only locked step); when the thread exits its thread-local
+    token is collected and the shard is folded into ``_retired``, so
+    thread-per-request servers do not accumulate shards.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._retired = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, brick_id):
+        """Return the calling thread's [errors, total_ns, buckets] for brick_id."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            self._local.token = token = _ThreadToken()
+            with self._lock:
+                self._shards.append(shard)
+            weakref.finalize(token, self._retire, shard)
+        stats = shard.get(brick_id)
+        if stats is None:
+            stats = shard[brick_id] = [0, 0, [0] * NUM_BUCKETS]
+        return stats
+
+    def _retire(self, shard):
+        """Fold an exited thread's shard into the shared total."""
+        with self._lock:
+            self._shards = [s for s in self._shards if s is not shard]
+            _merge(self._retired, shard)
+
+    def record(self, brick_id, elapsed_ns, failed=False):
+        """Count one call of brick_id that took elapsed_ns."""
+        stats = self._stats(brick_id)
+        stats[0] += failed
+        stats[1] += elapsed_ns
+        stats[2][bucket_index(elapsed_ns)] += 1
+
+    def wrap(self, func, brick_id):
+        """
+        Return func instrumented under brick_id.
+
+        The success path is inlined (cached per-thread stats, inline bucket
+        arithmetic) to keep overhead well under a microsecond per call.
+        """
+        local = threading.local()
+        stats_for, record = self._stats, self.record
+        sub_buckets, sub_shift = SUB_BUCKETS, SUB_BITS + 1
+
+        @functools.wraps(func)
+        def instrumented(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(brick_id, perf_counter_ns() - start, True)
+                raise
+            elapsed = perf_counter_ns() - start
+            try:
+                stats = local.stats
+            except AttributeError:
+                stats = local.stats = stats_for(brick_id)
+            if type(result) is dict and result.get("error") is not None:
+                stats[0] += 1
+            stats[1] += elapsed
+            if elapsed < sub_buckets:
+                stats[2][elapsed] += 1
+            else:
+                shift = elapsed.bit_length() - sub_shift
+                stats[2][(shift + 1) * sub_buckets + (elapsed >> shift) - sub_buckets] += 1
+            return result
+
+        instrumented.brick_id = brick_id
+        return instrumented
+
+    def instrument(self, brick_id):
+        """Decorator form of wrap()."""
+        return lambda func: self.wrap(func, brick_id)
+
+    def reset(self):
+        """Zero every counter (in place, so wrappers keep their cached stats)."""
+        with self._lock:
+            for shard in [self._retired, *self._shards]:
+                for stats in shard.values():
+                    stats[:2] = [0, 0]
+                    stats[2][:] = [0] * NUM_BUCKETS
+
+    def snapshot(self):
+        """
+        Merge all shards.
+
+        Returns:
+            dict: {brick_id: {calls, errors, total_ns, quantiles: {q: ns}}}
+        """
+        merged = {}
+        with self._lock:
+            shards = list(self._shards)
+            _merge(merged, self._retired)
+        for shard in shards:
+            _merge(merged, shard)
+        result = {}
+        for brick_id, (errors, total, buckets) in sorted(merged.items()):
+            calls = sum(buckets)
+            result[brick_id] = {"calls": calls, "errors": errors, "total_ns": total,
+                                "quantiles": {q: _quantile(buckets, calls, q)
+                                              for q in QUANTILES}}
+        return result
+
+    def to_prometheus(self):
+        """Render the snapshot in Prometheus text exposition format."""
+        lines = [
+            "# HELP brick_calls_total Brick calls.",
+            "# TYPE brick_calls_total counter",
+        ]
+        snapshot = self.snapshot()
+        for brick_id, entry in snapshot.items():
+            lines.append(f'brick_calls_total{{brick_id="{brick_id}"}} {entry["calls"]}')
+        lines += ["# HELP brick_errors_total Brick calls that raised or returned an error.",
+                  "# TYPE brick_errors_total counter"]
+        for brick_id, entry in snapshot.items():
+            lines.append(f'brick_errors_total{{brick_id="{brick_id}"}} {entry["errors"]}')
+        lines += ["# HELP brick_latency_seconds Brick call latency.",
+                  "# TYPE brick_latency_seconds summary"]
+        for brick_id, entry in snapshot.items():
+            label = f'brick_id="{brick_id}"'
+            for q, ns in entry["quantiles"].items():
+                lines.append(f'brick_latency_seconds{{{label},quantile="{q}"}} {ns / 1e9:.9f}')
+            lines.append(f"brick_latency_seconds_sum{{{label}}} {entry['total_ns'] / 1e9:.9f}")
+            lines.append(f"brick_latency_seconds_count{{{label}}} {entry['calls']}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Atomically write the Prometheus text to path (textfile collector)."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+    def serve(self, port=9464, host="127.0.0.1"):
+        """
+        Serve GET /metrics from a daemon thread.
+
+        Returns: the running ThreadingHTTPServer (call shutdown() to stop)
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class _ThreadToken:
+    """Weak-referenceable marker held only by a thread's local storage."""
+
+
+def _merge(total, shard):
+    """Add a shard's per-brick stats into total (both brick_id -> stats)."""
+    for brick_id, (errors, elapsed, buckets) in list(shard.items()):
+        entry = total.setdefault(brick_id, [0, 0, [0] * NUM_BUCKETS])
+        entry[0] += errors
+        entry[1] += elapsed
+        entry[2] = [a + b for a, b in zip(entry[2], buckets)]
+
+
+def _quantile(buckets, calls, q):
+    """Return the upper bound (ns) of the bucket holding quantile q."""
+    if not calls:
+        return 0
+    rank = max(1, int(q * calls + 0.5))
+    seen = 0
+    for index, count in enumerate(buckets):
+        seen += count
+        if seen >= rank:
+            return bucket_bounds(index)[1]
+    return 0
+
+
+# Process-wide default instance
+default = Metrics()
+record = default.record
+wrap = default.wrap
+instrument = default.instrument
+snapshot = default.snapshot
+to_prometheus = default.to_prometheus
+write_textfile = default.write_textfile
+serve = default.serve
@@ -0,0 +1,224 @@
+"""Brick registry: discovers bricks from .meta.json files and loads them lazily."""
+
+import hashlib
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+
+
+INDEX_FILE = ".brick_index.json"
+INDEX_VERSION = 2
+
+_import_lock = threading.Lock()  # guards sys.path while a brick module executes
+
+
+class LazyBrick:
+    """
+    Callable proxy that imports its brick module on first call.
+
+    Attributes:
+        brick_id: Brick identifier from metadata
+        path: Path to the brick source file
+        function: Name of the brick function (the file stem)
+        wrappers: wrapper(func, brick_id) -> func callables applied on load
+    """
+
+    def __init__(self, brick_id, path, function, wrappers=()):
+        self.brick_id = brick_id
+        self.path = Path(path)
+        self.function = function
+        self.wrappers = wrappers
+        self._func = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """True once the brick module has been imported."""
+        return self._func is not None
+
+    def load(self):
+        """
+        Import the brick module and return the brick function.
+
+        The brick's directory is on sys.path while the module executes, so
+        composed bricks can import their siblings by module name as they do
+        under pytest.
+        """
+        if self._func is None:
+            with self._lock:
+                if self._func is None:
+                    name = f"brick_{self.brick_id}"
+                    spec = importlib.util.spec_from_file_location(name, self.path)
+                    module = importlib.util.module_from_spec(spec)
+                    _exec_module(spec, module)
+                    func = getattr(module, self.function)
+                    for wrapper in self.wrappers:
+                        func = wrapper(func, self.brick_id)
+                    self._func = func
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "lazy"
+        return f"<LazyBrick {self.brick_id} ({state}) {self.path}>"
+
+
+class BrickRegistry:
+    """
+    Index of every brick under a root directory.
+
+    The index maps brick_id to {path, interface, dependencies, tests,
+    test_file, hash} and is persisted as JSON, with the sidecar files it
+    was built from, so later processes can skip reading the tree. Brick
+    modules are never imported while indexing.
+    """
+
+    def __init__(self, root, index_path=None):
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path else self.root / INDEX_FILE
+        self.entries = {}
+        self.sidecars = []
+        self.duplicates = []
+        self.wrappers = []
+        self._bricks = {}
+
+    @classmethod
+    def open(cls, root, index_path=None, rebuild=False):
+        """
+        Load the persisted index, scanning the tree if it is missing or
+        bricks were added or deleted since it was saved. Edited sources
+        keep their entries; stale() reports them.
+        """
+        registry = cls(root, index_path)
+        if rebuild or not registry.load() or registry.sidecars != registry._sidecar_paths():
+            registry.scan()
+            registry.save()
+        return registry
+
+    def scan(self):
+        """Walk the tree once and index every brick with a .meta.json sidecar."""
+        self.entries, self.duplicates, self._bricks = {}, [], {}
+        self.sidecars = self._sidecar_paths()
+        for meta_path in (self.root / sidecar for sidecar in self.sidecars):
+            entry = _index_entry(meta_path, self.root)
+            if entry is None:
+                continue
+            brick_id = entry.pop("brick_id")
+            if brick_id in self.entries:
+                self.duplicates.append((brick_id, entry["path"]))
+                continue
+            self.entries[brick_id] = entry
+        return self.entries
+
+    def save(self):
+        """Persist the index next to the tree."""
+        payload = {"version": INDEX_VERSION, "bricks": self.entries, "sidecars": self.sidecars}
+        self.index_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+
+    def load(self):
+        """Read a persisted index; returns False if absent or unreadable."""
+        try:
+            payload = json.loads(self.index_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return False
+        if payload.get("version") != INDEX_VERSION:
+            return False
+        self.entries, self.sidecars, self._bricks = payload["bricks"], payload["sidecars"], {}
+        return True
+
+    def stale(self):
+        """Return brick_ids whose source no longer matches the indexed hash."""
+        changed = []
+        for brick_id, entry in self.entries.items():
+            path = self.root / entry["path"]
+            if not path.exists() or _file_hash(path) != entry["hash"]:
+                changed.append(brick_id)
+        return changed
+
+    def _sidecar_paths(self):
+        """Return the root-relative .meta.json paths that have a brick beside them."""
+        return [meta.relative_to(self.root).as_posix()
+                for meta in sorted(self.root.rglob("*.meta.json"))
+                if meta.with_name(meta.name[:-len(".meta.json")] + ".py").exists()]
+
+    def add_wrapper(self, wrapper):
+        """
+        Apply wrapper(func, brick_id) -> func to every brick as it loads,
+        e.g. bricks.metrics.wrap. Bricks already loaded are not wrapped.
+        """
+        self.wrappers.append(wrapper)
+
+    def get(self, brick_id):
+        """Return a lazy callable for brick_id (KeyError if unknown)."""
+        brick = self._bricks.get(brick_id)
+        if brick is None:
+            entry = self.entries[brick_id]
+            path = self.root / entry["path"]
+            brick = LazyBrick(brick_id, path, path.stem, self.wrappers)
+            self._bricks[brick_id] = brick
+        return brick
+
+    def __getitem__(self, brick_id):
+        return self.get(brick_id)
+
+    def __contains__(self, brick_id):
+        return brick_id in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def _exec_module(spec, module):
+    """
+    Execute a brick module with its directory first on sys.path.
+
+    Siblings it imports by bare module name are dropped from sys.modules
+    afterwards, and any module of the same name the host had imported is
+    restored, so bricks neither leak names into nor borrow them from the
+    host process.
+    """
+    parent = Path(spec.origin).resolve().parent
+    siblings = {path.stem for path in parent.glob("*.py")}
+    with _import_lock:
+        hidden = {name: sys.modules.pop(name) for name in siblings if name in sys.modules}
+        sys.path.insert(0, str(parent))
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.path.remove(str(parent))
+            for name in siblings:
+                sys.modules.pop(name, None)
+            sys.modules.update(hidden)
+
+
+def _index_entry(meta_path, root):
+    """Build one index entry from a .meta.json sidecar, or None if unusable."""
+    brick_path = meta_path.with_name(meta_path.name[:-len(".meta.json")] + ".py")
+    if not brick_path.exists():
+        return None
+    try:
+        metadata = json.loads(meta_path.read_text())
+    except json.JSONDecodeError:
+        return None
+    test_file = brick_path.parent / f"test_{brick_path.name}"
+    return {
+        "brick_id": metadata.get("brick_id", brick_path.stem),
+        "path": brick_path.relative_to(root).as_posix(),
+        "interface": metadata.get("interface", {}),
+        "dependencies": metadata.get("dependencies", []),
+        "tests": metadata.get("tests", []),
+        "test_file": test_file.relative_to(root).as_posix() if test_file.exists() else None,
+        "hash": _file_hash(brick_path),
+    }
+
+
+def _file_hash(path):
+    """Return the sha256 digest of a file, prefixed like prompt_hash."""
+    return "sha256:" + hashlib.sha256(Path(path).read_bytes()).hexdigest()
@@ -0,0 +1,51 @@
+"""HTTP caching policy brick (Cache-Control, Expires and validators)."""
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+
+def cache_policy(headers, now=None, request_headers=None):
+    """
+    Work out whether and for how long a shared cache may serve a response.
+
+    Args:
+        headers: Response headers dict (any key case)
+        now: Current epoch seconds (defaults to time.time())
+        request_headers: Headers the request was sent with; if they carry
+                         Authorization only public, s-maxage or
+                         must-revalidate responses are stored
+
+    Returns:
+        dict: {store: bool, fresh_until: float, etag: str|None,
+               last_modified: str|None, error: str|None}
+    """
+    now = time.time() if now is None else now
+    lower = {k.lower(): v for k, v in (headers or {}).items()}
+    directives = {}
+    for part in lower.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    fresh_until, error = now, None
+    try:
+        if "max-age" in directives:
+            fresh_until = now + int(directives["max-age"])
+        elif "expires" in lower:
+            expires = parsedate_to_datetime(lower["expires"])
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=timezone.utc)
+            fresh_until = expires.timestamp()
+    except (ValueError, TypeError) as e:
+        # An unparsable freshness header means "already stale" (RFC 9111)
+        error = f"Invalid freshness header: {e}"
+    if "no-cache" in directives:
+        fresh_until = now
+
+    authorized = any(k.lower() == "authorization" for k in request_headers or {})
+    shared = not authorized or {"public", "s-maxage", "must-revalidate"} & directives.keys()
+    store = (not {"no-store", "private"} & directives.keys() and bool(shared)
+             and lower.get("vary", "").strip() != "*")
+    return {"store": store, "fresh_until": fresh_until,
+            "etag": lower.get("etag"), "last_modified": lower.get("last-modified"),
+            "error": error}
@@ -0,0 +1,37 @@
+"""Per-host circuit breaker brick."""
+import threading
+import time
+
+_circuits = {}
+_lock = threading.Lock()
+
+
+def circuit_breaker(host, success=None, failure_threshold=5, reset_seconds=30.0):
+    """
+    Gate calls to a host: check with success=None, then record True/False.
+
+    Args:
+        host: Host the call goes to
+        success: None to ask permission, True/False to record an outcome
+        failure_threshold: Consecutive failures that open the circuit
+        reset_seconds: Time the circuit stays open before one probe is allowed
+
+    Returns:
+        dict: {allowed: bool, state: str, error: str|None}
+    """
+    now = time.monotonic()
+    with _lock:
+        circuit = _circuits.setdefault(host, {"state": "closed", "failures": 0, "opened_at": 0.0})
+        if success is True:
+            circuit.update(state="closed", failures=0)
+        elif success is False:
+            circuit["failures"] += 1
+            if circuit["state"] == "half_open" or circuit["failures"] >= failure_threshold:
+                circuit.update(state="open", opened_at=now)
+        elif circuit["state"] != "closed":
+            if now - circuit["opened_at"] < reset_seconds:
+                return {"allowed": False, "state": circuit["state"],
+                        "error": f"Circuit open for {host}"}
+            # Let a single probe through; its outcome closes or reopens
+            circuit.update(state="half_open", opened_at=now)
+        return {"allowed": True, "state": circuit["state"], "error": None}
@@ -0,0 +1,25 @@
+"""HTTP GET brick that collapses concurrent identical requests into one."""
+from http_cache_get import http_cache_get
+from http_get import http_get
+from single_flight import single_flight
+
+
+def coalesced_get(url, headers=None, timeout=10, cached=False):
+    """
+    GET url through single_flight so a stampede on one URL makes one request.
+
+    Args:
+        url: URL to fetch
+        headers: Optional headers dict (part of the coalescing key)
+        timeout: Request timeout, also how long collapsed callers wait
+        cached: Fetch through http_cache_get so misses are coalesced too
+
+    Returns:
+        dict: {status: int, data: str|None, error: str|None, shared: bool}
+    """
+    fetch = http_cache_get if cached else http_get
+    key = (url, tuple(sorted((headers or {}).items())), cached)
+    flight = single_flight(key, lambda: fetch(url, headers, timeout), timeout)
+    if flight["error"]:
+        return {"status": 0, "data": None, "error": flight["error"], "shared": flight["shared"]}
+    return {**flight["value"], "shared": flight["shared"]}
@@ -0,0 +1,90 @@
+"""Shared fixtures for API brick tests: a local fault-injecting HTTP stub."""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubServer:
+    """
+    Local HTTP server that replays scripted faults.
+
+    Each request pops the next (status, headers, body, delay) from plan;
+    once the plan is empty every request gets default. Requests are
+    recorded as (method, path, headers, body).
+    """
+
+    def __init__(self):
+        self.plan = []
+        self.default = (200, {}, b"ok", 0)
+        self.requests = []
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def url(self, path="/"):
+        """Return an absolute URL on the stub."""
+        return f"http://127.0.0.1:{self.server.server_address[1]}{path}"
+
+    def next_response(self, method, path, headers, body):
+        """Record a request and return the response to send."""
+        with self._lock:
+            self.requests.append((method, path, headers, body))
+            return self.plan.pop(0) if self.plan else self.default
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    body = b"".join(read_chunked(self.rfile))
+                else:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    body = self.rfile.read(length) if length else b""
+                status, headers, payload, delay = stub.next_response(
+                    self.command, self.path, dict(self.headers), body)
+                if delay:
+                    time.sleep(delay)
+                if isinstance(payload, str):
+                    payload = payload.encode()
+                try:
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client gave up (timeout tests)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def read_chunked(rfile):
+    """Yield the chunks of a Transfer-Encoding: chunked request body."""
+    while True:
+        size = int(rfile.readline().split(b";")[0], 16)
+        if not size:
+            rfile.readline()  # blank line after the last chunk (no trailers)
+            return
+        yield rfile.read(size)
+        rfile.readline()
+
+
+@pytest.fixture
+def stub_server():
+    """Yield a running StubServer and shut it down afterwards."""
+    stub = StubServer()
+    stub.thread.start()
+    yield stub
+    stub.server.shutdown()
+    stub.server.server_close()
@@ -0,0 +1,33 @@
+"""JSON file cache tier brick."""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+
+def disk_cache(directory, key, value=None):
+    """
+    Read (value=None) or atomically write a JSON-serialisable value under key.
+
+    Args:
+        directory: Cache directory (created on first write)
+        key: Cache key (hashed into the file name)
+        value: Value to store; None to read
+
+    Returns:
+        dict: {value: any, found: bool, error: str|None}
+    """
+    path = Path(directory) / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+    try:
+        if value is None:
+            return {"value": json.loads(path.read_text()), "found": True, "error": None}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(value))
+        os.replace(tmp, path)
+        return {"value": value, "found": True, "error": None}
+    except FileNotFoundError:
+        return {"value": None, "found": False, "error": None}
+    except (OSError, ValueError, TypeError) as e:
+        return {"value": None, "found": False, "error": str(e)}
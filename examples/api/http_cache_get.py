@@ -0,0 +1,61 @@
+"""HTTP GET with an opt-in response cache and conditional revalidation."""
+import threading
+import time
+from collections import OrderedDict
+
+from cache_policy import cache_policy
+from disk_cache import disk_cache
+from http_get import http_get
+from lru_cache import lru_cache
+
+VALIDATORS = {"If-None-Match": "etag", "If-Modified-Since": "last_modified"}
+cache_stats = {"hit": 0, "miss": 0, "revalidated": 0}
+_memory = OrderedDict()
+_lock = threading.Lock()
+
+
+def http_cache_get(url, headers=None, timeout=10, max_entries=256, disk_dir=None):
+    """
+    GET url, serving fresh cached bodies and revalidating stale ones (304).
+
+    Args:
+        url, headers, timeout: As for http_get; url plus headers is the cache key,
+            and private or (unless public) authorised responses are not stored
+        max_entries, disk_dir: Memory tier size (LRU); optional persistent second tier
+
+    Returns:
+        dict: {status: int, data: str|None, error: str|None, cache: hit|revalidated|miss}
+    """
+    now, key = time.time(), _key(url, headers)
+    entry = lru_cache(_memory, key)["value"] or (disk_dir and disk_cache(disk_dir, key)["value"])
+    if entry and entry["fresh_until"] > now:
+        return _keep(key, entry, "hit", max_entries, None)
+
+    validators = {h: entry[f] for h, f in VALIDATORS.items() if entry and entry.get(f)}
+    result = http_get(url, {**(headers or {}), **validators}, timeout, include_headers=True)
+    policy = cache_policy(result.pop("headers", {}), now, headers)
+    if entry and result["status"] == 304:
+        entry = dict(entry, fresh_until=policy["fresh_until"])
+        return _keep(key, entry, "revalidated", max_entries, disk_dir)
+    if result["status"] == 200 and policy["store"]:
+        entry = {"status": 200, "data": result["data"], "fresh_until": policy["fresh_until"],
+                 "etag": policy["etag"], "last_modified": policy["last_modified"]}
+        return _keep(key, entry, "miss", max_entries, disk_dir)
+    with _lock:
+        cache_stats["miss"] += 1
+    return {**result, "cache": "miss"}
+
+
+def _key(url, headers):
+    """Cache key: url plus the request headers (names case-insensitive)."""
+    return "\n".join([url, *sorted(f"{k.lower()}: {v}" for k, v in (headers or {}).items())])
+
+
+def _keep(key, entry, outcome, max_entries, disk_dir):
+    """Store entry in both tiers, count the outcome and build the response."""
+    lru_cache(_memory, key, entry, max_entries)
+    if disk_dir:
+        disk_cache(disk_dir, key, entry)
+    with _lock:
+        cache_stats[outcome] += 1
+    return {"status": entry["status"], "data": entry["data"], "error": None, "cache": outcome}
@@ -2,7 +2,7 @@
 import requests
 
 
-def http_get(url, headers=None, timeout=10):
+def http_get(url, headers=None, timeout=10, include_headers=False, max_bytes=None):
     """
     Perform HTTP GET request with error handling.
 
@@ -10,32 +10,38 @@ def http_get(url, headers=None, timeout=10):
         url: URL to fetch
         headers: Optional headers dict
         timeout: Request timeout in seconds
+        include_headers: Also return the response headers
+        max_bytes: Abort once the (decompressed) body exceeds this size
 
     Returns:
         dict: {status: int, data: str|None, error: str|None}
+              (+ headers: dict when include_headers)
     """
     try:
-        response = requests.get(url, headers=headers or {}, timeout=timeout)
-        return {
+        bounded = max_bytes is not None
+        response = requests.get(url, headers=headers or {}, timeout=timeout, stream=bounded)
+        data = _read_bounded(response, max_bytes) if bounded else response.text
+        result = {
             "status": response.status_code,
-            "data": response.text,
-            "error": None
+            "data": data,
+            "error": None if data is not None else f"Response exceeds {max_bytes} bytes"
         }
+        if include_headers:
+            result["headers"] = dict(response.headers)
+        return result
     except requests.Timeout:
         return {"status": 0, "data": None, "error": "Request timeout"}
     except requests.RequestException as e:
         return {"status": 0, "data": None, "error": str(e)}
 
 
-def test_http_get():
-    """Test HTTP GET with httpbin."""
-    result = http_get("https://httpbin.org/get")
-    assert result["status"] == 200
-    assert result["error"] is None
-    assert "httpbin" in result["data"]
-
-
-def test_http_get_timeout():
-    """Test timeout handling."""
-    result = http_get("https://httpbin.org/delay/20", timeout=1)
-    assert result["error"] == "Request timeout"
+def _read_bounded(response, max_bytes):
+    """Read and decode the body, or return None as soon as it exceeds max_bytes."""
+    chunks, size = [], 0
+    with response:
+        for chunk in response.iter_content(65536):
+            size += len(chunk)
+            if size > max_bytes:
+                return None
+            chunks.append(chunk)
+    return b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
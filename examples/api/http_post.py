@@ -1,38 +1,59 @@
 """HTTP POST request brick."""
-import requests
+import gzip
 import json
+import zlib
+
+import requests
 
 
-def http_post(url, data, headers=None, timeout=10):
+def http_post(url, data, headers=None, timeout=10, compress=False):
     """
-    Perform HTTP POST request with JSON data.
+    Perform HTTP POST request without copying large bodies.
 
     Args:
         url: URL to post to
-        data: Dict to send as JSON
-        headers: Optional headers dict
+        data: str/bytes (as-is), a file object (streamed), an iterator of bytes
+              (chunked), None (empty body); anything else, e.g. a tuple, as JSON
+        headers: Optional headers dict (never modified)
         timeout: Request timeout in seconds
+        compress: gzip the body incrementally (Content-Encoding: gzip)
 
     Returns:
         dict: {status: int, data: str|None, error: str|None}
     """
-    try:
-        headers = headers or {}
+    headers = dict(headers or {})
+    streamed = hasattr(data, "read") or hasattr(data, "__next__")
+    if not streamed and not isinstance(data, (str, bytes, bytearray)):
         headers.setdefault("Content-Type", "application/json")
-        response = requests.post(url, json=data, headers=headers, timeout=timeout)
-        return {
-            "status": response.status_code,
-            "data": response.text,
-            "error": None
-        }
+        data = None if data is None else json.dumps(data).encode()
+    elif isinstance(data, str):
+        data = data.encode()
+    if compress and data is not None:
+        headers["Content-Encoding"] = "gzip"
+        data = gzip.compress(data) if isinstance(data, (bytes, bytearray)) else _gzip_chunks(data)
+    try:
+        response = requests.post(url, data=data, headers=headers, timeout=timeout)
+        return {"status": response.status_code, "data": response.text, "error": None}
     except requests.Timeout:
         return {"status": 0, "data": None, "error": "Request timeout"}
     except requests.RequestException as e:
         return {"status": 0, "data": None, "error": str(e)}
 
 
-def test_http_post():
-    """Test HTTP POST."""
-    result = http_post("https://httpbin.org/post", {"test": "data"})
-    assert result["status"] == 200
-    assert result["error"] is None
+def _gzip_chunks(body, chunk_size=65536):
+    """Yield a gzip stream for a file object or iterable of bytes/str chunks."""
+    if hasattr(body, "read"):
+        body = _read_chunks(body, chunk_size)
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in body:
+        yield compressor.compress(chunk.encode() if isinstance(chunk, str) else chunk)
+    yield compressor.flush()
+
+
+def _read_chunks(body, chunk_size):
+    """Yield a binary or text file's chunks until EOF (b"" or "")."""
+    while True:
+        chunk = body.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
@@ -0,0 +1,44 @@
+"""Streaming HTTP GET brick: byte chunks or straight-to-file downloads."""
+from pathlib import Path
+
+import requests
+import urllib3
+
+from stream_body import stream_body
+
+
+def http_stream(url, dest=None, headers=None, timeout=10, chunk_size=65536,
+                max_bytes=None, decompress=True, progress=None):
+    """
+    Stream a GET body without holding it in memory.
+
+    Args:
+        url: URL to fetch
+        dest: File path to write; None returns a chunk iterator as data
+        headers, timeout: As for http_get
+        chunk_size: Bytes per read
+        max_bytes: Abort once more than this many bytes arrive
+        decompress: Undo gzip/deflate Content-Encoding incrementally
+        progress: Optional callback(received_bytes, total_bytes|None)
+
+    Returns:
+        dict: {status: int, data: chunk iterator|dest path|None, error: str|None};
+              an iterator that stops early sets error once it is exhausted
+    """
+    try:
+        response = requests.get(url, headers=headers or {}, timeout=timeout, stream=True)
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+        timed_out = isinstance(e, requests.Timeout)
+        return {"status": 0, "data": None, "error": "Request timeout" if timed_out else str(e)}
+    result = stream_body(response, chunk_size, max_bytes, decompress, progress)
+    if dest is None:
+        return result
+    try:
+        with open(dest, "wb") as f:
+            f.writelines(result["data"])
+    except OSError as e:
+        result["error"] = str(e)
+    if result["error"]:
+        Path(dest).unlink(missing_ok=True)
+        return {**result, "data": None}
+    return {**result, "data": str(dest)}
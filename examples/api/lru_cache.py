@@ -0,0 +1,33 @@
+"""Bounded least-recently-used memory cache brick."""
+import threading
+
+_lock = threading.Lock()
+
+
+def lru_cache(store, key, value=None, max_entries=256):
+    """
+    Read (value=None) or write key in an OrderedDict, evicting the least
+    recently used entries beyond max_entries.
+
+    Args:
+        store: collections.OrderedDict owned by the caller
+        key: Cache key
+        value: Value to store; None to read
+        max_entries: Maximum entries kept after a write
+
+    Returns:
+        dict: {value: any, found: bool, evicted: int}
+    """
+    with _lock:
+        if value is None:
+            if key not in store:
+                return {"value": None, "found": False, "evicted": 0}
+            store.move_to_end(key)
+            return {"value": store[key], "found": True, "evicted": 0}
+        store[key] = value
+        store.move_to_end(key)
+        evicted = 0
+        while len(store) > max_entries:
+            store.popitem(last=False)
+            evicted += 1
+        return {"value": value, "found": True, "evicted": evicted}
@@ -0,0 +1,28 @@
+"""Per-host retry budget brick."""
+import threading
+
+_budgets = {}
+_lock = threading.Lock()
+
+
+def retry_budget(host, earn=0.0, spend=False, cap=10.0):
+    """
+    Track a host's retry tokens: each request earns a fraction, each retry spends one.
+
+    Args:
+        host: Host the requests go to
+        earn: Tokens to add (a request's budget_ratio); 0 adds nothing
+        spend: Take one token for a retry, if there is one
+        cap: Most tokens a host can bank (a new host starts full)
+
+    Returns:
+        dict: {allowed: bool, tokens: float, error: str|None}
+    """
+    with _lock:
+        tokens = min(cap, _budgets.get(host, cap) + earn)
+        allowed = tokens >= 1
+        if spend and allowed:
+            tokens -= 1
+        _budgets[host] = tokens
+    error = None if allowed else f"Retry budget exhausted for {host}"
+    return {"allowed": allowed, "tokens": tokens, "error": error}
@@ -0,0 +1,53 @@
+"""Retry with backoff, jitter and circuit breaking for HTTP bricks."""
+import random
+import time
+from urllib.parse import urlsplit
+
+from circuit_breaker import circuit_breaker
+from handle_error import handle_error
+from retry_budget import retry_budget
+
+
+def retry_request(send, url, max_attempts=4, base_delay=0.1, max_delay=5.0,
+                  deadline=30.0, budget_ratio=0.2, timeout=10, **kwargs):
+    """
+    Call send(url, timeout=..., **kwargs), retrying failures handle_error marks retryable.
+
+    Args:
+        send: http_get or http_post (returns {status, data, error})
+        url: Request URL; its host keys the circuit breaker and retry budget
+        max_attempts: Total attempts including the first (one for unseekable stream data)
+        base_delay, max_delay: First backoff ceiling (doubles per retry, full jitter) and cap
+        deadline: Seconds for all attempts; each timeout is capped to what is left
+        budget_ratio: Retry tokens a host earns per request (retries spend one)
+
+    Returns:
+        dict: {status: int, data: str|None, error: str|None, attempts: int}
+    """
+    host = urlsplit(url).netloc
+    stop_at = time.monotonic() + deadline
+    body = kwargs.get("data")
+    start = body.tell() if getattr(body, "seekable", lambda: False)() else None
+    if start is None and (hasattr(body, "read") or hasattr(body, "__next__")):
+        max_attempts = 1  # a consumed stream cannot be sent again
+    retry_budget(host, earn=budget_ratio)
+    result, attempt = {"status": 0, "data": None, "error": "Deadline exceeded"}, 0
+    while attempt < max_attempts:
+        remaining, gate = stop_at - time.monotonic(), circuit_breaker(host)
+        if not gate["allowed"] or remaining <= 0:
+            return {**result, "error": gate["error"] or "Deadline exceeded", "attempts": attempt}
+        if attempt and start is not None:
+            body.seek(start)
+        attempt += 1
+        result = send(url, timeout=min(timeout, remaining), **kwargs)
+        circuit_breaker(host, success=0 < result["status"] < 500)
+        retryable = True
+        if result["status"]:
+            retryable = handle_error(result["status"], result["data"] or "")["retryable"]
+        delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+        if (not retryable or attempt == max_attempts or time.monotonic() + delay >= stop_at
+                or not retry_budget(host, spend=True)["allowed"]):
+            break
+        time.sleep(delay)
+    return {**result, "attempts": attempt}
+
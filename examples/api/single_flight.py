@@ -0,0 +1,43 @@
+"""Single-flight brick: collapse concurrent identical calls into one."""
+import threading
+
+flight_stats = {"calls": 0, "executed": 0, "collapsed": 0, "timeouts": 0}
+_flights = {}
+_lock = threading.Lock()
+
+
+def single_flight(key, func, timeout=30.0):
+    """
+    Run func() once per key at a time; concurrent callers share its result.
+
+    Args:
+        key: Hashable identity of the call (e.g. URL or cache key)
+        func: Zero-argument callable producing the result
+        timeout: Seconds a collapsed caller waits for the in-flight call
+
+    Returns:
+        dict: {value: any, shared: bool, error: str|None}
+    """
+    with _lock:
+        flight_stats["calls"] += 1
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = {"done": threading.Event(), "value": None, "error": None}
+        flight_stats["executed" if leader else "collapsed"] += 1
+
+    if leader:
+        try:
+            flight["value"] = func()
+        except Exception as e:
+            flight["error"] = f"{type(e).__name__}: {e}"
+        finally:
+            with _lock:
+                del _flights[key]
+            flight["done"].set()
+    elif not flight["done"].wait(timeout):
+        with _lock:
+            flight_stats["timeouts"] += 1
+        return {"value": None, "shared": True,
+                "error": f"Timed out after {timeout}s waiting for in-flight call"}
+    return {"value": flight["value"], "shared": not leader, "error": flight["error"]}
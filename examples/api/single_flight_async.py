@@ -0,0 +1,37 @@
+"""Single-flight brick for asyncio: collapse concurrent identical awaits into one."""
+import asyncio
+
+flight_stats = {"calls": 0, "executed": 0, "collapsed": 0, "timeouts": 0}
+_flights = {}
+
+
+async def single_flight_async(key, factory, timeout=30.0):
+    """
+    Await factory() once per key at a time; concurrent awaiters share its result.
+
+    Args:
+        key: Hashable identity of the call (e.g. URL or cache key)
+        factory: Zero-argument callable returning an awaitable
+        timeout: Seconds this caller waits; the shared call keeps running for others
+
+    Returns:
+        dict: {value: any, shared: bool, error: str|None}
+    """
+    flight_key = (asyncio.get_running_loop(), key)
+    task = _flights.get(flight_key)
+    shared = task is not None
+    flight_stats["calls"] += 1
+    flight_stats["collapsed" if shared else "executed"] += 1
+    if not shared:
+        task = _flights[flight_key] = asyncio.ensure_future(factory())
+        task.add_done_callback(lambda _: _flights.pop(flight_key, None))
+
+    try:
+        value = await asyncio.wait_for(asyncio.shield(task), timeout)
+    except asyncio.TimeoutError:
+        flight_stats["timeouts"] += 1
+        return {"value": None, "shared": shared,
+                "error": f"Timed out after {timeout}s waiting for in-flight call"}
+    except Exception as e:
+        return {"value": None, "shared": shared, "error": f"{type(e).__name__}: {e}"}
+    return {"value": value, "shared": shared, "error": None}
@@ -0,0 +1,46 @@
+"""Streamed response body brick: a capped, progress-reporting chunk iterator."""
+import requests
+import urllib3
+
+
+def stream_body(response, chunk_size=65536, max_bytes=None, decompress=True, progress=None):
+    """
+    Iterate the body of a stream=True requests response, closing it at the end.
+
+    Args:
+        response: requests.Response fetched with stream=True
+        chunk_size: Bytes per read
+        max_bytes: Stop once more than this many bytes arrive
+        decompress: Undo gzip/deflate Content-Encoding incrementally
+        progress: Optional callback(received_bytes, total_bytes|None)
+
+    Returns:
+        dict: {status: int, data: chunk iterator, error: str|None}; error is set
+              when the iterator stops early (max_bytes or a network error)
+    """
+    length = response.headers.get("Content-Length", "")
+    encoded = decompress and "Content-Encoding" in response.headers
+    total = int(length) if length.isdigit() and not encoded else None
+    result = {"status": response.status_code, "data": None, "error": None}
+    result["data"] = _chunks(response, chunk_size, max_bytes, decompress, progress, total, result)
+    return result
+
+
+def _chunks(response, chunk_size, max_bytes, decompress, progress, total, result):
+    """Yield body chunks; on overflow or a network error set result["error"] and stop."""
+    with response:
+        # raw.stream raises urllib3's own errors, which requests does not wrap
+        reader = (response.iter_content(chunk_size) if decompress
+                  else response.raw.stream(chunk_size, decode_content=False))
+        received = 0
+        try:
+            for chunk in reader:
+                received += len(chunk)
+                if max_bytes is not None and received > max_bytes:
+                    result["error"] = f"Response exceeds {max_bytes} bytes"
+                    return
+                if progress:
+                    progress(received, total)
+                yield chunk
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            result["error"] = str(e)
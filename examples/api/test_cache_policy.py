@@ -0,0 +1,37 @@
+"""Tests for cache_policy brick."""
+from cache_policy import cache_policy
+
+NOW = 1_700_000_000.0
+
+
+def test_max_age_sets_freshness():
+    """Test max-age wins over Expires and validators are returned."""
+    result = cache_policy({"Cache-Control": "public, max-age=60",
+                           "Expires": "Thu, 01 Jan 1970 00:00:00 GMT",
+                           "ETag": '"v1"', "Last-Modified": "Tue, 14 Nov 2023 22:13:20 GMT"}, NOW)
+    assert result == {"store": True, "fresh_until": NOW + 60, "etag": '"v1"',
+                      "last_modified": "Tue, 14 Nov 2023 22:13:20 GMT", "error": None}
+
+
+def test_expires_and_no_cache():
+    """Test Expires sets freshness and no-cache forces revalidation."""
+    expires = cache_policy({"expires": "Tue, 14 Nov 2023 22:23:20 GMT"}, NOW)
+    assert expires["fresh_until"] == NOW + 600
+    no_cache = cache_policy({"Cache-Control": "no-cache, max-age=600"}, NOW)
+    assert (no_cache["store"], no_cache["fresh_until"]) == (True, NOW)
+
+
+def test_no_store_and_invalid_expires():
+    """Test no-store disables caching and bad dates count as stale."""
+    assert cache_policy({"Cache-Control": "no-store"}, NOW)["store"] is False
+    invalid = cache_policy({"Expires": "0"}, NOW)
+    assert invalid["fresh_until"] == NOW
+    assert invalid["error"].startswith("Invalid freshness header")
+
+
+def test_private_vary_star_and_authorized():
+    """Test personalised responses are not stored by the shared cache."""
+    assert cache_policy({"Cache-Control": "private, max-age=60"}, NOW)["store"] is False
+    assert cache_policy({"Vary": "*"}, NOW)["store"] is False
+    assert cache_policy({"Cache-Control": "max-age=60"}, NOW, {"authorization": "Bearer x"})["store"] is False
+    assert cache_policy({"Cache-Control": "public, max-age=60"}, NOW, {"authorization": "Bearer x"})["store"]
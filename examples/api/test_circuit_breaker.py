@@ -0,0 +1,40 @@
+"""Tests for circuit_breaker brick."""
+import time
+
+from circuit_breaker import circuit_breaker
+
+
+def test_circuit_opens_after_threshold():
+    """Test consecutive failures open the circuit and it fails fast."""
+    host = "opens.example"
+    for _ in range(3):
+        assert circuit_breaker(host, failure_threshold=3)["allowed"] is True
+        circuit_breaker(host, success=False, failure_threshold=3)
+    result = circuit_breaker(host, failure_threshold=3)
+    assert result == {"allowed": False, "state": "open", "error": "Circuit open for opens.example"}
+
+
+def test_circuit_half_open_probe():
+    """Test one probe is allowed after reset and its outcome decides the state."""
+    host = "probe.example"
+    circuit_breaker(host, success=False, failure_threshold=1)
+    assert circuit_breaker(host, reset_seconds=0.05)["allowed"] is False
+    time.sleep(0.06)
+
+    probe = circuit_breaker(host, reset_seconds=0.05)
+    assert probe == {"allowed": True, "state": "half_open", "error": None}
+    assert circuit_breaker(host, reset_seconds=0.05)["allowed"] is False
+
+    circuit_breaker(host, success=False)
+    assert circuit_breaker(host, reset_seconds=0.05)["state"] == "open"
+    time.sleep(0.06)
+    circuit_breaker(host, reset_seconds=0.05)
+    circuit_breaker(host, success=True)
+    assert circuit_breaker(host)["state"] == "closed"
+
+
+def test_circuits_are_per_host():
+    """Test failures on one host do not affect another."""
+    circuit_breaker("down.example", success=False, failure_threshold=1)
+    assert circuit_breaker("down.example")["allowed"] is False
+    assert circuit_breaker("up.example")["allowed"] is True
@@ -0,0 +1,36 @@
+"""Tests for coalesced_get brick against a local http.server stub."""
+import threading
+
+from coalesced_get import coalesced_get
+
+
+def test_stampede_makes_one_request(stub_server):
+    """Test concurrent identical GETs reach the backend once."""
+    stub_server.default = (200, {}, "report", 0.2)
+    url = stub_server.url("/report")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalesced_get(url)))
+               for _ in range(25)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(stub_server.requests) == 1
+    assert {(r["status"], r["data"]) for r in results} == {(200, "report")}
+    assert sum(r["shared"] for r in results) == 24
+
+
+def test_cached_mode_coalesces_cache_misses(stub_server):
+    """Test cached=True collapses the miss and later calls hit the cache."""
+    stub_server.default = (200, {"Cache-Control": "max-age=60"}, "ref", 0.1)
+    url = stub_server.url("/ref-data")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalesced_get(url, cached=True)))
+               for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(stub_server.requests) == 1
+    assert coalesced_get(url, cached=True)["cache"] == "hit"
+    assert len(stub_server.requests) == 1
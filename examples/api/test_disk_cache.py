@@ -0,0 +1,12 @@
+"""Tests for disk_cache brick."""
+from disk_cache import disk_cache
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    """Test values are written atomically and read back by key."""
+    directory = tmp_path / "cache"
+    assert disk_cache(directory, "k") == {"value": None, "found": False, "error": None}
+    assert disk_cache(directory, "k", {"n": 1})["found"] is True
+    assert disk_cache(directory, "k") == {"value": {"n": 1}, "found": True, "error": None}
+    assert [p.suffix for p in directory.iterdir()] == [".json"]
+    assert disk_cache(directory, "bad", {1, 2})["error"] is not None
@@ -0,0 +1,92 @@
+"""Tests for http_cache_get brick against a local http.server stub."""
+from collections import OrderedDict
+
+import http_cache_get as cache_module
+from http_cache_get import cache_stats, http_cache_get
+
+
+def reset():
+    """Clear the memory tier and counters."""
+    cache_module._memory.clear()
+    cache_stats.update(hit=0, miss=0, revalidated=0)
+
+
+def test_fresh_response_served_from_memory(stub_server):
+    """Test a max-age response is served without contacting the server."""
+    reset()
+    stub_server.default = (200, {"Cache-Control": "max-age=60"}, "reference", 0)
+    url = stub_server.url("/ref")
+    assert http_cache_get(url)["cache"] == "miss"
+    assert http_cache_get(url) == {"status": 200, "data": "reference", "error": None,
+                                   "cache": "hit"}
+    assert len(stub_server.requests) == 1
+    assert cache_stats == {"hit": 1, "miss": 1, "revalidated": 0}
+
+
+def test_stale_entry_revalidated_with_304(stub_server):
+    """Test validators are sent and a 304 is answered from cache."""
+    reset()
+    stub_server.plan = [(200, {"ETag": '"v1"', "Last-Modified": "Tue, 14 Nov 2023 22:13:20 GMT"},
+                         "daily", 0),
+                        (304, {"Cache-Control": "max-age=60"}, "", 0)]
+    url = stub_server.url("/daily")
+    http_cache_get(url)
+    result = http_cache_get(url)
+    assert (result["status"], result["data"], result["cache"]) == (200, "daily", "revalidated")
+    headers = stub_server.requests[1][2]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Tue, 14 Nov 2023 22:13:20 GMT"
+    # The 304 refreshed freshness, so the third call is a pure hit
+    assert http_cache_get(url)["cache"] == "hit"
+    assert len(stub_server.requests) == 2
+
+
+def test_changed_resource_replaces_entry(stub_server):
+    """Test a 200 on revalidation replaces the cached body."""
+    reset()
+    stub_server.plan = [(200, {"ETag": '"v1"'}, "old", 0), (200, {"ETag": '"v2"'}, "new", 0)]
+    url = stub_server.url("/changing")
+    http_cache_get(url)
+    assert http_cache_get(url)["data"] == "new"
+    assert cache_module._memory[url]["etag"] == '"v2"'
+    assert cache_stats["miss"] == 2
+
+
+def test_no_store_not_cached(stub_server):
+    """Test no-store responses and errors are never cached."""
+    reset()
+    stub_server.default = (200, {"Cache-Control": "no-store"}, "secret", 0)
+    http_cache_get(stub_server.url("/private"))
+    stub_server.default = (500, {"Cache-Control": "max-age=60"}, "boom", 0)
+    assert http_cache_get(stub_server.url("/broken"))["status"] == 500
+    assert cache_module._memory == OrderedDict()
+
+
+def test_personalised_responses_not_shared(stub_server):
+    """Test request headers key the cache and private or authorised responses are not stored."""
+    reset()
+    stub_server.default = (200, {"Cache-Control": "max-age=60"}, "fr", 0)
+    url = stub_server.url("/greeting")
+    http_cache_get(url, {"Accept-Language": "fr"})
+    stub_server.default = (200, {"Cache-Control": "max-age=60"}, "en", 0)
+    assert http_cache_get(url, {"Accept-Language": "en"})["data"] == "en"
+    assert http_cache_get(url, {"accept-language": "fr"})["cache"] == "hit"
+
+    reset()
+    stub_server.default = (200, {"Cache-Control": "max-age=60"}, "alice's inbox", 0)
+    http_cache_get(stub_server.url("/inbox"), {"Authorization": "Bearer alice"})
+    stub_server.default = (200, {"Cache-Control": "private, max-age=60"}, "profile", 0)
+    http_cache_get(stub_server.url("/me"))
+    assert cache_module._memory == OrderedDict()
+
+
+def test_disk_tier_survives_memory_eviction(stub_server, tmp_path):
+    """Test entries evicted from memory are still served from disk."""
+    reset()
+    stub_server.default = (200, {"Cache-Control": "max-age=60"}, "body", 0)
+    first, second = stub_server.url("/a"), stub_server.url("/b")
+    http_cache_get(first, max_entries=1, disk_dir=tmp_path)
+    http_cache_get(second, max_entries=1, disk_dir=tmp_path)
+    assert list(cache_module._memory) == [second]
+    assert http_cache_get(first, max_entries=1, disk_dir=tmp_path)["cache"] == "hit"
+    assert len(stub_server.requests) == 2
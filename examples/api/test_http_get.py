@@ -0,0 +1,31 @@
+"""Tests for http_get brick against a local http.server stub."""
+from http_get import http_get
+
+
+def test_http_get(stub_server):
+    """Test a plain GET returns the decoded body."""
+    stub_server.default = (200, {"Content-Type": "text/plain; charset=utf-8"}, "héllo", 0)
+    result = http_get(stub_server.url("/get"), headers={"X-Trace": "1"})
+    assert result == {"status": 200, "data": "héllo", "error": None}
+    assert stub_server.requests[0][2]["X-Trace"] == "1"
+
+
+def test_http_get_timeout(stub_server):
+    """Test timeout handling."""
+    stub_server.default = (200, {}, "late", 0.5)
+    result = http_get(stub_server.url(), timeout=0.1)
+    assert result["error"] == "Request timeout"
+
+
+def test_http_get_include_headers(stub_server):
+    """Test response headers are returned on request."""
+    stub_server.default = (200, {"ETag": '"v1"'}, "body", 0)
+    assert http_get(stub_server.url(), include_headers=True)["headers"]["ETag"] == '"v1"'
+
+
+def test_http_get_max_bytes(stub_server):
+    """Test bodies over max_bytes are rejected and smaller ones decoded."""
+    stub_server.default = (200, {"Content-Type": "text/plain; charset=utf-8"}, "x" * 100_000, 0)
+    over = http_get(stub_server.url(), max_bytes=50_000)
+    assert over == {"status": 200, "data": None, "error": "Response exceeds 50000 bytes"}
+    assert http_get(stub_server.url(), max_bytes=100_000)["data"] == "x" * 100_000
@@ -0,0 +1,66 @@
+"""Tests for http_post brick against a local http.server stub."""
+import gzip
+import io
+import json
+
+from http_post import http_post
+
+
+def test_http_post(stub_server):
+    """Test a dict is sent as JSON without touching the caller's headers."""
+    headers = {"X-Trace": "1"}
+    result = http_post(stub_server.url("/post"), {"key": "value"}, headers=headers)
+    assert result == {"status": 200, "data": "ok", "error": None}
+    method, _, sent, body = stub_server.requests[0]
+    assert (method, json.loads(body)) == ("POST", {"key": "value"})
+    assert sent["Content-Type"] == "application/json" and sent["X-Trace"] == "1"
+    assert headers == {"X-Trace": "1"}
+
+
+def test_http_post_bytes_and_file(stub_server):
+    """Test bytes and file objects are sent as-is with a Content-Length."""
+    http_post(stub_server.url(), b"\x00raw")
+    http_post(stub_server.url(), io.BytesIO(b"from file"))
+    assert [r[3] for r in stub_server.requests] == [b"\x00raw", b"from file"]
+    assert stub_server.requests[1][2]["Content-Length"] == "9"
+
+
+def test_http_post_iterable_is_chunked(stub_server):
+    """Test a generator body is streamed with chunked transfer encoding."""
+    http_post(stub_server.url(), (f"line {i}\n".encode() for i in range(3)))
+    _, _, sent, body = stub_server.requests[0]
+    assert sent["Transfer-Encoding"] == "chunked"
+    assert body == b"line 0\nline 1\nline 2\n"
+
+
+def test_http_post_gzip(stub_server):
+    """Test compress gzips whole bodies and streams alike."""
+    http_post(stub_server.url(), {"a": 1}, compress=True)
+    http_post(stub_server.url(), iter([b"ab", "cd"]), compress=True)
+    first, second = stub_server.requests
+    assert first[2]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(first[3])) == {"a": 1}
+    assert gzip.decompress(second[3]) == b"abcd"
+
+
+def test_http_post_timeout(stub_server):
+    """Test timeout handling."""
+    stub_server.default = (200, {}, "late", 0.5)
+    assert http_post(stub_server.url(), {}, timeout=0.1)["error"] == "Request timeout"
+
+
+def test_http_post_json_values(stub_server):
+    """Test tuples and scalars are still sent as JSON, and None as an empty JSON request."""
+    http_post(stub_server.url(), (1, 2))
+    http_post(stub_server.url(), 7)
+    http_post(stub_server.url(), None)
+    bodies = [r[3] for r in stub_server.requests]
+    assert bodies == [b"[1, 2]", b"7", b""]
+    assert all(r[2]["Content-Type"] == "application/json" for r in stub_server.requests)
+
+
+def test_http_post_gzip_text_file(stub_server):
+    """Test a text-mode file ends at its "" EOF when streamed through gzip."""
+    result = http_post(stub_server.url(), io.StringIO("text body"), compress=True, timeout=2)
+    assert result["status"] == 200
+    assert gzip.decompress(stub_server.requests[0][3]) == b"text body"
@@ -0,0 +1,56 @@
+"""Tests for http_stream brick against a local http.server stub."""
+import gzip
+
+from http_stream import http_stream
+
+BODY = bytes(range(256)) * 1024
+
+
+def test_stream_chunks_with_progress(stub_server):
+    """Test the body arrives as bounded chunks with progress reports."""
+    stub_server.default = (200, {}, BODY, 0)
+    seen = []
+    result = http_stream(stub_server.url(), chunk_size=65536,
+                         progress=lambda received, total: seen.append((received, total)))
+    chunks = list(result["data"])
+    assert result["status"] == 200 and result["error"] is None
+    assert b"".join(chunks) == BODY
+    assert max(len(c) for c in chunks) <= 65536
+    assert seen[-1] == (len(BODY), len(BODY))
+
+
+def test_stream_to_file(stub_server, tmp_path):
+    """Test dest mode writes the body and returns the path as data."""
+    stub_server.default = (200, {}, BODY, 0)
+    dest = tmp_path / "export.bin"
+    result = http_stream(stub_server.url(), dest=dest)
+    assert result == {"status": 200, "data": str(dest), "error": None}
+    assert dest.read_bytes() == BODY
+
+
+def test_max_bytes_aborts_and_removes_partial_file(stub_server, tmp_path):
+    """Test an oversized body is abandoned early in both modes."""
+    stub_server.default = (200, {}, BODY, 0)
+    dest = tmp_path / "partial.bin"
+    result = http_stream(stub_server.url(), dest=dest, max_bytes=100_000, chunk_size=16384)
+    assert result["error"] == "Response exceeds 100000 bytes"
+    assert not dest.exists()
+
+    result = http_stream(stub_server.url(), max_bytes=100_000, chunk_size=16384)
+    received = list(result["data"])
+    assert result["error"] == "Response exceeds 100000 bytes"
+    assert 0 < sum(map(len, received)) <= 100_000
+
+
+def test_incremental_decompression(stub_server):
+    """Test gzip bodies are decoded as they stream, or passed through raw."""
+    compressed = gzip.compress(BODY)
+    stub_server.default = (200, {"Content-Encoding": "gzip"}, compressed, 0)
+    assert b"".join(http_stream(stub_server.url())["data"]) == BODY
+    raw = http_stream(stub_server.url(), decompress=False)["data"]
+    assert b"".join(raw) == compressed
+
+    # max_bytes counts decompressed bytes, so a small gzip bomb is still capped
+    bomb = http_stream(stub_server.url(), max_bytes=len(compressed) * 2)
+    list(bomb["data"])
+    assert bomb["error"] == f"Response exceeds {len(compressed) * 2} bytes"
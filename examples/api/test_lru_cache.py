@@ -0,0 +1,15 @@
+"""Tests for lru_cache brick."""
+from collections import OrderedDict
+
+from lru_cache import lru_cache
+
+
+def test_lru_cache_evicts_least_recent():
+    """Test reads refresh recency and writes evict beyond max_entries."""
+    store = OrderedDict()
+    lru_cache(store, "a", 1, max_entries=2)
+    lru_cache(store, "b", 2, max_entries=2)
+    assert lru_cache(store, "a") == {"value": 1, "found": True, "evicted": 0}
+    assert lru_cache(store, "c", 3, max_entries=2)["evicted"] == 1
+    assert list(store) == ["a", "c"]
+    assert lru_cache(store, "b")["found"] is False
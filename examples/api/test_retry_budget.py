@@ -0,0 +1,30 @@
+"""Tests for retry_budget brick."""
+from retry_budget import retry_budget
+
+
+def test_requests_earn_and_retries_spend():
+    """Test retries spend whole tokens until the host has less than one left."""
+    host = "spend.example"
+    assert retry_budget(host, earn=0.5, cap=2.0)["tokens"] == 2.0
+    assert retry_budget(host, spend=True, cap=2.0) == {"allowed": True, "tokens": 1.0,
+                                                       "error": None}
+    assert retry_budget(host, spend=True, cap=2.0)["tokens"] == 0.0
+    result = retry_budget(host, spend=True, cap=2.0)
+    assert result == {"allowed": False, "tokens": 0.0,
+                      "error": "Retry budget exhausted for spend.example"}
+    assert retry_budget(host, earn=0.5, cap=2.0)["tokens"] == 0.5
+
+
+def test_zero_earn_does_not_spend():
+    """Test budget_ratio=0 earns nothing and takes nothing."""
+    host = "zero.example"
+    for _ in range(3):
+        assert retry_budget(host, earn=0.0, cap=2.0) == {"allowed": True, "tokens": 2.0,
+                                                         "error": None}
+
+
+def test_budgets_are_per_host():
+    """Test one host's retries leave another's tokens alone."""
+    retry_budget("a.example", spend=True, cap=1.0)
+    assert retry_budget("a.example", cap=1.0)["allowed"] is False
+    assert retry_budget("b.example", cap=1.0)["allowed"] is True
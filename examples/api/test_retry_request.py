@@ -0,0 +1,79 @@
+"""Tests for retry_request brick against a local fault-injecting stub."""
+import io
+import time
+
+import retry_budget
+from circuit_breaker import circuit_breaker
+from http_get import http_get
+from http_post import http_post
+from retry_request import retry_request
+
+
+def test_retries_until_success(stub_server):
+    """Test 5xx and 429 responses are retried until one succeeds."""
+    stub_server.plan = [(503, {}, "down", 0), (429, {}, "slow down", 0)]
+    result = retry_request(http_get, stub_server.url("/items"), base_delay=0.01)
+    assert result == {"status": 200, "data": "ok", "error": None, "attempts": 3}
+    assert len(stub_server.requests) == 3
+
+
+def test_client_error_not_retried(stub_server):
+    """Test a non-retryable 4xx is returned after one attempt."""
+    stub_server.plan = [(404, {}, "missing", 0)]
+    result = retry_request(http_get, stub_server.url(), base_delay=0.01)
+    assert (result["status"], result["attempts"]) == (404, 1)
+
+
+def test_open_circuit_fails_fast(stub_server):
+    """Test a host whose circuit is open is not contacted."""
+    url = stub_server.url()
+    host = url.split("/")[2]
+    for _ in range(5):
+        circuit_breaker(host, success=False)
+    result = retry_request(http_get, url)
+    assert result["attempts"] == 0
+    assert result["error"] == f"Circuit open for {host}"
+    assert stub_server.requests == []
+
+
+def test_deadline_caps_attempts(stub_server):
+    """Test slow responses stop retries once the deadline is spent."""
+    stub_server.default = (200, {}, "late", 0.5)
+    start = time.monotonic()
+    result = retry_request(http_get, stub_server.url(), deadline=0.2, base_delay=0.01)
+    assert time.monotonic() - start < 0.45
+    assert result["status"] == 0
+    assert result["error"] == "Request timeout"
+
+
+def test_retry_budget_limits_retries(stub_server):
+    """Test a host with no retry tokens gets no retries."""
+    url = stub_server.url()
+    retry_budget._budgets[url.split("/")[2]] = 0.0
+    stub_server.default = (500, {}, "error", 0)
+    result = retry_request(http_get, url, base_delay=0.01, budget_ratio=0.2)
+    assert result["attempts"] == 1
+
+
+def test_post_is_retried(stub_server):
+    """Test http_post keyword arguments are forwarded on every attempt."""
+    stub_server.plan = [(502, {}, "bad gateway", 0)]
+    result = retry_request(http_post, stub_server.url("/submit"), data={"n": 1},
+                           base_delay=0.01)
+    assert (result["status"], result["attempts"]) == (200, 2)
+    assert [r[3] for r in stub_server.requests] == [b'{"n": 1}', b'{"n": 1}']
+
+
+def test_stream_body_not_resent(stub_server):
+    """Test a generator body is sent once and a seekable file is rewound for the retry."""
+    stub_server.plan = [(503, {}, "busy", 0)]
+    result = retry_request(http_post, stub_server.url("/upload"),
+                           data=(chunk for chunk in [b"a", b"b"]), base_delay=0.01)
+    assert (result["status"], result["attempts"]) == (503, 1)
+
+    stub_server.requests.clear()
+    stub_server.plan = [(503, {}, "busy", 0)]
+    result = retry_request(http_post, stub_server.url("/upload"), data=io.BytesIO(b"payload"),
+                           base_delay=0.01)
+    assert (result["status"], result["attempts"]) == (200, 2)
+    assert [r[3] for r in stub_server.requests] == [b"payload", b"payload"]
@@ -0,0 +1,63 @@
+"""Tests for single_flight brick."""
+import threading
+import time
+
+from single_flight import flight_stats, single_flight
+
+
+def run_concurrently(count, target):
+    """Start count threads on target and wait for them all."""
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(target())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test a stampede on one key runs func once and shares the result."""
+    executions = []
+
+    def slow():
+        executions.append(1)
+        time.sleep(0.2)
+        return {"rows": [1, 2]}
+
+    before = dict(flight_stats)
+    results = run_concurrently(20, lambda: single_flight("stampede", slow))
+    assert len(executions) == 1
+    assert all(r["value"] == {"rows": [1, 2]} and r["error"] is None for r in results)
+    assert sum(not r["shared"] for r in results) == 1
+    assert flight_stats["collapsed"] - before["collapsed"] == 19
+    assert flight_stats["executed"] - before["executed"] == 1
+
+
+def test_errors_are_shared_and_key_is_released():
+    """Test an exception reaches every waiter and the next call runs afresh."""
+    def boom():
+        time.sleep(0.1)
+        raise ConnectionError("backend down")
+
+    results = run_concurrently(5, lambda: single_flight("failing", boom))
+    assert {r["error"] for r in results} == {"ConnectionError: backend down"}
+    assert single_flight("failing", lambda: 42) == {"value": 42, "shared": False, "error": None}
+
+
+def test_waiter_timeout():
+    """Test a collapsed caller gives up after its own timeout."""
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(0.3)
+        return "late"
+
+    leader = threading.Thread(target=lambda: single_flight("slow", slow))
+    leader.start()
+    started.wait()
+    result = single_flight("slow", lambda: "unused", timeout=0.05)
+    leader.join()
+    assert result["shared"] is True
+    assert result["error"].startswith("Timed out after 0.05s")
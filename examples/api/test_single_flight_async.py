@@ -0,0 +1,48 @@
+"""Tests for single_flight_async brick."""
+import asyncio
+
+from single_flight_async import single_flight_async
+
+
+def test_concurrent_awaits_share_one_execution():
+    """Test gathered awaiters on one key run the factory once."""
+    executions = []
+
+    async def fetch():
+        executions.append(1)
+        await asyncio.sleep(0.05)
+        return "payload"
+
+    async def main():
+        return await asyncio.gather(*[single_flight_async("url", fetch) for _ in range(10)])
+
+    results = asyncio.run(main())
+    assert len(executions) == 1
+    assert {r["value"] for r in results} == {"payload"}
+    assert sum(r["shared"] for r in results) == 9
+
+
+def test_timeout_does_not_cancel_shared_call():
+    """Test one impatient awaiter times out while the others still get the value."""
+    async def slow():
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def main():
+        patient = asyncio.ensure_future(single_flight_async("slow", slow))
+        await asyncio.sleep(0)
+        impatient = await single_flight_async("slow", slow, timeout=0.01)
+        return impatient, await patient
+
+    impatient, patient = asyncio.run(main())
+    assert impatient["error"].startswith("Timed out")
+    assert patient == {"value": "done", "shared": False, "error": None}
+
+
+def test_errors_are_reported():
+    """Test an exception is returned in the envelope, not raised."""
+    async def broken():
+        raise ValueError("bad")
+
+    result = asyncio.run(single_flight_async("broken", broken))
+    assert result == {"value": None, "shared": False, "error": "ValueError: bad"}
@@ -0,0 +1,54 @@
+"""Tests for stream_body brick against stand-in responses."""
+import urllib3
+
+from stream_body import stream_body
+
+
+class FakeResponse:
+    """Minimal stream=True response: chunks from iter_content or raw.stream."""
+
+    def __init__(self, chunks, error=None, headers=None):
+        self.status_code = 200
+        self.headers = headers or {}
+        self.closed = False
+        self.raw = self
+        self._chunks, self._error = chunks, error
+
+    def iter_content(self, chunk_size):
+        return self.stream(chunk_size)
+
+    def stream(self, chunk_size, decode_content=True):
+        yield from self._chunks
+        if self._error:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+def test_stops_at_max_bytes_with_error():
+    """Test an oversized body ends the iterator and sets error instead of raising."""
+    result = stream_body(FakeResponse([b"a" * 4] * 5), max_bytes=10)
+    assert result["error"] is None
+    assert list(result["data"]) == [b"aaaa", b"aaaa"]
+    assert result["error"] == "Response exceeds 10 bytes"
+
+
+def test_raw_stream_errors_become_error():
+    """Test urllib3 errors from raw.stream (decompress=False) are reported, not raised."""
+    broken = urllib3.exceptions.ProtocolError("Connection broken: IncompleteRead")
+    result = stream_body(FakeResponse([b"partial"], error=broken), decompress=False)
+    assert list(result["data"]) == [b"partial"]
+    assert "IncompleteRead" in result["error"]
+
+
+def test_response_closed_after_iteration():
+    """Test progress sees the Content-Length total and the response is closed at the end."""
+    response = FakeResponse([b"ab", b"cd"], headers={"Content-Length": "4"})
+    seen = []
+    result = stream_body(response, progress=lambda received, total: seen.append((received, total)))
+    assert b"".join(result["data"]) == b"abcd"
+    assert seen == [(2, 4), (4, 4)] and response.closed
@@ -0,0 +1,64 @@
+"""Tests for throttle brick."""
+import threading
+import time
+from email.utils import formatdate
+
+from throttle import MAX_PAUSE, reserve, throttle
+
+
+def starts(host, calls, **kwargs):
+    """Run calls throttled calls on threads and return their sorted start times."""
+    times, lock = [], threading.Lock()
+
+    def worker():
+        assert throttle(host, **kwargs)["error"] is None
+        with lock:
+            times.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(times)
+
+
+def test_threads_are_released_at_rate():
+    """Test concurrent callers are spaced one interval apart, not rejected."""
+    times = starts("paced.test", 6, rate=50)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert times[-1] - times[0] >= 5 / 50 - 0.01
+    assert min(gaps) >= 1 / 50 - 0.01
+
+
+def test_burst_starts_back_to_back():
+    """Test an idle host lets burst calls through without waiting."""
+    results = [throttle("burst.test", rate=1, burst=3) for _ in range(3)]
+    assert max(r["waited"] for r in results) < 0.05
+    assert throttle("burst.test", rate=20, burst=3)["waited"] > 0
+
+
+def test_retry_after_pauses_sleeping_callers():
+    """Test a Retry-After arriving mid-wait pushes an already scheduled caller back."""
+    throttle("pause.test", rate=10)  # take the free slot; the next is 0.1s out
+    waited = []
+    worker = threading.Thread(target=lambda: waited.append(throttle("pause.test", rate=10)))
+    worker.start()
+    time.sleep(0.02)
+    throttle("pause.test", rate=10, retry_after="0.3")
+    worker.join()
+    assert waited[0]["waited"] >= 0.3
+
+
+def test_retry_after_http_date_and_invalid_input():
+    """Test HTTP-date Retry-After values parse and bad input is reported."""
+    assert throttle("date.test", retry_after=formatdate(time.time() - 5, usegmt=True))["error"] is None
+    assert "Invalid throttle input" in throttle("bad.test", retry_after="soon")["error"]
+    assert "Invalid throttle input" in throttle("zero.test", rate=0)["error"]
+
+
+def test_retry_after_is_clamped():
+    """Test an infinite or huge Retry-After pauses the host for at most MAX_PAUSE."""
+    for value in ("inf", "1e12", "nan"):
+        throttle(f"{value}.test", retry_after=value)
+        assert reserve(f"{value}.test", 10) <= time.monotonic() + MAX_PAUSE
@@ -0,0 +1,26 @@
+"""Tests for throttle_async brick."""
+import asyncio
+import time
+
+from throttle import throttle
+from throttle_async import throttle_async
+
+
+def test_tasks_are_released_at_rate():
+    """Test gathered tasks are spaced one interval apart without blocking the loop."""
+    async def call():
+        await throttle_async("async.test", rate=50)
+        return time.monotonic()
+
+    async def main():
+        return sorted(await asyncio.gather(*[call() for _ in range(6)]))
+
+    times = asyncio.run(main())
+    assert times[-1] - times[0] >= 5 / 50 - 0.01
+
+
+def test_shares_slots_with_threaded_throttle():
+    """Test a Retry-After reported by threaded code also pauses async callers."""
+    throttle("shared.test", rate=100, retry_after=0.2)
+    result = asyncio.run(throttle_async("shared.test", rate=100))
+    assert result["error"] is None and result["waited"] >= 0.15
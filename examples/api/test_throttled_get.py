@@ -0,0 +1,19 @@
+"""Tests for throttled_get brick against a local http.server stub."""
+from throttled_get import throttled_get
+
+
+def test_429_retry_after_delays_next_call(stub_server):
+    """Test the host pauses for Retry-After before the next request goes out."""
+    stub_server.plan = [(429, {"retry-after": "0.3"}, "slow down", 0)]
+    first = throttled_get(stub_server.url("/a"), rate=100)
+    second = throttled_get(stub_server.url("/b"), rate=100)
+    assert (first["status"], second["status"]) == (429, 200)
+    assert "headers" not in first
+    assert second["waited"] >= 0.25
+
+
+def test_paces_requests(stub_server):
+    """Test requests to one host are released at the configured rate."""
+    results = [throttled_get(stub_server.url(), rate=20) for _ in range(3)]
+    assert [r["data"] for r in results] == ["ok"] * 3
+    assert sum(r["waited"] for r in results) >= 2 / 20 - 0.03
@@ -0,0 +1,59 @@
+"""Outbound leaky-bucket throttle: schedule calls to an upstream host at a fixed rate."""
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+MAX_PAUSE = 300.0  # longest Retry-After honoured, so one bad header cannot stall a host forever
+_hosts, _lock = {}, threading.Lock()  # host -> [theoretical arrival, paused until] (monotonic)
+
+
+def throttle(host, rate=10.0, burst=1, retry_after=None):
+    """
+    Block until host's next call slot; calls are released evenly at rate per second.
+
+    Args:
+        host: Upstream host the slot is reserved on (e.g. urlsplit(url).netloc)
+        rate: Calls per second allowed to the host
+        burst: Calls that may start back to back after an idle spell
+        retry_after: Report a 429 Retry-After instead (pauses all callers up to MAX_PAUSE, no wait)
+
+    Returns:
+        dict: {waited: float, error: str|None}
+    """
+    start, slot = time.monotonic(), None
+    try:
+        if retry_after is not None:
+            return pause(host, retry_after)
+        while True:  # re-reserve if a Retry-After lands while we sleep
+            new = reserve(host, rate, burst, slot)
+            if new == slot:
+                return {"waited": time.monotonic() - start, "error": None}
+            slot = new
+            time.sleep(max(0.0, slot - time.monotonic()))
+    except (TypeError, ValueError, ZeroDivisionError) as e:
+        return {"waited": time.monotonic() - start, "error": f"Invalid throttle input: {e}"}
+
+
+def pause(host, retry_after):
+    """Hold every call to host until Retry-After (seconds or HTTP-date) has passed; returns {waited, error}."""
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        seconds = parsedate_to_datetime(retry_after).timestamp() - time.time()
+    until = time.monotonic() + min(MAX_PAUSE, max(0.0, seconds))  # also maps NaN to 0
+    with _lock:
+        state = _hosts.setdefault(host, [until, until])
+        state[:] = max(state[0], until), max(state[1], until)
+    return {"waited": 0.0, "error": None}
+
+
+def reserve(host, rate, burst=1, slot=None):
+    """Return the monotonic start time of host's next slot, keeping slot unless a pause covers it."""
+    with _lock:
+        now = time.monotonic()
+        state = _hosts.setdefault(host, [now, 0.0])
+        if slot is not None and slot >= state[1]:
+            return slot
+        slot = max(now, state[0] - (burst - 1) / rate, state[1])
+        state[0] = max(state[0], slot) + 1.0 / rate
+        return slot
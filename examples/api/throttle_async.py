@@ -0,0 +1,32 @@
+"""Outbound leaky-bucket throttle for asyncio, sharing slots with the threaded throttle."""
+import asyncio
+import time
+
+from throttle import pause, reserve
+
+
+async def throttle_async(host, rate=10.0, burst=1, retry_after=None):
+    """
+    Await host's next call slot without blocking the event loop.
+
+    Args:
+        host: Upstream host the slot is reserved on (e.g. urlsplit(url).netloc)
+        rate: Calls per second allowed to the host
+        burst: Calls that may start back to back after an idle spell
+        retry_after: Report a 429 Retry-After instead (pauses all callers, no wait)
+
+    Returns:
+        dict: {waited: float, error: str|None}
+    """
+    start, slot = time.monotonic(), None
+    try:
+        if retry_after is not None:
+            return pause(host, retry_after)
+        while True:  # re-reserve if a Retry-After lands while we sleep
+            new = reserve(host, rate, burst, slot)
+            if new == slot:
+                return {"waited": time.monotonic() - start, "error": None}
+            slot = new
+            await asyncio.sleep(max(0.0, slot - time.monotonic()))
+    except (TypeError, ValueError, ZeroDivisionError) as e:
+        return {"waited": time.monotonic() - start, "error": f"Invalid throttle input: {e}"}
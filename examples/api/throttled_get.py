@@ -0,0 +1,35 @@
+"""HTTP GET paced by the per-host throttle, backing off on 429 Retry-After."""
+from urllib.parse import urlsplit
+
+from http_get import http_get
+from throttle import throttle
+
+
+def throttled_get(url, headers=None, timeout=10, rate=10.0, burst=1):
+    """
+    GET url once its host's throttle slot comes up.
+
+    A 429 response's Retry-After pauses the host for every caller (for at
+    most throttle.MAX_PAUSE seconds), so the next attempt (e.g. from
+    retry_request) is scheduled after it.
+
+    Args:
+        url: URL to fetch; its host keys the throttle
+        headers: Optional request headers
+        timeout: Request timeout in seconds
+        rate: Calls per second allowed to the host
+        burst: Calls that may start back to back after an idle spell
+
+    Returns:
+        dict: {status: int, data: str|None, error: str|None, waited: float}
+    """
+    host = urlsplit(url).netloc
+    gate = throttle(host, rate, burst)
+    if gate["error"]:
+        return {"status": 0, "data": None, "error": gate["error"], "waited": gate["waited"]}
+    result = http_get(url, headers=headers, timeout=timeout, include_headers=True)
+    received = result.pop("headers", None) or {}
+    retry_after = next((v for k, v in received.items() if k.lower() == "retry-after"), None)
+    if result["status"] == 429:
+        throttle(host, rate, burst, retry_after=retry_after or 1.0 / rate)
+    return {**result, "waited": gate["waited"]}
@@ -0,0 +1,46 @@
+"""Safe bulk DELETE in one savepoint, batched under SQLite's parameter limit.
+
+Args:
+    conn: DB connection, table: str, keys: list - key values or row dicts holding key,
+    key: str - lookup column, chunk_size: int|None - keys per statement
+    (default: the variable limit), executemany: bool - one `key = ?` per key instead of IN
+
+Returns:
+    dict: {'rows_affected': int, 'batches': list[int], 'error': str|None}
+"""
+from query_insert import check_identifiers
+from query_select_many import variable_limit
+from table_version import table_version
+
+
+def query_delete(conn, table, keys, key='id', chunk_size=None, executemany=False):
+    """Delete many rows by key, applying all batches together or none."""
+    try:
+        invalid = check_identifiers(table, [key])
+        if invalid:
+            return {'rows_affected': 0, 'batches': [], 'error': invalid}
+
+        values = [k[key] if isinstance(k, dict) else k for k in keys]
+        size = chunk_size or variable_limit(conn)
+        batches = []
+        conn.execute('SAVEPOINT query_delete')
+        try:
+            for start in range(0, len(values), size):
+                chunk = values[start:start + size]
+                if executemany:
+                    cursor = conn.executemany(f"DELETE FROM {table} WHERE {key} = ?",
+                                              [(value,) for value in chunk])
+                else:
+                    cursor = conn.execute(f"DELETE FROM {table} WHERE {key} IN "
+                                          f"({', '.join('?' * len(chunk))})", chunk)
+                batches.append(cursor.rowcount)
+        except Exception:
+            conn.execute('ROLLBACK TO query_delete')
+            raise
+        finally:
+            conn.execute('RELEASE query_delete')
+        table_version(table, bump=True)
+        return {'rows_affected': sum(batches), 'batches': batches, 'error': None}
+
+    except Exception as e:
+        return {'rows_affected': 0, 'batches': [], 'error': str(e)}
@@ -10,21 +10,20 @@ Returns:
 """
 import re
 
+from table_version import table_version
+
+IDENTIFIER = re.compile(r'^[a-zA-Z0-9_]+$')
+
 
 def query_insert(conn, table, data):
     """Execute safe parameterized INSERT query."""
     try:
-        # Validate table name (alphanumeric + underscore only)
-        if not re.match(r'^[a-zA-Z0-9_]+$', table):
-            return {'row_id': None, 'rows_affected': 0, 'error': 'Invalid table name'}
-
         if not data or not isinstance(data, dict):
-            return {'row_id': None, 'rows_affected': 0, 'error': 'Data must be non-empty dict'}
-
-        # Validate column names
-        for col in data.keys():
-            if not re.match(r'^[a-zA-Z0-9_]+$', col):
-                return {'row_id': None, 'rows_affected': 0, 'error': f'Invalid column: {col}'}
+            invalid = check_identifiers(table, []) or 'Data must be non-empty dict'
+        else:
+            invalid = check_identifiers(table, data.keys())
+        if invalid:
+            return {'row_id': None, 'rows_affected': 0, 'error': invalid}
 
         # Build parameterized INSERT query
         columns = list(data.keys())
@@ -35,6 +34,7 @@ def query_insert(conn, table, data):
         cursor = conn.cursor()
         cursor.execute(query, params)
         conn.commit()
+        table_version(table, bump=True)
 
         return {
             'row_id': cursor.lastrowid,
@@ -46,32 +46,11 @@ def query_insert(conn, table, data):
         return {'row_id': None, 'rows_affected': 0, 'error': str(e)}
 
 
-# Tests
-def test_query_insert():
-    """Test INSERT query with parameterization."""
-    import sqlite3
-    import tempfile
-    import os
-
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as f:
-        db = f.name
-
-    conn = sqlite3.connect(db)
-    conn.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)')
-
-    # Test valid insert
-    result = query_insert(conn, 'users', {'name': 'Alice', 'email': 'alice@example.com'})
-    assert result['error'] is None
-    assert result['row_id'] is not None
-    assert result['rows_affected'] == 1
-
-    # Test invalid table name (SQL injection prevention)
-    result = query_insert(conn, 'users; DROP TABLE users--', {'name': 'Bob'})
-    assert result['error'] == 'Invalid table name'
-
-    # Test invalid column name
-    result = query_insert(conn, 'users', {'name; DROP--': 'Bob'})
-    assert 'Invalid column' in result['error']
-
-    conn.close()
-    os.unlink(db)
+def check_identifiers(table, columns):
+    """Return the error for an unsafe table or column name (alphanumeric + underscore only), else None."""
+    if not IDENTIFIER.match(table):
+        return 'Invalid table name'
+    for col in columns:
+        if not IDENTIFIER.match(col):
+            return f'Invalid column: {col}'
+    return None
@@ -0,0 +1,49 @@
+"""Read-through cache for query_select with TTL, LRU eviction and table versions.
+
+Entries are keyed on the normalised query shape (table, columns, sorted
+where keys, limit) plus the where values, and are dropped once their TTL
+passes or a write brick bumps the table's version.
+
+Args:
+    conn: DB connection, cache: OrderedDict owned by the caller (one per database),
+    table: str, columns: list[str], where: dict, limit: int,
+    ttl: float - Seconds an entry may be served, max_entries: int - LRU bound
+
+Returns:
+    dict: {'rows': list[dict], 'count': int, 'error': str|None, 'cached': bool}
+"""
+import threading
+import time
+
+from query_select import query_select
+from table_version import table_version
+
+cache_stats = {'hit': 0, 'miss': 0}
+_lock = threading.Lock()
+
+
+def query_select_cached(conn, cache, table, columns, where=None, limit=None,
+                        ttl=60.0, max_entries=256):
+    """Serve repeated SELECTs from cache until TTL expiry or a write to the table."""
+    try:
+        key = (table.lower(), tuple(columns), tuple(sorted((where or {}).items())), limit)
+        hash(key)
+    except (AttributeError, TypeError):  # bad table name or unhashable where values: no cache
+        return dict(query_select(conn, table, columns, where, limit), cached=False)
+    version = table_version(table)['version']  # read before querying: a racing write invalidates
+    with _lock:
+        entry = cache.get(key)
+        if entry and entry[0] == version and entry[1] > time.monotonic():
+            cache.move_to_end(key)
+            cache_stats['hit'] += 1
+            return {'rows': [dict(r) for r in entry[2]], 'count': len(entry[2]),
+                    'error': None, 'cached': True}
+        cache_stats['miss'] += 1
+    result = query_select(conn, table, columns, where, limit)
+    if result['error'] is None:
+        with _lock:
+            cache[key] = (version, time.monotonic() + ttl, [dict(r) for r in result['rows']])
+            cache.move_to_end(key)
+            while len(cache) > max_entries:
+                cache.popitem(last=False)
+    return dict(result, cached=False)
@@ -0,0 +1,57 @@
+"""Batched point lookups: one SELECT joined to a VALUES list of keys per chunk of keys.
+
+Args:
+    conn: DB connection, table: str, columns: list[str], key: str - unique lookup column,
+    values: list - key values (duplicates allowed),
+    chunk_size: int|None - bound variables per query (default: the connection's limit)
+
+Returns:
+    dict: {'rows': list[dict|None] aligned with values, 'count': int, 'error': str|None}
+"""
+import sqlite3
+
+from query_insert import check_identifiers
+
+# SQLite's compile-time default before 3.32, used when the connection cannot report its limit
+DEFAULT_VARIABLE_LIMIT = 999
+
+
+def query_select_many(conn, table, columns, key, values, chunk_size=None):
+    """
+    Fetch many rows by key with as few queries as the variable limit allows.
+
+    Rows are matched back by the caller's own key values (selected from the
+    VALUES list), so a key converted by column affinity, e.g. 1 for a TEXT
+    '1', still finds its row.
+    """
+    try:
+        invalid = check_identifiers(table, [key, *columns])
+        if invalid:
+            return {'rows': None, 'count': 0, 'error': invalid}
+
+        selected = ', '.join(f'{table}.{col}' for col in columns)
+        unique = list(dict.fromkeys(values))
+        size = chunk_size or variable_limit(conn)
+        found = {}
+        cursor = conn.cursor()
+        for start in range(0, len(unique), size):
+            chunk = unique[start:start + size]
+            cursor.execute(f"WITH wanted(k) AS (VALUES {', '.join(['(?)'] * len(chunk))}) "
+                           f"SELECT wanted.k, {selected} FROM wanted "
+                           f"JOIN {table} ON {table}.{key} = wanted.k", chunk)
+            for wanted, *fields in cursor:
+                found[wanted] = dict(zip(columns, fields))
+
+        rows = [found.get(value) for value in values]
+        return {'rows': rows, 'count': sum(row is not None for row in rows), 'error': None}
+
+    except Exception as e:
+        return {'rows': None, 'count': 0, 'error': str(e)}
+
+
+def variable_limit(conn):
+    """Return the most bound variables one statement on conn may use."""
+    try:
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:  # Python < 3.11
+        return DEFAULT_VARIABLE_LIMIT
@@ -0,0 +1,56 @@
+"""Safe bulk UPDATE in one savepoint, batched under SQLite's parameter limit.
+
+Args:
+    conn: DB connection, table: str,
+    data: dict - values to set on every key in keys, or
+          list[dict] - rows holding key plus the same columns to set (executemany)
+    key: str - lookup column, keys: list - key values (with a dict data),
+    chunk_size: int|None - keys or rows per statement (default: fit the variable limit)
+
+Returns:
+    dict: {'rows_affected': int, 'batches': list[int], 'error': str|None}
+"""
+from query_insert import check_identifiers
+from query_select_many import variable_limit
+from table_version import table_version
+
+
+def query_update(conn, table, data, key='id', keys=None, chunk_size=None):
+    """Update many rows by key, applying all batches together or none."""
+    try:
+        rows = [data] if isinstance(data, dict) else list(data)
+        columns = list(dict.fromkeys(c for row in rows for c in row if c != key))
+        invalid = check_identifiers(table, [key, *columns])
+        if keys is None and any(row.keys() != rows[0].keys() for row in rows):
+            invalid = invalid or 'Rows must all set the same columns'
+        if invalid or not columns:
+            return {'rows_affected': 0, 'batches': [], 'error': invalid or 'Nothing to update'}
+
+        assignments, batches = ', '.join(f'{col} = ?' for col in columns), []
+        conn.execute('SAVEPOINT query_update')
+        try:
+            if keys is not None:
+                values = [data[col] for col in columns]
+                size = chunk_size or variable_limit(conn) - len(values)
+                for start in range(0, len(keys), size):
+                    chunk = list(keys[start:start + size])
+                    cursor = conn.execute(f"UPDATE {table} SET {assignments} WHERE {key} IN "
+                                          f"({', '.join('?' * len(chunk))})", values + chunk)
+                    batches.append(cursor.rowcount)
+            else:
+                query = f"UPDATE {table} SET {assignments} WHERE {key} = ?"
+                size = chunk_size or 500
+                for start in range(0, len(rows), size):
+                    params = [[row[col] for col in columns] + [row[key]]
+                              for row in rows[start:start + size]]
+                    batches.append(conn.executemany(query, params).rowcount)
+        except Exception:
+            conn.execute('ROLLBACK TO query_update')
+            raise
+        finally:
+            conn.execute('RELEASE query_update')
+        table_version(table, bump=True)
+        return {'rows_affected': sum(batches), 'batches': batches, 'error': None}
+
+    except Exception as e:
+        return {'rows_affected': 0, 'batches': [], 'error': str(e)}
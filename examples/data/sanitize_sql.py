@@ -5,65 +5,48 @@ Args:
     value: any - Value to escape for SQL string literals
 
 Returns:
-    dict: {'sanitized': str|None, 'safe': bool, 'error': str|None}
+    dict: {'sanitized': str|None, 'safe': bool, 'error': str|None,
+           'pattern': str|None, 'offset': int|None}
 """
 import re
 
+IDENTIFIER_RE = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*')
+RESERVED_KEYWORDS = frozenset(['SELECT', 'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE',
+                               'ALTER', 'EXEC', 'EXECUTE', 'UNION', 'WHERE'])
+DANGEROUS_PATTERNS = ('--', '/*', '*/', ';', 'UNION', 'DROP', 'EXEC')
+# One case-insensitive alternation scans each value once, no uppercased copy
+DANGEROUS_RE = re.compile('|'.join(map(re.escape, DANGEROUS_PATTERNS)), re.IGNORECASE)
+
+
 def sanitize_sql(identifier=None, value=None):
     """Sanitize SQL identifiers and values to prevent injection."""
     try:
-        result = {'sanitized': None, 'safe': False, 'error': None}
-        # Sanitize identifier (table/column name)
+        result = {'sanitized': None, 'safe': False, 'error': None, 'pattern': None, 'offset': None}
         if identifier is not None:
-            if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', identifier):
-                return {'sanitized': None, 'safe': False, 'error': 'Invalid identifier'}
-            keywords = ['SELECT', 'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE',
-                       'ALTER', 'EXEC', 'EXECUTE', 'UNION', 'WHERE']
-            if identifier.upper() in keywords:
-                return {'sanitized': None, 'safe': False, 'error': 'Reserved keyword'}
-            result['sanitized'] = identifier
-            result['safe'] = True
-        # Sanitize value (escape single quotes)
+            if not IDENTIFIER_RE.fullmatch(identifier):
+                return dict(result, error='Invalid identifier')
+            if identifier.upper() in RESERVED_KEYWORDS:
+                return dict(result, error='Reserved keyword')
+            result.update(sanitized=identifier, safe=True)
         if value is not None:
-            if isinstance(value, str):
-                sanitized_value = value.replace("'", "''")
-                dangerous = ['--', '/*', '*/', ';', 'UNION', 'DROP', 'EXEC']
-                if any(d in value.upper() for d in dangerous):
-                    result['safe'] = False
-                    result['error'] = 'Suspicious pattern detected'
-                else:
-                    result['sanitized'] = sanitized_value
-                    result['safe'] = True
+            if not isinstance(value, str):
+                result.update(sanitized=str(value), safe=True)
+            elif (match := DANGEROUS_RE.search(value)) is not None:
+                result.update(safe=False, error='Suspicious pattern detected',
+                              pattern=match.group().upper(), offset=match.start())
             else:
-                result['sanitized'] = str(value)
-                result['safe'] = True
+                result.update(sanitized=value.replace("'", "''"), safe=True)
         return result
     except Exception as e:
-        return {'sanitized': None, 'safe': False, 'error': str(e)}
-
-
-# Tests
-def test_sanitize_sql():
-    """Test SQL sanitization."""
-    # Test valid identifier
-    result = sanitize_sql(identifier='users')
-    assert result['safe'] is True
-    assert result['sanitized'] == 'users'
+        return {'sanitized': None, 'safe': False, 'error': str(e), 'pattern': None, 'offset': None}
 
-    # Test SQL injection attempt in identifier
-    result = sanitize_sql(identifier='users; DROP TABLE users--')
-    assert result['safe'] is False
-    assert 'Invalid' in result['error']
 
-    # Test SQL keyword as identifier
-    result = sanitize_sql(identifier='SELECT')
-    assert result['safe'] is False
-
-    # Test value sanitization
-    result = sanitize_sql(value="O'Reilly")
-    assert result['safe'] is True
-    assert result['sanitized'] == "O''Reilly"
-
-    # Test suspicious pattern in value
-    result = sanitize_sql(value="test'; DROP TABLE users--")
-    assert result['safe'] is False
+def sanitize_sql_batch(identifiers=(), values=()):
+    """Sanitize many identifiers and values; safe only if every item is."""
+    try:
+        checked_ids = [sanitize_sql(identifier=i) for i in identifiers]
+        checked_values = [sanitize_sql(value=v) for v in values]
+        safe = all(r['safe'] for r in checked_ids) and all(r['safe'] for r in checked_values)
+        return {'identifiers': checked_ids, 'values': checked_values, 'safe': safe, 'error': None}
+    except Exception as e:
+        return {'identifiers': [], 'values': [], 'safe': False, 'error': str(e)}
@@ -0,0 +1,50 @@
+"""Create an FTS5 index mirroring a content table, kept in sync by triggers.
+
+The index is an external-content FTS5 table named <table>_fts: it stores
+only the tokens, reads column values from the content table, and its
+insert/update/delete triggers cover query_insert, query_update,
+query_delete and raw SQL alike. It is built in its own transaction, so a
+connection with uncommitted work is refused rather than committed.
+
+Args:
+    conn: DB connection, table: str - content table,
+    columns: list[str] - text columns to index, key: str - INTEGER PRIMARY KEY column
+
+Returns:
+    dict: {'created': bool, 'error': str|None}
+"""
+from query_insert import check_identifiers
+
+
+def search_index(conn, table, columns, key='id'):
+    """Create <table>_fts and its sync triggers (once), indexing existing rows."""
+    try:
+        invalid = check_identifiers(table, [key, *columns]) or (not columns and 'No columns to index')
+        if invalid:
+            return {'created': False, 'error': invalid}
+        if conn.in_transaction:  # executescript would COMMIT the caller's work
+            return {'created': False, 'error': 'Open transaction: commit or roll back first'}
+        fts = f'{table}_fts'
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (fts,)).fetchone():
+            return {'created': False, 'error': None}
+
+        cols = ', '.join(columns)
+        new = ', '.join(f'new.{c}' for c in columns)
+        old = ', '.join(f'old.{c}' for c in columns)
+        delete = f"INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.{key}, {old});"
+        insert = f"INSERT INTO {fts} (rowid, {cols}) VALUES (new.{key}, {new});"
+        conn.executescript(f"""
+            BEGIN;
+            CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='{key}');
+            CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END;
+            CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END;
+            CREATE TRIGGER {fts}_au AFTER UPDATE OF {key}, {cols} ON {table} BEGIN {delete} {insert} END;
+            INSERT INTO {fts} ({fts}) VALUES ('rebuild');
+            COMMIT;
+        """)
+        return {'created': True, 'error': None}
+
+    except Exception as e:
+        if conn.in_transaction:
+            conn.rollback()  # leave no index without its triggers
+        return {'created': False, 'error': str(e)}
@@ -0,0 +1,46 @@
+"""Ranked full-text search over a search_index FTS5 mirror instead of LIKE scans.
+
+Plain queries match rows containing every word (each word is quoted, so
+user input cannot inject FTS syntax); raw=True passes an FTS5 expression
+through (prefix*, OR, NOT, NEAR, "phrases", column:term).
+
+Args:
+    conn: DB connection, table: str - content table indexed by search_index,
+    query: str, columns: list[str] - content columns to return,
+    limit: int, offset: int - pagination, key: str - INTEGER PRIMARY KEY column,
+    raw: bool - query is an FTS5 expression, ranked: bool - order by bm25 (scores every
+    match; False pages in rowid order, which stays fast for very common terms)
+
+Returns:
+    dict: {'rows': list[dict] best first, each with 'rank' (bm25, lower is
+           better) and 'snippet' (matches in [brackets]), 'count': int, 'error': str|None}
+"""
+from query_insert import check_identifiers
+
+
+def search_text(conn, table, query, columns, limit=20, offset=0, key='id', raw=False,
+                ranked=True):
+    """Return one page of rows matching query, best bm25 rank first."""
+    try:
+        invalid = check_identifiers(table, [key, *columns])
+        if invalid:
+            return {'rows': None, 'count': 0, 'error': invalid}
+        if not raw:
+            query = ' '.join('"' + word.replace('"', '""') + '"' for word in query.split())
+        if not query:
+            return {'rows': [], 'count': 0, 'error': None}
+
+        fts = f'{table}_fts'
+        selected = ', '.join(f'c.{col}' for col in columns)
+        cursor = conn.execute(
+            f"SELECT {selected}, bm25({fts}) AS rank, "
+            f"snippet({fts}, -1, '[', ']', '…', 12) FROM {fts} "
+            f"JOIN {table} c ON c.{key} = {fts}.rowid "
+            f"WHERE {fts} MATCH ? ORDER BY {'rank' if ranked else f'{fts}.rowid'} LIMIT ? OFFSET ?",
+            (query, int(limit), int(offset)))
+        names = [*columns, 'rank', 'snippet']
+        rows = [dict(zip(names, row)) for row in cursor]
+        return {'rows': rows, 'count': len(rows), 'error': None}
+
+    except Exception as e:
+        return {'rows': None, 'count': 0, 'error': str(e)}
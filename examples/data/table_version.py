@@ -0,0 +1,29 @@
+"""Per-table write versions for invalidating cached reads.
+
+Write bricks bump a table's version after committing; cached readers
+compare versions so they never serve rows older than a brick-made write.
+Versions are process-local, so writes from other processes or raw SQL
+are only caught by the reader's TTL.
+
+Args:
+    table: str - Table name (case-insensitive, like SQLite identifiers)
+    bump: bool - Record a write to the table first
+
+Returns:
+    dict: {'version': int|None, 'error': str|None}
+"""
+import threading
+
+_versions = {}
+_lock = threading.Lock()
+
+
+def table_version(table, bump=False):
+    """Return the table's write version, incrementing it first when bump is set."""
+    if not isinstance(table, str):
+        return {'version': None, 'error': 'Table name must be a string'}
+    table = table.lower()
+    if bump:
+        with _lock:
+            _versions[table] = _versions.get(table, 0) + 1
+    return {'version': _versions.get(table, 0), 'error': None}
@@ -0,0 +1,50 @@
+"""Tests for query_delete brick."""
+import sqlite3
+
+from query_delete import query_delete
+
+
+def make_db(rows=10):
+    """Return an in-memory users table with rows users."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE del_users (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.executemany('INSERT INTO del_users VALUES (?, ?)', [(i, f'u{i}') for i in range(rows)])
+    conn.commit()
+    return conn
+
+
+def test_query_delete():
+    """Test keys and row dicts are deleted in chunks with per-batch counts."""
+    conn = make_db()
+    assert query_delete(conn, 'del_users', [0, 1, 2, 42], chunk_size=3) == {
+        'rows_affected': 3, 'batches': [3, 0], 'error': None}
+    result = query_delete(conn, 'del_users', [{'id': 3}, {'id': 4}], executemany=True)
+    assert result == {'rows_affected': 2, 'batches': [2], 'error': None}
+    assert conn.execute('SELECT COUNT(*) FROM del_users').fetchone()[0] == 5
+
+
+def test_failure_rolls_back_every_batch():
+    """Test a failing batch leaves earlier batches uncommitted."""
+    conn = make_db()
+    conn.execute('CREATE TRIGGER keep_nine BEFORE DELETE ON del_users WHEN OLD.id = 9 '
+                 'BEGIN SELECT RAISE(ABORT, "keep nine"); END')
+    result = query_delete(conn, 'del_users', [5, 6, 9], chunk_size=2)
+    assert result == {'rows_affected': 0, 'batches': [], 'error': 'keep nine'}
+    assert conn.execute('SELECT COUNT(*) FROM del_users').fetchone()[0] == 10
+
+
+def test_rejects_unsafe_identifiers():
+    """Test table and key names are validated like query_insert."""
+    conn = make_db()
+    assert query_delete(conn, 'del_users; DROP', [1])['error'] == 'Invalid table name'
+    assert 'Invalid column' in query_delete(conn, 'del_users', [1], key='id OR 1=1')['error']
+
+
+def test_caller_transaction_is_not_committed():
+    """Test a successful delete leaves the caller's pending insert uncommitted."""
+    conn = make_db()
+    conn.execute("INSERT INTO del_users VALUES (50, 'pending')")
+    assert query_delete(conn, 'del_users', [1, 2])['rows_affected'] == 2
+    assert conn.in_transaction
+    conn.rollback()
+    assert conn.execute('SELECT COUNT(*) FROM del_users').fetchone()[0] == 10
@@ -0,0 +1,62 @@
+"""Tests for query_select_cached brick."""
+import sqlite3
+import time
+from collections import OrderedDict
+
+import query_select_cached as module
+from query_insert import query_insert
+from query_select_cached import query_select_cached
+
+
+def make_db():
+    """Return an in-memory DB with two users."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE cached_users (id INTEGER PRIMARY KEY, name TEXT)')
+    conn.executemany('INSERT INTO cached_users VALUES (?, ?)', [(1, 'Alice'), (2, 'Bob')])
+    conn.commit()
+    return conn
+
+
+def test_repeat_queries_hit_until_insert():
+    """Test identical queries are served from cache and query_insert invalidates them."""
+    conn, cache = make_db(), OrderedDict()
+    first = query_select_cached(conn, cache, 'cached_users', ['id', 'name'])
+    second = query_select_cached(conn, cache, 'cached_users', ['id', 'name'])
+    assert (first['cached'], second['cached']) == (False, True)
+    assert second['rows'] == first['rows'] and second['count'] == 2
+
+    # Hits hand out copies, so callers cannot corrupt the cached rows
+    second['rows'][0]['name'] = 'Mallory'
+    assert query_select_cached(conn, cache, 'cached_users', ['id', 'name'])['rows'][0]['name'] == 'Alice'
+
+    query_insert(conn, 'cached_users', {'name': 'Carol'})
+    fresh = query_select_cached(conn, cache, 'cached_users', ['id', 'name'])
+    assert fresh['cached'] is False and fresh['count'] == 3
+
+
+def test_key_normalises_where_order_and_includes_values():
+    """Test where key order does not matter but values do."""
+    conn, cache = make_db(), OrderedDict()
+    query_select_cached(conn, cache, 'cached_users', ['name'], {'id': 1, 'name': 'Alice'})
+    assert query_select_cached(conn, cache, 'cached_users', ['name'],
+                               {'name': 'Alice', 'id': 1})['cached'] is True
+    other = query_select_cached(conn, cache, 'cached_users', ['name'], {'id': 2})
+    assert other['cached'] is False and other['rows'] == [{'name': 'Bob'}]
+
+
+def test_ttl_lru_and_errors():
+    """Test expired entries are refetched, the LRU bound holds and errors are not cached."""
+    conn, cache = make_db(), OrderedDict()
+    query_select_cached(conn, cache, 'cached_users', ['name'], {'id': 1}, ttl=0.01)
+    time.sleep(0.02)
+    assert query_select_cached(conn, cache, 'cached_users', ['name'], {'id': 1})['cached'] is False
+
+    for user_id in range(5):
+        query_select_cached(conn, cache, 'cached_users', ['name'], {'id': user_id}, max_entries=2)
+    assert len(cache) == 2
+
+    misses = module.cache_stats['miss']
+    assert query_select_cached(conn, cache, 'missing', ['name'])['error'] is not None
+    assert query_select_cached(conn, cache, 'missing', ['name'])['cached'] is False
+    assert module.cache_stats['miss'] == misses + 2
+    assert query_select_cached(conn, cache, None, ['name'])['error'] is not None
@@ -0,0 +1,50 @@
+"""Tests for query_select_many brick."""
+import sqlite3
+
+from query_select_many import query_select_many, variable_limit
+
+
+def make_db(rows):
+    """Return an in-memory users table with rows users."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)')
+    conn.executemany('INSERT INTO users VALUES (?, ?, ?)',
+                     [(i, f'u{i}', f'u{i}@test.com') for i in range(rows)])
+    return conn
+
+
+def test_query_select_many():
+    """Test rows come back aligned with the requested keys, including misses and repeats."""
+    conn = make_db(5)
+    result = query_select_many(conn, 'users', ['name'], 'id', [3, 99, 1, 3])
+    assert result == {'rows': [{'name': 'u3'}, None, {'name': 'u1'}, {'name': 'u3'}],
+                      'count': 3, 'error': None}
+    assert query_select_many(conn, 'users', ['id', 'email'], 'id', [])['rows'] == []
+
+
+def test_chunks_under_variable_limit():
+    """Test more keys than one statement may bind are split into several queries."""
+    conn = make_db(2500)
+    statements = []
+    conn.set_trace_callback(statements.append)
+    result = query_select_many(conn, 'users', ['name'], 'id', list(range(2500)), chunk_size=999)
+    assert result['count'] == 2500 and len(statements) == 3
+    assert result['rows'][2499] == {'name': 'u2499'}
+    assert variable_limit(conn) >= 999
+
+
+def test_rejects_unsafe_identifiers():
+    """Test table, key and column names are validated like query_select."""
+    conn = make_db(1)
+    assert query_select_many(conn, 'users; DROP', ['name'], 'id', [1])['error'] == 'Invalid table name'
+    assert 'Invalid column' in query_select_many(conn, 'users', ['name'], 'id OR 1', [1])['error']
+    assert 'Invalid column' in query_select_many(conn, 'users', ["name'"], 'id', [1])['error']
+
+
+def test_rows_mapped_back_by_caller_keys():
+    """Test a key converted by column affinity still finds its row under the caller's value."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE codes (code TEXT PRIMARY KEY, label TEXT)')
+    conn.executemany('INSERT INTO codes VALUES (?, ?)', [('1', 'one'), ('x', 'ex')])
+    result = query_select_many(conn, 'codes', ['label'], 'code', [1, 'x', 2])
+    assert result['rows'] == [{'label': 'one'}, {'label': 'ex'}, None]
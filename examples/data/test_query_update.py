@@ -0,0 +1,77 @@
+"""Tests for query_update brick."""
+import sqlite3
+
+from query_update import query_update
+from table_version import table_version
+
+
+def make_db(rows=10):
+    """Return an in-memory users table with rows users."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE upd_users (id INTEGER PRIMARY KEY, name TEXT, active INTEGER)')
+    conn.executemany('INSERT INTO upd_users VALUES (?, ?, 1)', [(i, f'u{i}') for i in range(rows)])
+    conn.commit()
+    return conn
+
+
+def test_same_values_for_many_keys():
+    """Test a dict is applied to every key with chunked IN statements."""
+    conn = make_db()
+    version = table_version('upd_users')['version']
+    result = query_update(conn, 'upd_users', {'active': 0}, keys=[1, 2, 3, 4, 5, 99], chunk_size=4)
+    assert result == {'rows_affected': 5, 'batches': [4, 1], 'error': None}
+    assert conn.execute('SELECT COUNT(*) FROM upd_users WHERE active = 0').fetchone()[0] == 5
+    assert table_version('upd_users')['version'] == version + 1
+
+
+def test_per_row_values_with_executemany():
+    """Test row dicts update their own values in batches."""
+    conn = make_db()
+    rows = [{'id': i, 'name': f'renamed{i}'} for i in range(5)]
+    result = query_update(conn, 'upd_users', rows, chunk_size=2)
+    assert result == {'rows_affected': 5, 'batches': [2, 2, 1], 'error': None}
+    assert conn.execute('SELECT name FROM upd_users WHERE id = 4').fetchone() == ('renamed4',)
+
+
+def test_failure_rolls_back_every_batch():
+    """Test a failing batch leaves earlier batches uncommitted."""
+    conn = make_db()
+    rows = [{'id': 1, 'name': 'x'}, {'id': 2, 'name': 'y'}, {'id': 3, 'nope': 'z'}]
+    assert query_update(conn, 'upd_users', rows, chunk_size=1)['error'] == 'Rows must all set the same columns'
+    conn.execute('CREATE TRIGGER no_bob BEFORE UPDATE ON upd_users WHEN NEW.name = "bob" '
+                 'BEGIN SELECT RAISE(ABORT, "no bob"); END')
+    result = query_update(conn, 'upd_users', [{'id': 1, 'name': 'x'}, {'id': 2, 'name': 'bob'}],
+                          chunk_size=1)
+    assert result['error'] == 'no bob' and result['rows_affected'] == 0
+    assert conn.execute('SELECT name FROM upd_users WHERE id = 1').fetchone() == ('u1',)
+
+
+def test_rejects_unsafe_identifiers():
+    """Test table and column names are validated like query_insert."""
+    conn = make_db()
+    assert query_update(conn, 'upd_users;--', {'name': 'x'}, keys=[1])['error'] == 'Invalid table name'
+    assert 'Invalid column' in query_update(conn, 'upd_users', {'name = 1 --': 'x'}, keys=[1])['error']
+    assert query_update(conn, 'upd_users', {'id': 1})['error'] == 'Nothing to update'
+
+
+def test_caller_transaction_is_left_open():
+    """Test a failure undoes only this brick's batches, not the caller's pending insert."""
+    conn = make_db()
+    conn.execute("INSERT INTO upd_users VALUES (50, 'pending', 1)")
+    conn.execute('CREATE TRIGGER no_bob BEFORE UPDATE ON upd_users WHEN NEW.name = "bob" '
+                 'BEGIN SELECT RAISE(ABORT, "no bob"); END')
+    result = query_update(conn, 'upd_users', [{'id': 1, 'name': 'x'}, {'id': 2, 'name': 'bob'}],
+                          chunk_size=1)
+    assert result['error'] == 'no bob'
+    assert conn.in_transaction
+    names = conn.execute('SELECT name FROM upd_users WHERE id IN (1, 50)').fetchall()
+    assert names == [('u1',), ('pending',)]
+
+    auto = sqlite3.connect(':memory:', isolation_level=None)
+    auto.execute('CREATE TABLE upd_users (id INTEGER PRIMARY KEY, name TEXT, active INTEGER)')
+    auto.executemany('INSERT INTO upd_users VALUES (?, ?, 1)', [(1, 'a'), (2, 'b')])
+    auto.execute('CREATE TRIGGER no_bob BEFORE UPDATE ON upd_users WHEN NEW.name = "bob" '
+                 'BEGIN SELECT RAISE(ABORT, "no bob"); END')
+    query_update(auto, 'upd_users', [{'id': 1, 'name': 'x'}, {'id': 2, 'name': 'bob'}],
+                 chunk_size=1)
+    assert auto.execute('SELECT name FROM upd_users WHERE id = 1').fetchone() == ('a',)
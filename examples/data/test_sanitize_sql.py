@@ -1,5 +1,5 @@
 """Tests for sanitize_sql brick."""
-from sanitize_sql import sanitize_sql
+from sanitize_sql import sanitize_sql, sanitize_sql_batch
 
 
 def test_sanitize_sql():
@@ -41,5 +41,51 @@ def test_sanitize_sql():
     print("All sanitize_sql tests passed!")
 
 
+def test_sanitize_sql_injection_attempts():
+    """Test injection attempts in identifiers and values."""
+    result = sanitize_sql(identifier='users; DROP TABLE users--')
+    assert result['safe'] is False
+    assert 'Invalid' in result['error']
+
+    result = sanitize_sql(identifier='users\n')
+    assert result['safe'] is False
+
+    result = sanitize_sql(value="test'; DROP TABLE users--")
+    assert result['safe'] is False
+
+
+def test_sanitize_sql_reports_pattern_and_offset():
+    """Test the first offending pattern and its offset are reported."""
+    result = sanitize_sql(value="name /* note */")
+    assert result['pattern'] == '/*'
+    assert result['offset'] == 5
+
+    # Case-insensitive match reports the canonical pattern
+    result = sanitize_sql(value='1 union select')
+    assert result['pattern'] == 'UNION'
+    assert result['offset'] == 2
+
+    result = sanitize_sql(value='clean')
+    assert result['pattern'] is None
+    assert result['offset'] is None
+
+
+def test_sanitize_sql_batch():
+    """Test batch sanitization over identifiers and values."""
+    result = sanitize_sql_batch(['users', 'email'], ["O'Reilly", 7])
+    assert result['safe'] is True
+    assert [r['sanitized'] for r in result['identifiers']] == ['users', 'email']
+    assert [r['sanitized'] for r in result['values']] == ["O''Reilly", '7']
+
+    result = sanitize_sql_batch(['users', 'DROP'], ['ok', 'x; exec sp'])
+    assert result['safe'] is False
+    assert result['identifiers'][1]['error'] == 'Reserved keyword'
+    assert result['values'][1]['pattern'] == ';'
+    assert result['error'] is None
+
+
 if __name__ == '__main__':
     test_sanitize_sql()
+    test_sanitize_sql_injection_attempts()
+    test_sanitize_sql_reports_pattern_and_offset()
+    test_sanitize_sql_batch()
@@ -0,0 +1,57 @@
+"""Tests for search_index brick."""
+import sqlite3
+
+from query_delete import query_delete
+from query_insert import query_insert
+from query_update import query_update
+from search_index import search_index
+
+
+def make_db():
+    """Return an in-memory notes table with one row."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE idx_notes (id INTEGER PRIMARY KEY, title TEXT, body TEXT, views INT)')
+    conn.execute("INSERT INTO idx_notes VALUES (1, 'Existing', 'indexed on creation', 0)")
+    conn.commit()
+    return conn
+
+
+def matches(conn, term):
+    """Return the ids whose indexed text matches term."""
+    return [r[0] for r in conn.execute(
+        'SELECT rowid FROM idx_notes_fts WHERE idx_notes_fts MATCH ? ORDER BY rowid', (term,))]
+
+
+def test_index_tracks_writes_from_bricks():
+    """Test existing rows are indexed and inserts, updates and deletes stay in sync."""
+    conn = make_db()
+    assert search_index(conn, 'idx_notes', ['title', 'body']) == {'created': True, 'error': None}
+    assert search_index(conn, 'idx_notes', ['title', 'body']) == {'created': False, 'error': None}
+    assert matches(conn, 'creation') == [1]
+
+    query_insert(conn, 'idx_notes', {'title': 'Second', 'body': 'fresh words'})
+    assert matches(conn, 'fresh') == [2]
+    query_update(conn, 'idx_notes', [{'id': 2, 'body': 'rewritten text'}])
+    assert (matches(conn, 'fresh'), matches(conn, 'rewritten')) == ([], [2])
+    query_delete(conn, 'idx_notes', [1])
+    assert matches(conn, 'creation') == []
+
+
+def test_rejects_bad_input_atomically():
+    """Test unsafe names are refused and a failed build leaves nothing behind."""
+    conn = make_db()
+    assert search_index(conn, 'idx_notes; --', ['title'])['error'] == 'Invalid table name'
+    assert search_index(conn, 'idx_notes', [])['error'] == 'No columns to index'
+    assert search_index(conn, 'idx_notes', ['title'], key='missing')['error'] is not None
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name LIKE 'idx_notes_fts%'").fetchone() == (0,)
+
+
+def test_refuses_open_transaction():
+    """Test the caller's uncommitted work is neither committed nor rolled back."""
+    conn = make_db()
+    conn.execute("INSERT INTO idx_notes VALUES (2, 'Draft', 'not committed', 0)")
+    assert search_index(conn, 'idx_notes', ['title'])['error'].startswith('Open transaction')
+    assert conn.in_transaction
+    conn.rollback()
+    assert conn.execute('SELECT COUNT(*) FROM idx_notes').fetchone() == (1,)
+    assert search_index(conn, 'idx_notes', ['title'])['created'] is True
@@ -0,0 +1,66 @@
+"""Tests for search_text brick."""
+import sqlite3
+
+from search_index import search_index
+from search_text import search_text
+
+NOTES = [
+    (1, 'Gardening', 'Tomatoes need sun. Water tomatoes daily in summer.'),
+    (2, 'Cooking', 'Roast tomatoes with garlic and olive oil.'),
+    (3, 'Travel', 'Sunny beaches and olive groves.'),
+]
+
+
+def make_db():
+    """Return an in-memory notes table indexed with search_index."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE txt_notes (id INTEGER PRIMARY KEY, title TEXT, body TEXT)')
+    conn.executemany('INSERT INTO txt_notes VALUES (?, ?, ?)', NOTES)
+    conn.commit()
+    search_index(conn, 'txt_notes', ['title', 'body'])
+    return conn
+
+
+def test_ranked_results_with_snippets():
+    """Test matches come back best bm25 first with highlighted snippets."""
+    conn = make_db()
+    result = search_text(conn, 'txt_notes', 'tomatoes', ['id', 'title'])
+    assert result['error'] is None and result['count'] == 2
+    assert [r['id'] for r in result['rows']] == [1, 2]
+    assert result['rows'][0]['rank'] <= result['rows'][1]['rank']
+    assert '[tomatoes]' in result['rows'][1]['snippet'].lower()
+
+
+def test_words_are_anded_and_paginated():
+    """Test every word must match and limit/offset page through results."""
+    conn = make_db()
+    assert [r['id'] for r in search_text(conn, 'txt_notes', 'olive garlic', ['id'])['rows']] == [2]
+    first = search_text(conn, 'txt_notes', 'olive', ['id'], limit=1)
+    second = search_text(conn, 'txt_notes', 'olive', ['id'], limit=1, offset=1)
+    assert first['count'] == second['count'] == 1
+    assert {first['rows'][0]['id'], second['rows'][0]['id']} == {2, 3}
+    assert search_text(conn, 'txt_notes', '   ', ['id']) == {'rows': [], 'count': 0, 'error': None}
+
+
+def test_plain_queries_are_quoted_and_raw_allows_syntax():
+    """Test FTS operators in plain text are literal, and raw passes them through."""
+    conn = make_db()
+    assert search_text(conn, 'txt_notes', 'sun* OR "', ['id'])['count'] == 0
+    raw = search_text(conn, 'txt_notes', 'sun* OR title:travel', ['id'], raw=True)
+    assert sorted(r['id'] for r in raw['rows']) == [1, 3]
+    assert search_text(conn, 'txt_notes', 'AND (', ['id'], raw=True)['error'] is not None
+
+
+def test_rejects_unsafe_identifiers():
+    """Test table and column names are validated like query_insert."""
+    conn = make_db()
+    assert search_text(conn, 'txt_notes; --', 'x', ['id'])['error'] == 'Invalid table name'
+    assert 'Invalid column' in search_text(conn, 'txt_notes', 'x', ['id, body'])['error']
+
+
+def test_unranked_pages_in_rowid_order():
+    """Test ranked=False skips bm25 ordering but still returns scores and snippets."""
+    conn = make_db()
+    rows = search_text(conn, 'txt_notes', 'olive', ['id'], ranked=False)['rows']
+    assert [r['id'] for r in rows] == [2, 3]
+    assert all(r['rank'] is not None and '[olive]' in r['snippet'].lower() for r in rows)
@@ -0,0 +1,16 @@
+"""Tests for table_version brick."""
+from table_version import table_version
+
+
+def test_table_version():
+    """Test versions start at zero and bump per table, case-insensitively."""
+    assert table_version('tv_orders')['version'] == 0
+    assert table_version('tv_orders', bump=True)['version'] == 1
+    assert table_version('TV_Orders')['version'] == 1
+    assert table_version('tv_other')['version'] == 0
+
+
+def test_table_version_rejects_non_string():
+    """Test a non-string table name is an error envelope, not an AttributeError."""
+    assert table_version(42, bump=True) == {'version': None,
+                                            'error': 'Table name must be a string'}
@@ -1,8 +1,13 @@
 """Response formatting brick."""
 import json
+import re
+from xml.sax.saxutils import escape
 
+XML_NAME = re.compile(r"[A-Za-z_][\w.-]*")
 
-def format_response(data, format_type="json", status=200):
+
+def format_response(data, format_type="json", status=200, pretty=True,
+                    encoder=None):
     """
     Format data for API response.
 
@@ -10,33 +15,34 @@ def format_response(data, format_type="json", status=200):
         data: Data to format
         format_type: Output format (json, xml, text)
         status: HTTP status code
+        pretty: Indent JSON output (the default); False gives compact JSON
+        encoder: Optional fast JSON encoder, e.g. orjson.dumps; when given its
+                 output is used as-is, so pretty is up to the encoder
 
     Returns:
-        dict: {body: str, content_type: str, status: int}
+        dict: {body: str, content_type: str, status: int}, plus error for an invalid XML key
     """
     if format_type == "json":
-        return {
-            "body": json.dumps(data, indent=2),
-            "content_type": "application/json",
-            "status": status
-        }
+        if encoder is not None:
+            body = encoder(data)
+            if isinstance(body, bytes):
+                body = body.decode("utf-8")
+        else:
+            body = json.dumps(data, indent=2 if pretty else None,
+                              separators=None if pretty else (",", ":"))
+        return {"body": body, "content_type": "application/json", "status": status}
     elif format_type == "xml":
-        # Simple XML formatting
-        xml = "<response>\n"
+        bad = [key for key in data if not XML_NAME.fullmatch(str(key))]
+        if bad:
+            return {"body": "", "content_type": "application/xml", "status": status,
+                    "error": f"Invalid XML tag name: {bad[0]!r}"}
+        parts = ["<response>"]
         for key, value in data.items():
-            xml += f"  <{key}>{value}</{key}>\n"
-        xml += "</response>"
-        return {
-            "body": xml,
-            "content_type": "application/xml",
-            "status": status
-        }
+            parts.append(f"  <{key}>{escape(str(value))}</{key}>")
+        parts.append("</response>")
+        return {"body": "\n".join(parts), "content_type": "application/xml", "status": status}
     else:
-        return {
-            "body": str(data),
-            "content_type": "text/plain",
-            "status": status
-        }
+        return {"body": str(data), "content_type": "text/plain", "status": status}
 
 
 def test_format_response_json():
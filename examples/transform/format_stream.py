@@ -0,0 +1,37 @@
+"""Chunked JSON array streaming brick."""
+import json
+
+
+def format_stream(items, chunk_size=1000, encoder=None):
+    """
+    Stream a list as a JSON array for chunked HTTP responses.
+
+    Args:
+        items: Iterable of JSON-serialisable items
+        chunk_size: Number of items encoded per yielded chunk
+        encoder: Optional fast JSON encoder, e.g. orjson.dumps
+
+    Returns:
+        dict: {chunks: iterator[str]|None, content_type: str, error: str|None}
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        return {"chunks": None, "content_type": "application/json",
+                "error": "chunk_size must be a positive integer"}
+    dumps = encoder or (lambda value: json.dumps(value, separators=(",", ":")))
+    return {"chunks": _chunks(items, chunk_size, dumps),
+            "content_type": "application/json", "error": None}
+
+
+def _chunks(items, chunk_size, dumps):
+    """Yield '[', comma-joined batches of encoded items, then ']'."""
+    batch, sep = [], ""
+    yield "["
+    for item in items:
+        text = dumps(item)
+        batch.append(text.decode("utf-8") if isinstance(text, bytes) else text)
+        if len(batch) == chunk_size:
+            yield sep + ",".join(batch)
+            batch, sep = [], ","
+    if batch:
+        yield sep + ",".join(batch)
+    yield "]"
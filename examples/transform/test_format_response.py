@@ -0,0 +1,49 @@
+"""Tests for format_response brick."""
+import json
+
+from format_response import format_response
+
+
+def test_format_response_compact():
+    """Test pretty=False gives compact JSON."""
+    result = format_response({"a": 1, "b": [1, 2]}, pretty=False)
+    assert result["body"] == '{"a":1,"b":[1,2]}'
+
+
+def test_format_response_pretty():
+    """Test JSON stays indented by default, as before the compact option."""
+    data = {"a": 1}
+    assert format_response(data)["body"] == json.dumps(data, indent=2)
+    assert format_response(data, pretty=True)["body"] == json.dumps(data, indent=2)
+
+
+def test_format_response_custom_encoder():
+    """Test pluggable encoder returning bytes is used as-is whatever pretty says."""
+    encoder = lambda value: json.dumps(value).encode("utf-8")
+    result = format_response({"a": 1}, pretty=False, encoder=encoder)
+    assert result["body"] == '{"a": 1}'
+    assert isinstance(result["body"], str)
+    assert format_response({"a": 1}, encoder=encoder)["body"] == '{"a": 1}'
+
+
+def test_format_response_xml_escapes_values():
+    """Test XML values are escaped."""
+    result = format_response({"q": "a < b & c"}, format_type="xml")
+    assert "<q>a &lt; b &amp; c</q>" in result["body"]
+    assert result["body"].startswith("<response>")
+    assert result["body"].endswith("</response>")
+
+
+def test_format_response_xml_rejects_bad_keys():
+    """Test keys that are not XML names give an error instead of broken markup."""
+    result = format_response({"ok": 1, "a b><x": 2}, format_type="xml")
+    assert result["body"] == ""
+    assert "a b><x" in result["error"]
+    assert "error" not in format_response({"a.b-c_1": 1}, format_type="xml")
+
+
+def test_format_response_text():
+    """Test plain text fallback."""
+    result = format_response({"a": 1}, format_type="text", status=201)
+    assert result["content_type"] == "text/plain"
+    assert result["status"] == 201
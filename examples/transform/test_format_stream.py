@@ -0,0 +1,46 @@
+"""Tests for format_stream brick."""
+import json
+from format_stream import format_stream
+
+
+def test_format_stream_roundtrip():
+    """Test chunks join into the same JSON array."""
+    items = [{"id": i, "name": f"user{i}"} for i in range(25)]
+    result = format_stream(items, chunk_size=10)
+    assert result["error"] is None
+    chunks = list(result["chunks"])
+    assert len(chunks) == 5
+    assert json.loads("".join(chunks)) == items
+
+
+def test_format_stream_exact_chunks():
+    """Test item count that divides evenly into chunks."""
+    chunks = list(format_stream(range(4), chunk_size=2)["chunks"])
+    assert chunks == ["[", "0,1", ",2,3", "]"]
+
+
+def test_format_stream_empty():
+    """Test empty iterable streams an empty array."""
+    chunks = list(format_stream([])["chunks"])
+    assert "".join(chunks) == "[]"
+
+
+def test_format_stream_generator_input():
+    """Test lazily generated items are consumed once."""
+    items = ({"n": i} for i in range(3))
+    body = "".join(format_stream(items, chunk_size=1)["chunks"])
+    assert json.loads(body) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_format_stream_custom_encoder():
+    """Test a bytes-returning encoder is decoded."""
+    encoder = lambda value: json.dumps(value).encode("utf-8")
+    body = "".join(format_stream([1, 2], encoder=encoder)["chunks"])
+    assert body == "[1,2]"
+
+
+def test_format_stream_invalid_chunk_size():
+    """Test invalid chunk size is rejected."""
+    result = format_stream([1], chunk_size=0)
+    assert result["chunks"] is None
+    assert "chunk_size" in result["error"]
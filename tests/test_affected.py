@@ -0,0 +1,80 @@
+"""Tests for git-diff-aware brick selection (--since)."""
+import json
+import subprocess
+from argparse import Namespace
+
+from tools import cli_validate
+from tools.affected import affected_bricks, brick_for_change
+
+
+def git(root, *argv):
+    """Run git in root."""
+    subprocess.run(["git", *argv], cwd=root, check=True, capture_output=True)
+
+
+def make_repo(root):
+    """Create a repo where user_lookup imports hash_key and report declares it."""
+    (root / "hash_key.py").write_text('"""Hash."""\n\n\ndef hash_key(k):\n    """Hash k."""\n    return k\n')
+    (root / "user_lookup.py").write_text('"""Lookup."""\nfrom hash_key import hash_key\n\n\n'
+                                         'def user_lookup(k):\n    """Find k."""\n    return hash_key(k)\n')
+    (root / "report.py").write_text('"""Report."""\n\n\ndef report():\n    """Report."""\n    return {}\n')
+    (root / "other.py").write_text('"""Other."""\n\n\ndef other():\n    """Other."""\n    return {}\n')
+    (root / "report.meta.json").write_text(json.dumps({"dependencies": ["user_lookup_v1"]}))
+    (root / "test_other.py").write_text("def test_other():\n    pass\n")
+    git(root, "init", "-q")
+    git(root, "add", ".")
+    git(root, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+    return sorted(p for p in root.glob("*.py") if not p.name.startswith("test_"))
+
+
+def names(paths):
+    """Return file names for readable assertions."""
+    return [p.name for p in paths]
+
+
+def test_brick_for_change():
+    """Test metadata and test files map to their brick."""
+    assert brick_for_change("a/x.meta.json").as_posix() == "a/x.py"
+    assert brick_for_change("a/test_x.py").as_posix() == "a/x.py"
+    assert brick_for_change("a/x.py").as_posix() == "a/x.py"
+
+
+def test_change_expands_to_dependents(tmp_path):
+    """Test importers and metadata dependents are included transitively."""
+    bricks = make_repo(tmp_path)
+    assert affected_bricks("HEAD", bricks) == []
+
+    (tmp_path / "hash_key.py").write_text('"""Hash v2."""\n\n\ndef hash_key(k):\n    """Hash."""\n    return k\n')
+    assert names(affected_bricks("HEAD", bricks)) == ["hash_key.py", "report.py", "user_lookup.py"]
+
+
+def test_deleted_brick_selects_importers(tmp_path):
+    """Test removing a brick still selects the bricks that import it."""
+    bricks = make_repo(tmp_path)
+    git(tmp_path, "rm", "-q", "hash_key.py")
+    remaining = [b for b in bricks if b.exists()]
+    assert names(affected_bricks("HEAD", remaining)) == ["report.py", "user_lookup.py"]
+
+
+def test_test_and_metadata_changes(tmp_path):
+    """Test edits to test files and sidecars select only their brick."""
+    bricks = make_repo(tmp_path)
+    (tmp_path / "test_other.py").write_text("def test_other():\n    assert True\n")
+    assert names(affected_bricks("HEAD", bricks)) == ["other.py"]
+
+    git(tmp_path, "checkout", "--", "test_other.py")
+    (tmp_path / "other.meta.json").write_text("{}")
+    assert names(affected_bricks("HEAD", bricks)) == ["other.py"]
+
+
+def test_validate_since(tmp_path, capsys):
+    """Test brick validate --since only reports affected bricks."""
+    make_repo(tmp_path)
+    args = Namespace(brick_file=[str(tmp_path)], format="jsonl", since="HEAD")
+    assert cli_validate.run(args) == 0
+    assert capsys.readouterr().out == ""
+
+    (tmp_path / "user_lookup.py").write_text('"""Lookup v2."""\n\n\ndef user_lookup(k):\n    """Find."""\n    return k\n')
+    cli_validate.run(args)
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [r["file"].rsplit("/", 1)[-1] for r in records] == ["report.py", "user_lookup.py"]
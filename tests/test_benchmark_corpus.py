@@ -0,0 +1,38 @@
+"""Tests for the synthetic benchmark corpus generator."""
+from benchmarks.corpus import generate_corpus
+from benchmarks.bench_inspector import compare
+from tools.cli_validate import validate_file
+
+
+def read_tree(root):
+    """Return {relative path: bytes} for every generated file."""
+    return {p.relative_to(root).as_posix(): p.read_bytes()
+            for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def test_corpus_is_deterministic(tmp_path):
+    """Test the same seed yields byte-identical trees."""
+    generate_corpus(tmp_path / "a", 20, seed=7, pathological=False)
+    generate_corpus(tmp_path / "b", 20, seed=7, pathological=False)
+    generate_corpus(tmp_path / "c", 20, seed=8, pathological=False)
+    assert read_tree(tmp_path / "a") == read_tree(tmp_path / "b")
+    assert read_tree(tmp_path / "a") != read_tree(tmp_path / "c")
+
+
+def test_corpus_layout(tmp_path):
+    """Test bricks get companion tests and parse cleanly."""
+    bricks = generate_corpus(tmp_path, 8, seed=0)
+    assert len(bricks) == 10
+    for brick in bricks[:8]:
+        assert (brick.parent / f"test_{brick.name}").exists()
+        rules = [v["rule"] for v in validate_file(brick)["violations"]]
+        assert "BRICK002" not in rules
+    huge = validate_file(bricks[8])
+    assert [v["rule"] for v in huge["violations"]] == ["BRICK001"]
+
+
+def test_compare_flags_regressions():
+    """Test only results slower than the threshold are reported."""
+    baseline = {"a": {"seconds": 1.0}, "b": {"seconds": 1.0}}
+    current = {"a": {"seconds": 1.1}, "b": {"seconds": 1.5}, "c": {"seconds": 9.0}}
+    assert compare(baseline, current, 0.2) == [("b", 1.0, 1.5)]
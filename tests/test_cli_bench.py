@@ -0,0 +1,123 @@
+"""Tests for `brick bench`."""
+import json
+import time
+from argparse import Namespace
+
+from tools import cli_bench
+
+BRICK = '''"""Square brick."""
+
+
+def square(value):
+    """Return value squared."""
+    return {"value": value * value, "error": None}
+'''
+TESTS = '''from square import square
+
+
+def test_square():
+    assert square(3)["value"] == 9
+    assert square(value=-2)["value"] == 4
+    assert square(VALUE)["value"] == 0
+'''
+
+
+def make_brick(root, meta=None):
+    """Write the square brick, its tests and .meta.json under root."""
+    (root / "square.py").write_text(BRICK)
+    (root / "test_square.py").write_text(TESTS)
+    (root / "square.meta.json").write_text(json.dumps(meta or {"brick_id": "square_v1"}))
+    return root / "square.py"
+
+
+def bench(brick_file, baseline, **kwargs):
+    """Run the bench command with small sample counts."""
+    return cli_bench.run(Namespace(brick_file=[str(brick_file)], baseline=str(baseline),
+                                   samples=8, warmup=1, threshold=0.2, **kwargs))
+
+
+def test_cases_from_tests_and_metadata(tmp_path):
+    """Test literal calls in tests are used unless metadata declares cases."""
+    brick_file = make_brick(tmp_path)
+    assert cli_bench.benchmark_cases(brick_file, {}) == [((3,), {}), ((), {"value": -2})]
+
+    declared = {"benchmarks": [{"args": [7]}, {"kwargs": {"value": 1}}]}
+    assert cli_bench.benchmark_cases(brick_file, declared) == [((7,), {}), ((), {"value": 1})]
+
+
+def test_baseline_recorded_then_regression_fails(tmp_path, capsys):
+    """Test the first run stores a baseline and a slower run fails."""
+    brick_file = make_brick(tmp_path)
+    baseline = tmp_path / "baseline.json"
+
+    assert bench(brick_file, baseline, update=False) == 0
+    stored = json.loads(baseline.read_text())["square_v1"]
+    assert 0 < stored["p50_ns"] <= stored["p99_ns"]
+    assert "baseline recorded" in capsys.readouterr().out
+
+    # A baseline 1000x faster than reality must be reported as a regression
+    baseline.write_text(json.dumps({"square_v1": {"p50_ns": stored["p50_ns"] / 1000,
+                                                  "p99_ns": stored["p99_ns"] / 1000}}))
+    assert bench(brick_file, baseline, update=False) == 1
+    assert "p50 regressed" in capsys.readouterr().out
+
+    assert bench(brick_file, baseline, update=True) == 0
+    assert json.loads(baseline.read_text())["square_v1"]["p50_ns"] > stored["p50_ns"] / 1000
+
+
+def test_outliers_rejected_and_percentiles():
+    """Test Tukey fences drop a spike and percentiles interpolate."""
+    timings = [100, 101, 99, 100, 102, 98, 100, 5000]
+    kept = cli_bench.reject_outliers(timings)
+    assert 5000 not in kept and len(kept) == 7
+    assert cli_bench.percentile([0, 10], 0.5) == 5
+    assert cli_bench.compare({"p50_ns": 100, "p99_ns": 100},
+                             {"p50_ns": 110, "p99_ns": 150}, 0.2) == [
+        "p99 regressed +50%: 100 ns -> 150 ns"]
+
+
+def test_p99_sees_individual_slow_calls():
+    """Test a rare slow call shows in p99 instead of being averaged or rejected."""
+    calls = []
+
+    def brick():
+        calls.append(1)
+        if len(calls) % 20 == 0:
+            sum(range(200_000))
+
+    timings = cli_bench.measure(brick, [((), {})], samples=4, warmup=1)
+    assert len(timings) > 4  # one timing per call, not one mean per sample
+    kept = cli_bench.reject_outliers(timings)
+    assert cli_bench.percentile(sorted(timings), 0.99) > 10 * cli_bench.percentile(kept, 0.5)
+
+
+def test_streaming_results_are_consumed_in_the_timed_call():
+    """Test generators, bare or in an envelope, are drained while the clock runs."""
+    def rows(count):
+        for i in range(count):
+            time.sleep(0.0005)
+            yield i
+
+    timings = cli_bench.measure(rows, [((3,), {})], samples=2, warmup=1)
+    assert min(timings) >= 1_500_000
+    envelope = lambda: {"chunks": rows(2), "error": None}
+    assert min(cli_bench.measure(envelope, [((), {})], samples=2, warmup=1)) >= 1_000_000
+
+
+def test_network_bricks_are_skipped(tmp_path, capsys):
+    """Test bricks reaching the network through a sibling are not replayed from tests."""
+    (tmp_path / "fetch.py").write_text("import requests\n\n\ndef fetch(url):\n"
+                                       "    return requests.get(url)\n")
+    (tmp_path / "wrapped.py").write_text("from fetch import fetch\n\n\ndef wrapped(url):\n"
+                                         "    return fetch(url)\n")
+    (tmp_path / "test_wrapped.py").write_text("def test_w():\n    wrapped('http://x')\n")
+    assert cli_bench.needs_network(tmp_path / "wrapped.py")
+    assert bench(tmp_path / "wrapped.py", tmp_path / "b.json", update=False) == 0
+    assert "skipped (needs network" in capsys.readouterr().out
+
+
+def test_brick_without_cases_fails(tmp_path, capsys):
+    """Test a brick with no derivable inputs is reported, not silently passed."""
+    (tmp_path / "noop.py").write_text("def noop():\n    return {}\n")
+    assert bench(tmp_path / "noop.py", tmp_path / "b.json", update=False) == 1
+    assert "No benchmark cases" in capsys.readouterr().out
@@ -0,0 +1,84 @@
+"""Tests for `brick dedupe` duplicate detection."""
+import json
+from argparse import Namespace
+from pathlib import Path
+
+from tools import cli_dedupe
+from tools.cli_dedupe import find_duplicates, fingerprint_file
+
+BRICK = '''"""Sum brick."""
+
+
+def total(values, start=0):
+    """Sum values."""
+    result = start
+    for value in values:
+        if value is None:
+            continue
+        result = result + value * 2 - 1
+    return {"total": result, "error": None}
+'''
+
+
+def write(root, name, source):
+    """Write a source file and return its path."""
+    path = root / name
+    path.write_text(source)
+    return path
+
+
+def test_renamed_copy_is_exact_duplicate(tmp_path):
+    """Test identifier, literal and docstring changes keep the AST hash."""
+    original = write(tmp_path, "a.py", BRICK)
+    renamed = write(tmp_path, "b.py", BRICK.replace("values", "items")
+                    .replace("total", "summed").replace("Sum", "Add")
+                    .replace("* 2", "* 3"))
+    assert fingerprint_file(original)["ast_hash"] == fingerprint_file(renamed)["ast_hash"]
+    assert fingerprint_file(original)["sha256"] != fingerprint_file(renamed)["sha256"]
+
+    report = find_duplicates([original, renamed])
+    assert report["exact"] == [{"files": [str(original), str(renamed)], "identical": False}]
+    assert report["skip"] == []
+
+    copy = write(tmp_path, "c.py", BRICK)
+    assert find_duplicates([original, renamed, copy])["skip"] == [str(copy)]
+
+
+def test_builtins_and_imports_are_not_canonicalised(tmp_path):
+    """Test calls to different builtins or modules do not fingerprint alike."""
+    source = "import json\nimport pickle\n\n\ndef f(x):\n    return {}(x)\n"
+    hashes = {fingerprint_file(write(tmp_path, f"{i}.py", source.format(call)))["ast_hash"]
+              for i, call in enumerate(["len", "eval", "json.dumps", "pickle.dumps"])}
+    assert len(hashes) == 4
+
+
+def test_small_edit_is_near_duplicate(tmp_path):
+    """Test a structurally similar file clusters as a near duplicate."""
+    body = "".join(f"    row_{i} = value * {i}\n" for i in range(40))
+    source = f"def build(value):\n{body}    return row_0\n"
+    first = write(tmp_path, "first.py", source)
+    second = write(tmp_path, "second.py", source.replace("    return row_0\n",
+                                                          "    print(row_1)\n    return row_0\n"))
+    other = write(tmp_path, "other.py", "import json\n\nprint(json.dumps({}))\n")
+
+    report = find_duplicates([first, second, other], threshold=0.7)
+    assert report["exact"] == []
+    assert [c["files"] for c in report["near"]] == [[str(first), str(second)]]
+    assert report["near"][0]["similarity"] >= 0.7
+
+
+def test_unparsable_files_are_skipped(tmp_path):
+    """Test syntax errors do not abort the scan."""
+    write(tmp_path, "bad.py", "def broken(:\n")
+    write(tmp_path, "good.py", BRICK)
+    assert find_duplicates(cli_dedupe.collect_sources([tmp_path]))["files"] == 1
+
+
+def test_examples_copied_tests_are_found(capsys):
+    """Test the byte-identical auth test copies in examples/ are reported."""
+    examples = Path(__file__).parent.parent / "examples"
+    assert cli_dedupe.run(Namespace(paths=[str(examples)], format="json")) == 0
+    report = json.loads(capsys.readouterr().out)
+    identical = [g["files"] for g in report["exact"] if g["identical"]]
+    assert [str(examples / "auth" / "test_auth_hash_password.py"),
+            str(examples / "data" / "test_auth_hash_password.py")] in identical
@@ -0,0 +1,56 @@
+"""Tests for `brick generate --spec-dir`."""
+import json
+from argparse import Namespace
+
+from tools import cli_generate
+
+
+def write_specs(root, count):
+    """Write count YAML specs plus one JSON spec and a non-spec file."""
+    for i in range(count):
+        (root / f"brick_{i}.yaml").write_text(
+            f"brick_name: brick_{i}\ninputs:\n  value: int\noutputs:\n  error: str\n")
+    (root / "extra.json").write_text(json.dumps({"brick_name": "extra"}))
+    (root / "README.md").write_text("not a spec")
+
+
+def generate(spec_dir, output, jobs=1):
+    """Run the spec-dir command."""
+    return cli_generate.run(Namespace(spec_dir=str(spec_dir), output=str(output),
+                                      jobs=jobs, force=False))
+
+
+def test_spec_dir_generates_and_skips_unchanged(tmp_path, capsys):
+    """Test every spec is generated once and untouched specs are skipped."""
+    specs, out = tmp_path / "specs", tmp_path / "out"
+    specs.mkdir()
+    out.mkdir()
+    write_specs(specs, 3)
+
+    assert generate(specs, out) == 0
+    assert "4 generated, 0 unchanged, 0 failed" in capsys.readouterr().out
+    meta = json.loads((out / "brick_1.meta.json").read_text())
+    assert meta["brick_id"] == "brick_1_v1"
+    assert meta["interface"]["outputs"] == {"error": "str"}
+
+    before = (out / "brick_0.meta.json").stat().st_mtime_ns
+    (specs / "brick_2.yaml").write_text("brick_name: brick_2\ninputs: {}\n")
+    assert generate(specs, out) == 0
+    assert "1 generated, 3 unchanged, 0 failed" in capsys.readouterr().out
+    assert (out / "brick_0.meta.json").stat().st_mtime_ns == before
+
+
+def test_spec_dir_parallel_matches_serial(tmp_path, capsys):
+    """Test the process pool produces the same metadata and reports errors."""
+    specs, out = tmp_path / "specs", tmp_path / "out"
+    specs.mkdir()
+    out.mkdir()
+    write_specs(specs, cli_generate.PARALLEL_THRESHOLD)
+    (specs / "broken.yaml").write_text("brick_name: [unclosed\n")
+
+    assert generate(specs, out, jobs=2) == 1
+    output = capsys.readouterr().out
+    assert f"{cli_generate.PARALLEL_THRESHOLD + 1} generated" in output
+    assert "broken.yaml: Error parsing spec" in output
+    hashes = {json.loads(p.read_text())["prompt_hash"] for p in out.glob("*.meta.json")}
+    assert len(hashes) == cli_generate.PARALLEL_THRESHOLD + 1
@@ -0,0 +1,64 @@
+"""Startup benchmark for brick_cli.py based on `python -X importtime`."""
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+CLI = ROOT / "brick_cli.py"
+BRICK = ROOT / "examples" / "api" / "http_get.py"
+
+# Regression budget: total self import time (us) of modules the CLI adds on
+# top of a bare interpreter. Generous enough for slow CI machines, but
+# re-importing yaml or the inspector stack eagerly would exceed it.
+STARTUP_BUDGET_US = 40000
+HEAVY_MODULES = {"yaml", "hashlib", "subprocess", "bricks.inspector",
+                 "tools.cli_generate", "tools.cli_inspect", "tools.cli_test"}
+
+
+def import_profile(*argv):
+    """Run python -X importtime with argv; return {module: self_us}."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argv],
+                          capture_output=True, text=True, cwd=ROOT)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def cli_imports(*argv):
+    """Return {module: self_us} for modules imported beyond a bare interpreter."""
+    bare = import_profile("-c", "pass")
+    run = import_profile(str(CLI), *argv)
+    return {name: us for name, us in run.items() if name not in bare}
+
+
+def test_validate_skips_heavy_imports():
+    """Test `brick validate` does not import other subcommands' modules."""
+    imported = cli_imports("validate", str(BRICK))
+    assert "tools.cli_validate" in imported
+    assert not HEAVY_MODULES & imported.keys()
+
+
+def test_help_imports_no_subcommands():
+    """Test `brick --help` imports no subcommand module at all."""
+    imported = cli_imports("--help")
+    assert not [name for name in imported if name.startswith("tools.")]
+
+
+def test_inspect_loads_inspector_on_dispatch():
+    """Test the inspector stack is still imported when it is needed."""
+    imported = cli_imports("inspect", str(BRICK))
+    assert "bricks.inspector" in imported
+    assert "yaml" not in imported
+
+
+def test_validate_startup_budget():
+    """Test CLI import overhead for `brick validate` stays within budget."""
+    imported = cli_imports("validate", str(BRICK))
+    total = sum(imported.values())
+    assert total < STARTUP_BUDGET_US, (
+        f"startup imports took {total}us (budget {STARTUP_BUDGET_US}us): "
+        f"{sorted(imported.items(), key=lambda kv: -kv[1])[:5]}")
@@ -0,0 +1,81 @@
+"""Tests for the batch `brick validate` command."""
+import json
+from argparse import Namespace
+
+from tools import cli_validate
+
+GOOD = '"""Good brick."""\n\n\ndef good():\n    """Return nothing."""\n    return {}\n'
+
+
+def make_tree(root, count):
+    """Write count valid bricks plus one broken brick and a test file."""
+    for i in range(count):
+        (root / f"good_{i}.py").write_text(GOOD)
+        (root / f"good_{i}.meta.json").write_text("{}")
+    (root / "broken.py").write_text("def broken(:\n")
+    (root / "test_good_0.py").write_text("def test_x():\n    pass\n")
+
+
+def test_validate_directory_jsonl(tmp_path, capsys):
+    """Test a directory is expanded and reported as JSON Lines."""
+    make_tree(tmp_path, 2)
+    code = cli_validate.run(Namespace(brick_file=[str(tmp_path)], format="jsonl", jobs=1))
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert code == 1
+    assert [r["file"].rsplit("/", 1)[-1] for r in records] == ["broken.py", "good_0.py", "good_1.py"]
+    broken = records[0]
+    assert broken["valid"] is False
+    assert {v["rule"] for v in broken["violations"]} == {"BRICK002", "BRICK003", "BRICK004"}
+    assert records[1] == {"file": str(tmp_path / "good_0.py"), "valid": True, "violations": []}
+
+
+def test_validate_sarif(tmp_path, capsys):
+    """Test SARIF output carries rule ids and line regions."""
+    make_tree(tmp_path, 0)
+    cli_validate.run(Namespace(brick_file=[str(tmp_path / "broken.py")], format="sarif"))
+    log = json.loads(capsys.readouterr().out)
+    results = log["runs"][0]["results"]
+    syntax = [r for r in results if r["ruleId"] == "BRICK002"][0]
+    assert log["version"] == "2.1.0"
+    assert syntax["locations"][0]["physicalLocation"]["region"]["startLine"] == 1
+
+
+def test_validate_parallel_matches_serial(tmp_path):
+    """Test the process pool returns the same results in the same order."""
+    make_tree(tmp_path, cli_validate.PARALLEL_THRESHOLD + 4)
+    files = cli_validate.collect_bricks([str(tmp_path)])
+    assert cli_validate.validate_many(files, jobs=2) == cli_validate.validate_many(files, jobs=1)
+
+
+def test_validate_single_file_text(tmp_path, capsys):
+    """Test the single-file form keeps the human-readable output."""
+    make_tree(tmp_path, 1)
+    code = cli_validate.run(Namespace(brick_file=str(tmp_path / "good_0.py")))
+    assert code == 0
+    assert "✓ Brick is valid" in capsys.readouterr().out
+
+
+def test_validate_missing_file(tmp_path, capsys):
+    """Test a missing file fails with an error message."""
+    code = cli_validate.run(Namespace(brick_file=[str(tmp_path / "nope.py")]))
+    assert code == 1
+    assert "File not found" in capsys.readouterr().out
+
+
+def test_validate_non_utf8_is_a_violation(tmp_path, capsys):
+    """Test an undecodable brick is reported without aborting the batch."""
+    make_tree(tmp_path, 1)
+    (tmp_path / "latin.py").write_bytes(b'"""Caf\xe9."""\n')
+    code = cli_validate.run(Namespace(brick_file=[str(tmp_path)], format="jsonl", jobs=1))
+    records = {r["file"].rsplit("/", 1)[-1]: r for r in
+               map(json.loads, capsys.readouterr().out.splitlines())}
+    assert code == 1
+    assert [v["rule"] for v in records["latin.py"]["violations"]] == ["BRICK006"]
+    assert records["good_0.py"]["valid"] is True
+
+
+def test_validate_empty_directory(tmp_path, capsys):
+    """Test a directory with no bricks fails with a message, not silently."""
+    code = cli_validate.run(Namespace(brick_file=[str(tmp_path)]))
+    assert code == 1
+    assert "No brick files found" in capsys.readouterr().out
@@ -0,0 +1,105 @@
+"""Tests for the performance antipattern inspector."""
+from tools.inspect_performance import inspect_performance
+
+
+def inspect_source(tmp_path, source):
+    """Write source to a brick file and inspect it."""
+    brick = tmp_path / "brick.py"
+    brick.write_text(source)
+    return inspect_performance(brick)
+
+
+def test_string_concatenation_in_loop(tmp_path):
+    """Test quadratic += on a string inside a loop is flagged."""
+    result = inspect_source(tmp_path, (
+        "def render(data):\n"
+        "    out = '<r>'\n"
+        "    for k, v in data.items():\n"
+        "        out += f'<{k}>{v}</{k}>'\n"
+        "    return out\n"))
+    assert result["score_deduction"] == 10
+    assert "string concatenation" in result["issues"][0]
+    assert "(line 4)" in result["issues"][0]
+
+
+def test_string_names_are_scoped_per_function(tmp_path):
+    """Test a string assigned in one function does not taint a same-named int elsewhere."""
+    result = inspect_source(tmp_path, (
+        "def title():\n"
+        "    label = 'x'\n"
+        "    return label\n\n"
+        "def count(items):\n"
+        "    label = 0\n"
+        "    for i in items:\n"
+        "        label += i\n"
+        "    return label\n"))
+    assert result["issues"] == []
+
+
+def test_uncompiled_regex_and_constant_rebuild(tmp_path):
+    """Test re.* calls and constant lists inside functions are flagged."""
+    result = inspect_source(tmp_path, (
+        "import re\n"
+        "NAME = re.compile(r'\\w+')\n\n"
+        "def check(value):\n"
+        "    banned = ['a', 'b', 'c']\n"
+        "    return re.match(r'\\w+', value) and value not in banned\n"))
+    text = " ".join(result["issues"])
+    assert "uncompiled regex" in text and "constant collection" in text
+    assert len(result["issues"]) == 2
+
+
+def test_list_rebuild_and_fetchall(tmp_path):
+    """Test self-filtering list rebuilds and fetchall() are flagged."""
+    result = inspect_source(tmp_path, (
+        "def prune(store, key, cutoff, cursor):\n"
+        "    store[key] = [t for t in store[key] if t > cutoff]\n"
+        "    return cursor.fetchall()\n"))
+    text = " ".join(result["issues"])
+    assert "list rebuilt" in text and "fetchall()" in text
+
+
+def test_commit_per_call_and_in_loop(tmp_path):
+    """Test commit() per call and inside loops, each reported once."""
+    result = inspect_source(tmp_path, (
+        "def insert(conn, row):\n"
+        "    conn.execute('INSERT INTO t VALUES (?)', (row,))\n"
+        "    conn.commit()\n\n"
+        "def insert_all(conn, rows):\n"
+        "    for row in rows:\n"
+        "        conn.execute('INSERT INTO t VALUES (?)', (row,))\n"
+        "        conn.commit()\n"))
+    assert [i.split(" (")[0] for i in result["issues"]] == [
+        "PERF: commit() on every call", "PERF: commit() inside loop"]
+    assert result["score_deduction"] == 15
+
+
+def test_batched_commit_is_not_flagged(tmp_path):
+    """Test a loop of execute() calls followed by one commit() is the recommended fix."""
+    result = inspect_source(tmp_path, (
+        "def insert_all(conn, rows):\n"
+        "    for row in rows:\n"
+        "        conn.execute('INSERT INTO t VALUES (?)', (row,))\n"
+        "    conn.commit()\n\n"
+        "def move(conn, a, b):\n"
+        "    conn.execute('DELETE FROM t WHERE v = ?', (a,))\n"
+        "    conn.execute('INSERT INTO t VALUES (?)', (b,))\n"
+        "    conn.commit()\n"))
+    assert result["issues"] == []
+
+
+def test_clean_brick_has_no_findings(tmp_path):
+    """Test idiomatic code is not penalised."""
+    result = inspect_source(tmp_path, (
+        "import re\n"
+        "PATTERN = re.compile(r'\\d+')\n"
+        "KEYWORDS = frozenset(['A', 'B', 'C'])\n\n"
+        "def join(items):\n"
+        "    parts = []\n"
+        "    for item in items:\n"
+        "        parts.append(str(item))\n"
+        "    total = 0\n"
+        "    for item in items:\n"
+        "        total += item\n"
+        "    return ','.join(parts), PATTERN.match('1'), total\n"))
+    assert result == {"score_deduction": 0, "issues": []}
@@ -0,0 +1,142 @@
+"""Tests for the query-plan inspector and `brick plan`."""
+import sqlite3
+import sys
+from argparse import Namespace
+
+import pytest
+
+from tools import cli_plan
+from bricks.inspector import inspect_brick
+from tools.inspect_query_plan import (PlanError, advise, advise_from_log, advise_from_tests,
+                                      index_columns)
+
+BRICK = '''"""Lookup brick."""
+
+
+def lookup(conn, email):
+    """Return the user's name by email."""
+    cursor = conn.execute("SELECT name FROM users WHERE email = ?", (email,))
+    return {"rows": cursor.fetchall(), "error": None}
+'''
+TESTS = '''import sqlite3
+from lookup import lookup
+
+
+def test_lookup():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT)")
+    conn.execute("INSERT INTO users (name, email) VALUES ('Al', 'al@x.io')")
+    assert lookup(conn, "al@x.io")["rows"] == [("Al",)]
+    assert conn.execute("SELECT COUNT(*) FROM users WHERE name = 'Al'").fetchone() == (1,)
+    print("left open on purpose")
+'''
+
+
+def make_db(rows=50):
+    """Return an in-memory users table with only the primary key indexed."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, age INT)")
+    conn.executemany("INSERT INTO users (name, email, age) VALUES (?, ?, ?)",
+                     [(f"u{i}", f"u{i}@x.io", i) for i in range(rows)])
+    return conn
+
+
+def test_filtered_scan_gets_covering_index():
+    """Test an unindexed WHERE is flagged and indexed or unfiltered queries are not."""
+    conn = make_db()
+    [entry] = advise(conn, "SELECT name FROM users WHERE email = 'a' AND age > 3")
+    assert (entry["table"], entry["rows"], entry["filter"]) == ("users", 50, ["email", "age"])
+    assert entry["index"] == ("CREATE INDEX IF NOT EXISTS idx_users_email_age_name "
+                              "ON users (email, age, name)")
+    assert advise(conn, "SELECT name FROM users WHERE id = 3") == []
+    assert advise(conn, "SELECT name FROM users") == []
+    assert advise(conn, "SELECT name FROM sqlite_master WHERE name = 'users'") == []
+    assert advise(conn, "SELECT name FROM users WHERE email = 'a'", min_rows=1000) == []
+    assert advise(conn, "DELETE FROM users WHERE age < 5")[0]["columns"] == ["age"]
+
+
+def test_placeholders_explained_and_failures_reported():
+    """Test bound parameters are explained and an unexplainable statement is an error entry."""
+    conn = make_db()
+    [entry] = advise(conn, "SELECT name FROM users WHERE email = ? AND age > ?2")
+    assert entry["filter"] == ["email", "age"]
+    assert advise(conn, "SELECT name FROM users WHERE age > :age")[0]["filter"] == ["age"]
+    assert advise(conn, "SELECT name FROM users WHERE nope = ?") == [
+        {"sql": "SELECT name FROM users WHERE nope = ?", "error": "no such column: nope"}]
+
+
+def test_index_columns_ignores_literals_and_expressions():
+    """Test quoted values and negations are not index columns and expressions skip covering."""
+    assert index_columns("SELECT a FROM t WHERE b = 'c = d' AND e NOT IN (1)",
+                         " b = 'c = d' AND e NOT IN (1)") == (["b"], ["b", "a"])
+    assert index_columns("SELECT COUNT(*) FROM t WHERE b = 1", " b = 1") == (["b"], ["b"])
+
+
+def test_statements_captured_from_tests(tmp_path):
+    """Test only the brick's own SQL is explained, in a child interpreter."""
+    (tmp_path / "lookup.py").write_text(BRICK)
+    (tmp_path / "test_lookup.py").write_text(TESTS)
+    [entry] = advise_from_tests(tmp_path / "test_lookup.py")
+    assert entry["sql"] == "SELECT name FROM users WHERE email = 'al@x.io'"
+    assert "lookup" not in sys.modules
+    assert sqlite3.connect.__module__ == "_sqlite3"
+
+
+def test_inspect_does_not_run_tests(tmp_path):
+    """Test `brick inspect` scores the source without executing the brick's tests."""
+    (tmp_path / "lookup.py").write_text(BRICK)
+    (tmp_path / "test_lookup.py").write_text(TESTS.replace("import sqlite3", "import sqlite3\n"
+                                                           "open(__file__ + '.ran', 'w')"))
+    result = inspect_brick(str(tmp_path / "lookup.py"))
+    assert not any("full table scan" in issue for issue in result["issues"])
+    assert not (tmp_path / "test_lookup.py.ran").exists()
+
+
+def test_inspect_plan_scores_scans(tmp_path):
+    """Test `brick inspect --plan` runs the tests and deducts for the brick's scan."""
+    (tmp_path / "lookup.py").write_text(BRICK)
+    (tmp_path / "test_lookup.py").write_text(TESTS)
+    static = inspect_brick(str(tmp_path / "lookup.py"))
+    result = inspect_brick(str(tmp_path / "lookup.py"), plan=True)
+    assert result["score"] == static["score"] - 5
+    assert any("full table scan of users" in issue for issue in result["issues"])
+
+
+def test_broken_tests_are_an_error_not_a_pass(tmp_path, capsys):
+    """Test a test module that cannot run fails `brick plan` instead of reporting no scans."""
+    (tmp_path / "lookup.py").write_text(BRICK)
+    (tmp_path / "test_lookup.py").write_text("import no_such_module\n")
+    with pytest.raises(PlanError, match="no_such_module"):
+        advise_from_tests(tmp_path / "test_lookup.py")
+
+    args = Namespace(brick_file=[str(tmp_path / "lookup.py")], log=None, min_rows=None,
+                     create=False, format="text")
+    assert cli_plan.run(args) == 1
+    out = capsys.readouterr().out
+    assert "Error:" in out and "No unindexed table scans" not in out
+    issues = inspect_brick(str(tmp_path / "lookup.py"), plan=True)["issues"]
+    assert any(issue.startswith("PLAN: query plan unavailable") for issue in issues)
+
+
+def test_log_mode_creates_indexes(tmp_path, capsys):
+    """Test a recorded query log is explained and --create fixes the scans."""
+    db = tmp_path / "app.db"
+    conn = make_db(rows=2000)
+    conn.commit()
+    conn.execute("VACUUM INTO ?", (str(db),))
+    log = tmp_path / "queries.sql"
+    log.write_text("-- recorded\nSELECT id FROM users WHERE name = 'u7';\n"
+                   "SELECT id FROM users WHERE name = 'u7';\n")
+
+    args = Namespace(brick_file=[], log=str(log), db=str(db), min_rows=None,
+                     create=False, format="text")
+    assert cli_plan.run(args) == 1
+    assert "idx_users_name_id" in capsys.readouterr().out
+
+    assert len(advise_from_log(db, [log.read_text().splitlines()[1]], create=True)) == 1
+    assert cli_plan.run(args) == 0
+    assert "No unindexed table scans" in capsys.readouterr().out
+
+    log.write_text("SELECT id FROM users WHERE missing = 1\n")
+    assert cli_plan.run(Namespace(**{**vars(args), "create": True})) == 1
+    assert "Could not explain" in capsys.readouterr().out
@@ -0,0 +1,147 @@
+"""Tests for the batching loader."""
+import asyncio
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from bricks.loader import Loader
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "examples" / "data"))
+from query_select_many import query_select_many  # noqa: E402
+
+
+def make_db(rows=10):
+    """Return an in-memory users table and the list its statements are traced into."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO users VALUES (?, ?)", [(i, f"u{i}") for i in range(rows)])
+    log = []
+    conn.set_trace_callback(log.append)
+    return conn, log
+
+
+def users_loader(conn, **kwargs):
+    """Loader over query_select_many for users.name by id."""
+    return Loader(lambda ids: query_select_many(conn, "users", ["name"], "id", ids), **kwargs)
+
+
+def test_thunks_share_one_query_and_memoise():
+    """Test queued loads dispatch together on first access and repeats hit the memo."""
+    conn, log = make_db()
+    users = users_loader(conn)
+    first, second, missing = users.load(1), users.load(2), users.load(99)
+    assert first() == {"name": "u1"}
+    assert (second(), missing()) == ({"name": "u2"}, None)
+    assert users.load_many([2, 1, 3]) == [{"name": "u2"}, {"name": "u1"}, {"name": "u3"}]
+    assert len(log) == 2 and "VALUES (1), (2), (99)" in log[0]
+    assert users.stats == {"loads": 6, "batches": 2, "keys": 4}
+
+
+def test_asyncio_tick_is_one_batch():
+    """Test lookups gathered in one loop tick become a single query."""
+    conn, log = make_db()
+    users = users_loader(conn)
+
+    async def main():
+        return await asyncio.gather(*(users.load_async(i) for i in [3, 1, 3, 2]))
+
+    assert asyncio.run(main()) == [{"name": "u3"}, {"name": "u1"}, {"name": "u3"}, {"name": "u2"}]
+    assert len(log) == 1 and "VALUES (3), (1), (2)" in log[0]
+
+
+def test_async_batch_runs_off_the_loop():
+    """Test a blocking batch_fn runs on an executor thread while the loop keeps ticking."""
+    threads, ticks = [], []
+
+    def slow_batch(keys):
+        threads.append(threading.get_ident())
+        threading.Event().wait(0.2)
+        return [key * 10 for key in keys]
+
+    loader = Loader(slow_batch)
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        tick_task = asyncio.ensure_future(ticker())
+        values = await asyncio.wait_for(asyncio.gather(loader.load_async(1),
+                                                       loader.load_async(2)), 5)
+        tick_task.cancel()
+        return values
+
+    assert asyncio.run(main()) == [10, 20]
+    assert threads and threads[0] != threading.get_ident()
+    assert len(ticks) > 5
+
+
+def test_max_batch_and_threads():
+    """Test max_batch splits dispatches and concurrent threads see consistent values."""
+    conn, log = make_db(rows=100)
+    users = users_loader(conn, max_batch=10)
+    assert len(users.load_many(range(35))) == 35
+    assert users.stats["batches"] == 4
+
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(users.load(i)()))
+               for i in range(30, 60)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(r["name"] for r in results) == sorted(f"u{i}" for i in range(30, 60))
+
+
+def test_errors_fail_the_batch_and_are_retried():
+    """Test error envelopes reach every caller and are not memoised."""
+    conn, _ = make_db()
+    broken = Loader(lambda ids: query_select_many(conn, "nope", ["name"], "id", ids))
+    with pytest.raises(LookupError, match="no such table"):
+        broken.load(1)()
+
+    async def main():
+        return await asyncio.gather(broken.load_async(1), broken.load_async(2),
+                                    return_exceptions=True)
+
+    assert all(isinstance(e, LookupError) for e in asyncio.run(main()))
+
+    users = users_loader(conn)
+    users.prime(1, {"name": "primed"})
+    assert users.load(1)() == {"name": "primed"}
+    users.clear(1)
+    assert users.load(1)() == {"name": "u1"}
+
+
+def test_batch_failure_only_reaches_its_own_keys():
+    """Test a failing batch does not raise for keys another batch loaded."""
+    def fetch(keys):
+        if 3 in keys:
+            raise RuntimeError("batch 2 failed")
+        return [key * 10 for key in keys]
+
+    loader = Loader(fetch, max_batch=2)
+    first, _, third = loader.load(1), loader.load(2), loader.load(3)
+    assert first() == 10
+    assert loader.load(2)() == 20
+    with pytest.raises(RuntimeError, match="batch 2 failed"):
+        third()
+
+
+def test_threads_settle_futures_on_their_loop():
+    """Test a thread dispatching keys awaited on a loop does not touch the loop directly."""
+    loader = Loader(lambda keys: [key + 1 for key in keys])
+
+    async def main():
+        task = asyncio.ensure_future(loader.load_async(1))
+        await asyncio.sleep(0)  # task is now awaiting; its dispatch is queued
+        worker = threading.Thread(target=loader.dispatch)
+        worker.start()
+        worker.join()
+        return await asyncio.wait_for(task, 5)
+
+    assert asyncio.run(main(), debug=True) == 2
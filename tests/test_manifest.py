@@ -0,0 +1,84 @@
+"""Tests for the SQLite metadata manifest."""
+import json
+import os
+
+from bricks.manifest import MetadataStore
+
+
+def make_brick(root, name, deps=(), outputs=("error",), score=None):
+    """Write a brick and its .meta.json sidecar under root."""
+    (root / f"{name}.py").write_text(f"def {name}():\n    return {{'error': None}}\n")
+    meta = {"brick_id": f"{name}_v1",
+            "interface": {"inputs": {"value": "any"},
+                          "outputs": {field: "any" for field in outputs}},
+            "dependencies": list(deps), "inspector_score": score}
+    (root / f"{name}.meta.json").write_text(json.dumps(meta))
+
+
+def ids(rows):
+    """Return the brick_ids of query rows."""
+    return [row["brick_id"] for row in rows]
+
+
+def test_queries_use_indexed_metadata(tmp_path):
+    """Test lookups by dependency, interface field, id and score."""
+    make_brick(tmp_path, "fetch", deps=["requests"], score=90)
+    (tmp_path / "sub").mkdir()
+    make_brick(tmp_path / "sub", "parse", outputs=("data",), score=60)
+
+    with MetadataStore(tmp_path) as store:
+        assert store.sync() == {"added": 2, "updated": 0, "unchanged": 0, "removed": 0}
+        assert ids(store.depends_on("requests")) == ["fetch_v1"]
+        assert ids(store.with_field("error", "outputs")) == ["fetch_v1"]
+        assert ids(store.with_field("value")) == ["fetch_v1", "parse_v1"]
+        assert ids(store.with_field("value", "outputs")) == []
+        assert store.find(brick_id="parse_v1")[0]["path"] == "sub/parse.py"
+        assert ids(store.find(min_score=70)) == ["fetch_v1"]
+        assert ids(store.find(field="value", max_score=70)) == ["parse_v1"]
+        assert store.metadata("fetch_v1")["dependencies"] == ["requests"]
+
+
+def test_sync_is_incremental(tmp_path):
+    """Test only changed, new and deleted sidecars are touched."""
+    make_brick(tmp_path, "fetch", deps=["requests"])
+    make_brick(tmp_path, "parse")
+    make_brick(tmp_path, "store")
+
+    with MetadataStore(tmp_path) as store:
+        store.sync()
+        assert store.sync()["unchanged"] == 3
+
+        # Touched but identical content is refreshed without re-parsing
+        meta = tmp_path / "parse.meta.json"
+        os.utime(meta, ns=(0, 0))
+        make_brick(tmp_path, "fetch", deps=["httpx"])
+        (tmp_path / "store.meta.json").unlink()
+        make_brick(tmp_path, "cache")
+        assert store.sync() == {"added": 1, "updated": 1, "unchanged": 1, "removed": 1}
+
+        assert store.depends_on("requests") == []
+        assert ids(store.depends_on("httpx")) == ["fetch_v1"]
+        assert ids(store.find()) == ["cache_v1", "fetch_v1", "parse_v1"]
+
+
+def test_scorer_fills_missing_scores_once(tmp_path):
+    """Test the scorer runs for unscored bricks and again only on source change."""
+    make_brick(tmp_path, "fetch")
+    make_brick(tmp_path, "parse", score=55)
+    scored = []
+
+    def scorer(path):
+        scored.append(path.name)
+        return 80
+
+    with MetadataStore(tmp_path, tmp_path / "manifest.db") as store:
+        store.sync()
+        store.sync(scorer)
+        store.sync(scorer)
+        assert scored == ["fetch.py"]
+        assert ids(store.find(min_score=80)) == ["fetch_v1"]
+
+        (tmp_path / "fetch.py").write_text("def fetch():\n    return {}\n")
+        store.sync(scorer)
+        assert scored == ["fetch.py", "fetch.py"]
+        assert ids(store.find(max_score=55)) == ["parse_v1"]
@@ -0,0 +1,116 @@
+"""Tests for brick runtime metrics."""
+import gc
+import json
+import threading
+import urllib.request
+
+import pytest
+
+from bricks.metrics import Metrics, bucket_bounds, bucket_index
+from bricks.registry import BrickRegistry
+
+
+def test_buckets_cover_values_with_bounded_error():
+    """Test every value lands in a bucket whose range contains it."""
+    previous = -1
+    for ns in list(range(200)) + [10 ** k + 7 for k in range(3, 18)]:
+        index = bucket_index(ns)
+        low, high = bucket_bounds(index)
+        assert low <= ns < high
+        assert (high - low) / max(low, 1) <= 1 / 16 or ns < 16
+        assert index >= previous
+        previous = index
+
+
+def test_wrap_counts_calls_errors_and_exceptions():
+    """Test error envelopes and exceptions are both counted as failures."""
+    metrics = Metrics()
+
+    @metrics.instrument("lookup_v1")
+    def lookup(key):
+        if key == "boom":
+            raise KeyError(key)
+        return {"value": key, "error": "missing" if key == "x" else None}
+
+    assert lookup("a") == {"value": "a", "error": None}
+    lookup("x")
+    with pytest.raises(KeyError):
+        lookup("boom")
+
+    entry = metrics.snapshot()["lookup_v1"]
+    assert (entry["calls"], entry["errors"]) == (3, 2)
+    assert entry["total_ns"] > 0
+    assert 0 < entry["quantiles"][0.5] <= entry["quantiles"][0.99]
+    assert lookup.__name__ == "lookup"
+
+    metrics.reset()
+    lookup("a")
+    assert metrics.snapshot()["lookup_v1"]["calls"] == 1
+
+
+def test_threads_record_into_separate_shards():
+    """Test concurrent callers lose no counts."""
+    metrics = Metrics()
+    brick = metrics.wrap(lambda: {"error": None}, "noop_v1")
+
+    def worker():
+        for _ in range(2000):
+            brick()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.snapshot()["noop_v1"]["calls"] == 8000
+
+
+def test_exited_threads_are_folded_into_the_total():
+    """Test short-lived threads do not leave a shard each behind."""
+    metrics = Metrics()
+    brick = metrics.wrap(lambda: {"error": None}, "noop_v1")
+    for _ in range(50):
+        thread = threading.Thread(target=lambda: [brick() for _ in range(10)])
+        thread.start()
+        thread.join()
+    gc.collect()
+    assert len(metrics._shards) <= 1
+    assert metrics.snapshot()["noop_v1"]["calls"] == 500
+    metrics.reset()
+    assert metrics.snapshot()["noop_v1"]["calls"] == 0
+
+
+def test_prometheus_export_file_and_http(tmp_path):
+    """Test the text format is written to a file and served over HTTP."""
+    metrics = Metrics()
+    metrics.record("http_get_v1", 2_000_000)
+    metrics.record("http_get_v1", 4_000_000, failed=True)
+
+    path = tmp_path / "bricks.prom"
+    metrics.write_textfile(path)
+    text = path.read_text()
+    assert 'brick_calls_total{brick_id="http_get_v1"} 2' in text
+    assert 'brick_errors_total{brick_id="http_get_v1"} 1' in text
+    assert 'brick_latency_seconds_sum{brick_id="http_get_v1"} 0.006000000' in text
+    assert "# TYPE brick_latency_seconds summary" in text
+
+    server = metrics.serve(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.read().decode() == metrics.to_prometheus()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_registry_wrapper_instruments_lazy_bricks(tmp_path):
+    """Test metrics.wrap applies to bricks loaded through the registry."""
+    (tmp_path / "double.py").write_text("def double(x):\n    return {'value': x * 2, 'error': None}\n")
+    (tmp_path / "double.meta.json").write_text(json.dumps({"brick_id": "double_v1"}))
+    metrics = Metrics()
+
+    registry = BrickRegistry.open(tmp_path)
+    registry.add_wrapper(metrics.wrap)
+    assert registry["double_v1"](4)["value"] == 8
+    assert metrics.snapshot()["double_v1"]["calls"] == 1
@@ -0,0 +1,55 @@
+"""Tests for phase profiling hooks."""
+import io
+import pstats
+from pathlib import Path
+
+from bricks.inspector import inspect_brick
+from tools import profiling
+from tools.profiling import Profiler, phase
+
+BRICK = Path(__file__).parent.parent / "examples" / "api" / "http_get.py"
+
+
+def test_phase_is_noop_without_hooks():
+    """Test phases run their body and report nothing when disabled."""
+    assert profiling.enabled() is False
+    with phase("idle"):
+        value = 1
+    assert value == 1
+
+
+def test_hook_receives_inspector_phases():
+    """Test a CI hook sees every inspector phase."""
+    seen = []
+    hook = lambda name, seconds, peak: seen.append(name)
+    profiling.add_hook(hook)
+    try:
+        inspect_brick(BRICK)
+    finally:
+        profiling.remove_hook(hook)
+    for name in ["file read", "ast.parse", "metadata load", "inspect_security",
+                 "inspect_contract", "inspect_quality", "inspect_dependencies", "inspect_performance"]:
+        assert name in seen
+    assert not profiling.enabled()
+
+
+def test_profiler_measures_nested_peaks(tmp_path):
+    """Test outer phases include the allocation peak of inner phases."""
+    stats = tmp_path / "run.pstats"
+    with Profiler(pstats_path=str(stats)) as profiler:
+        with phase("outer"):
+            with phase("inner"):
+                block = bytearray(2 * 1024 * 1024)
+            del block
+            with phase("inner"):
+                pass
+    results = profiler.results()
+    assert results["inner"]["calls"] == 2
+    assert results["inner"]["peak_bytes"] >= 2 * 1024 * 1024
+    assert results["outer"]["peak_bytes"] >= results["inner"]["peak_bytes"]
+    assert results["outer"]["seconds"] >= results["inner"]["seconds"]
+    pstats.Stats(str(stats))
+
+    out = io.StringIO()
+    profiler.print_report(file=out)
+    assert "inner" in out.getvalue() and "peak KiB" in out.getvalue()
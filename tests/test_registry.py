@@ -0,0 +1,118 @@
+"""Tests for the brick registry."""
+import json
+import sys
+
+from bricks.registry import BrickRegistry
+
+
+def make_brick(root, name, body, deps=()):
+    """Write a brick and its .meta.json sidecar under root."""
+    (root / f"{name}.py").write_text(body)
+    meta = {"brick_id": f"{name}_v1", "interface": {"inputs": {}, "outputs": {}},
+            "dependencies": list(deps), "tests": [f"test_{name}"]}
+    (root / f"{name}.meta.json").write_text(json.dumps(meta))
+
+
+def test_scan_builds_index(tmp_path):
+    """Test every brick with metadata is indexed."""
+    make_brick(tmp_path, "double", "def double(x):\n    return {'value': x * 2}\n")
+    (tmp_path / "sub").mkdir()
+    make_brick(tmp_path / "sub", "negate", "def negate(x):\n    return -x\n", ["json"])
+    (tmp_path / "sub" / "test_negate.py").write_text("")
+    (tmp_path / "orphan.meta.json").write_text("{}")
+
+    registry = BrickRegistry.open(tmp_path)
+    assert sorted(registry) == ["double_v1", "negate_v1"]
+    entry = registry.entries["negate_v1"]
+    assert entry["path"] == "sub/negate.py"
+    assert entry["dependencies"] == ["json"]
+    assert entry["test_file"] == "sub/test_negate.py"
+    assert entry["hash"].startswith("sha256:")
+
+
+def test_index_is_persisted(tmp_path):
+    """Test a second open reads the index instead of rescanning."""
+    make_brick(tmp_path, "double", "def double(x):\n    return x * 2\n")
+    BrickRegistry.open(tmp_path)
+    (tmp_path / "double.meta.json").write_text(json.dumps({"brick_id": "renamed_v1"}))
+
+    registry = BrickRegistry.open(tmp_path)
+    assert "double_v1" in registry
+    assert list(BrickRegistry.open(tmp_path, rebuild=True)) == ["renamed_v1"]
+
+
+def test_index_rescans_when_bricks_added_or_deleted(tmp_path):
+    """Test a persisted index is not reused once the set of bricks on disk changes."""
+    make_brick(tmp_path, "double", "def double(x):\n    return x * 2\n")
+    BrickRegistry.open(tmp_path)
+
+    make_brick(tmp_path, "negate", "def negate(x):\n    return -x\n")
+    assert sorted(BrickRegistry.open(tmp_path)) == ["double_v1", "negate_v1"]
+    (tmp_path / "double.py").unlink()
+    assert list(BrickRegistry.open(tmp_path)) == ["negate_v1"]
+    (tmp_path / "negate.meta.json").unlink()
+    assert len(BrickRegistry.open(tmp_path)) == 0
+
+
+def test_bricks_are_imported_lazily(tmp_path):
+    """Test brick modules are only imported on first call."""
+    marker = "brick_registry_heavy_marker"
+    body = (f"import sys\nsys.modules['{marker}'] = True\n\n"
+            "def heavy(x):\n    return {'value': x + 1}\n")
+    make_brick(tmp_path, "heavy", body)
+
+    registry = BrickRegistry.open(tmp_path)
+    brick = registry["heavy_v1"]
+    assert marker not in sys.modules
+    assert brick.loaded is False
+
+    assert brick(1) == {"value": 2}
+    assert marker in sys.modules
+    assert registry.get("heavy_v1") is brick
+    sys.modules.pop(marker)
+
+
+def test_composed_brick_imports_siblings(tmp_path):
+    """Test a brick importing a sibling by module name leaves sys.path and sys.modules as found."""
+    make_brick(tmp_path, "reg_base", "def reg_base(x):\n    return x + 1\n")
+    make_brick(tmp_path, "reg_composed", "from reg_base import reg_base\n\n\n"
+                                         "def reg_composed(x):\n    return reg_base(x) * 2\n")
+    path = list(sys.path)
+    assert BrickRegistry.open(tmp_path).get("reg_composed_v1")(3) == 8
+    assert sys.path == path
+    assert "reg_base" not in sys.modules
+
+
+def test_sibling_names_do_not_collide_with_host(tmp_path):
+    """Test a host module sharing a sibling's name is neither used by the brick nor replaced."""
+    host = type(sys)("reg_shared")
+    sys.modules["reg_shared"] = host
+    make_brick(tmp_path, "reg_shared", "def reg_shared():\n    return 'sibling'\n")
+    make_brick(tmp_path, "reg_user", "from reg_shared import reg_shared\n\n\n"
+                                     "def reg_user():\n    return reg_shared()\n")
+    try:
+        assert BrickRegistry.open(tmp_path).get("reg_user_v1")() == "sibling"
+        assert sys.modules["reg_shared"] is host
+    finally:
+        sys.modules.pop("reg_shared", None)
+
+
+def test_stale_detects_changed_source(tmp_path):
+    """Test hash mismatch reports the brick as stale."""
+    make_brick(tmp_path, "double", "def double(x):\n    return x * 2\n")
+    registry = BrickRegistry.open(tmp_path)
+    assert registry.stale() == []
+    (tmp_path / "double.py").write_text("def double(x):\n    return x + x\n")
+    assert registry.stale() == ["double_v1"]
+
+
+def test_examples_tree_indexes_without_imports():
+    """Test the shipped examples index without importing third-party deps."""
+    from pathlib import Path
+    root = Path(__file__).parent.parent / "examples"
+    modules = set(sys.modules)
+    registry = BrickRegistry(root)
+    registry.scan()
+    assert set(sys.modules) == modules
+    assert "http_get_v1" in registry
+    assert "bcrypt" in registry.entries["auth_hash_password_v1"]["dependencies"]
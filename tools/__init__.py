@@ -0,0 +1 @@
+"""Brick CLI command modules and inspectors."""
@@ -0,0 +1,114 @@
+"""Map a git diff to the bricks it affects, including their dependents."""
+
+import ast
+import json
+import re
+import subprocess
+from collections import defaultdict, deque
+from pathlib import Path
+
+from tools.inspect_dependencies import imported_modules
+
+
+VERSION_SUFFIX = re.compile(r"_v\d+$")
+
+
+class GitError(Exception):
+    """Raised when git cannot produce the list of changed files."""
+
+
+def changed_files(ref, cwd="."):
+    """
+    Return absolute paths changed since ref (committed, staged, unstaged
+    and untracked files).
+    """
+    top = _git(["rev-parse", "--show-toplevel"], cwd).strip()
+    names = _git(["diff", "--name-only", ref, "--"], top).splitlines()
+    names += _git(["ls-files", "--others", "--exclude-standard"], top).splitlines()
+    return sorted({(Path(top) / name).resolve() for name in names if name})
+
+
+def affected_bricks(ref, bricks):
+    """
+    Select the bricks affected by changes since ref.
+
+    Args:
+        ref: Git ref to diff against (e.g. origin/main)
+        bricks: Candidate brick files (non-test .py files)
+
+    Returns:
+        list[Path]: Changed bricks plus every brick that imports them or
+        lists them in its metadata dependencies, in the input order. A
+        deleted or renamed brick selects the bricks that still import it.
+    """
+    bricks = [Path(b) for b in bricks]
+    if not bricks:
+        return []
+    by_path = {b.resolve(): b for b in bricks}
+    paths = [brick_for_change(p) for p in changed_files(ref, bricks[0].parent)]
+    changed = {by_path[p] for p in paths if p in by_path}
+    gone = {p.stem for p in paths if p.suffix == ".py" and not p.exists()}
+    if gone:
+        changed |= {b for b in bricks if gone & brick_dependencies(b)}
+
+    dependents = dependents_graph(bricks)
+    queue, seen = deque(changed), set(changed)
+    while queue:
+        for dependent in dependents[queue.popleft()]:
+            if dependent not in seen:
+                seen.add(dependent)
+                queue.append(dependent)
+    return [b for b in bricks if b in seen]
+
+
+def brick_for_change(path):
+    """Map a changed .py, .meta.json or test_*.py path to its brick file."""
+    path = Path(path)
+    if path.name.endswith(".meta.json"):
+        return path.with_name(path.name[:-len(".meta.json")] + ".py")
+    if path.name.startswith("test_") and path.suffix == ".py":
+        return path.with_name(path.name[len("test_"):])
+    return path
+
+
+def dependents_graph(bricks):
+    """Return {brick: [bricks that depend on it]} from imports and metadata."""
+    by_name = defaultdict(list)
+    for brick in bricks:
+        by_name[brick.stem].append(brick)
+
+    dependents = defaultdict(list)
+    for brick in bricks:
+        for name in brick_dependencies(brick):
+            for dependency in by_name.get(name, []):
+                if dependency != brick:
+                    dependents[dependency].append(brick)
+    return dependents
+
+
+def brick_dependencies(brick):
+    """Return module names a brick imports or declares in .meta.json."""
+    names = set()
+    try:
+        tree = ast.parse(brick.read_text())
+        names.update(m.split(".")[-1] for m in imported_modules(tree) if m)
+    except (OSError, SyntaxError):
+        pass
+    try:
+        metadata = json.loads(brick.with_suffix(".meta.json").read_text())
+        for dep in metadata.get("dependencies", []):
+            names.add(VERSION_SUFFIX.sub("", dep))
+    except (OSError, ValueError, AttributeError, TypeError):
+        pass
+    return names
+
+
+def _git(argv, cwd):
+    """Run a git command and return stdout, raising GitError on failure."""
+    try:
+        proc = subprocess.run(["git", *argv], cwd=cwd, capture_output=True, text=True)
+    except OSError as e:
+        raise GitError(f"git not available: {e}")
+    if proc.returncode != 0:
+        raise GitError(proc.stderr.strip() or f"git {' '.join(argv)} failed")
+    return proc.stdout
@@ -0,0 +1,251 @@
+"""CLI command: Micro-benchmark a brick against its stored baseline."""
+
+import ast
+import json
+import time
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+from bricks.registry import LazyBrick
+from tools.inspect_dependencies import imported_modules
+
+
+BASELINE_FILE = ".brick_bench.json"
+# Each sample runs enough iterations to take at least this long
+MIN_SAMPLE_NS = 200_000
+MAX_LOOPS = 1000
+# Bricks importing these (directly or through a sibling brick) reach the
+# network, so cases lifted from their tests are not replayed
+NETWORK_MODULES = frozenset({"socket", "ssl", "http.client", "urllib.request", "requests",
+                             "httpx", "aiohttp", "smtplib", "ftplib"})
+
+
+def run(args):
+    """
+    Benchmark bricks and fail on p50/p99 regressions.
+
+    Args:
+        args: Namespace with brick_file (path or list of paths) and
+              optional samples, warmup, threshold, baseline and update
+    """
+    paths = args.brick_file if isinstance(args.brick_file, list) else [args.brick_file]
+    baseline_path = Path(getattr(args, "baseline", None) or BASELINE_FILE)
+    baselines = load_baselines(baseline_path)
+    threshold = getattr(args, "threshold", 0.2)
+    update = getattr(args, "update", False)
+
+    code, changed = 0, False
+    for brick_file in map(Path, paths):
+        result = bench_one(brick_file, getattr(args, "samples", 30), getattr(args, "warmup", 3))
+        if result["skipped"]:
+            print(f"- {brick_file}: skipped ({result['skipped']})")
+            continue
+        if result["error"]:
+            print(f"✗ {brick_file}: {result['error']}")
+            code = 1
+            continue
+        brick_id = result["brick_id"]
+        print(f"{brick_id}: p50 {_fmt(result['p50_ns'])}  p99 {_fmt(result['p99_ns'])}  "
+              f"({result['cases']} cases, {result['samples']} samples, "
+              f"{result['rejected']} outliers rejected)")
+
+        baseline = baselines.get(brick_id)
+        if baseline is None or update:
+            baselines[brick_id] = {"p50_ns": result["p50_ns"], "p99_ns": result["p99_ns"]}
+            changed = True
+            print(f"  baseline {'updated' if baseline else 'recorded'}")
+            continue
+        regressions = compare(baseline, result, threshold)
+        for regression in regressions:
+            print(f"  ✗ {regression}")
+        if regressions:
+            code = 1
+        else:
+            print(f"  ✓ within {threshold:.0%} of baseline")
+
+    if changed:
+        baseline_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+    return code
+
+
+def load_baselines(path):
+    """Return {brick_id: {p50_ns, p99_ns}} from the baseline file."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def compare(baseline, result, threshold):
+    """Return a message per percentile that regressed beyond threshold."""
+    regressions = []
+    for key in ("p50_ns", "p99_ns"):
+        limit = baseline[key] * (1 + threshold)
+        if result[key] > limit:
+            change = result[key] / baseline[key] - 1
+            regressions.append(f"{key[:3]} regressed {change:+.0%}: "
+                               f"{_fmt(baseline[key])} -> {_fmt(result[key])}")
+    return regressions
+
+
+def bench_one(brick_file, samples=30, warmup=3):
+    """
+    Time one brick over its benchmark cases.
+
+    p50 is taken after Tukey outlier rejection; p99 is taken over every
+    timed call, so tail-latency regressions stay visible.
+
+    Returns: {brick_id, cases, samples, rejected, p50_ns, p99_ns, error, skipped}
+    """
+    result = {"brick_id": brick_file.stem, "cases": 0, "samples": 0, "rejected": 0,
+              "p50_ns": 0, "p99_ns": 0, "error": None, "skipped": None}
+    metadata = _metadata(brick_file)
+    result["brick_id"] = metadata.get("brick_id", brick_file.stem)
+    if not metadata.get("benchmarks") and needs_network(brick_file):
+        result["skipped"] = "needs network; declare 'benchmarks' in .meta.json to opt in"
+        return result
+    cases = benchmark_cases(brick_file, metadata)
+    if not cases:
+        result["error"] = "No benchmark cases (add 'benchmarks' to .meta.json or literal calls to tests)"
+        return result
+    result["cases"] = len(cases)
+
+    try:
+        func = LazyBrick(result["brick_id"], brick_file, brick_file.stem).load()
+        timings = measure(func, cases, samples, warmup)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    kept = reject_outliers(timings)
+    result.update(samples=len(timings), rejected=len(timings) - len(kept),
+                  p50_ns=percentile(kept, 0.5), p99_ns=percentile(sorted(timings), 0.99))
+    return result
+
+
+def needs_network(brick_file, seen=None):
+    """True if the brick, or a sibling brick it imports, imports a network module."""
+    seen = set() if seen is None else seen
+    seen.add(brick_file)
+    try:
+        modules = [m for m in imported_modules(ast.parse(brick_file.read_text())) if m]
+    except (OSError, SyntaxError):
+        return False
+    for module in modules:
+        if module in NETWORK_MODULES or module.split(".")[0] in NETWORK_MODULES:
+            return True
+        sibling = brick_file.parent / f"{module}.py"
+        if sibling not in seen and sibling.exists() and needs_network(sibling, seen):
+            return True
+    return False
+
+
+def benchmark_cases(brick_file, metadata):
+    """
+    Return [(args, kwargs)] from .meta.json "benchmarks" entries, or else
+    from calls to the brick in its tests whose arguments are all literals.
+    """
+    declared = metadata.get("benchmarks")
+    if declared:
+        return [(tuple(case.get("args", ())), dict(case.get("kwargs", {}))) for case in declared]
+
+    cases = []
+    for source in (brick_file.parent / f"test_{brick_file.name}", brick_file):
+        try:
+            tree = ast.parse(source.read_text())
+        except (OSError, SyntaxError):
+            continue
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                    and node.func.id == brick_file.stem):
+                case = _literal_case(node)
+                if case is not None and case not in cases:
+                    cases.append(case)
+    return cases
+
+
+def measure(func, cases, samples, warmup):
+    """
+    Return the ns of every individually timed call. A sample runs every
+    case enough times (calibrated during warmup, at most MAX_LOOPS) to
+    exceed MIN_SAMPLE_NS. Iterators a streaming brick returns are drained
+    inside the timed call, so their work is measured, not just their setup.
+    """
+    clock = time.perf_counter_ns
+
+    def one_pass(loops, timings):
+        for _ in range(loops):
+            for args, kwargs in cases:
+                start = clock()
+                _drain(func(*args, **kwargs))
+                timings.append(clock() - start)
+
+    loops = 1
+    for _ in range(warmup):
+        warm = []
+        one_pass(loops, warm)
+        while sum(warm) < MIN_SAMPLE_NS and loops < MAX_LOOPS:
+            loops *= 2
+            warm = []
+            one_pass(loops, warm)
+    timings = []
+    for _ in range(samples):
+        one_pass(loops, timings)
+    return timings
+
+
+def reject_outliers(timings):
+    """Drop samples outside Tukey's fences (1.5 IQR beyond the quartiles)."""
+    if len(timings) < 4:
+        return sorted(timings)
+    ordered = sorted(timings)
+    q1, q3 = percentile(ordered, 0.25), percentile(ordered, 0.75)
+    fence = 1.5 * (q3 - q1)
+    return [t for t in ordered if q1 - fence <= t <= q3 + fence]
+
+
+def percentile(ordered, q):
+    """Linearly interpolated percentile of a sorted list."""
+    if not ordered:
+        return 0
+    position = (len(ordered) - 1) * q
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _drain(result):
+    """Exhaust an iterator result, or the iterators in an envelope's values."""
+    for value in result.values() if isinstance(result, dict) else (result,):
+        if isinstance(value, Iterator):
+            deque(value, maxlen=0)
+
+
+def _literal_case(call):
+    """Return (args, kwargs) if every argument is a literal, else None."""
+    try:
+        args = tuple(ast.literal_eval(a) for a in call.args)
+        kwargs = {k.arg: ast.literal_eval(k.value) for k in call.keywords}
+    except (ValueError, TypeError):
+        return None
+    if None in kwargs:
+        return None
+    return args, kwargs
+
+
+def _metadata(brick_file):
+    """Return the brick's .meta.json dict, or {}."""
+    try:
+        return json.loads(brick_file.with_suffix(".meta.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _fmt(ns):
+    """Format nanoseconds with a readable unit."""
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} µs"
+    return f"{ns:.0f} ns"
@@ -0,0 +1,264 @@
+"""CLI command: Find exact and near-duplicate bricks and tests."""
+
+import ast
+import builtins
+import hashlib
+import json
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+from tools.profiling import phase
+
+
+NUM_BINS = 64
+BANDS = 16
+ROWS = NUM_BINS // BANDS
+SHINGLE = 5
+_MASK = (1 << 64) - 1
+_TOKEN = re.compile(r"\w+")
+
+
+def run(args):
+    """
+    Report duplicate bricks and tests.
+
+    Args:
+        args: Namespace with paths (files or directories), optional
+              threshold (0-1 similarity) and format (text, json)
+    """
+    paths = args.paths if isinstance(args.paths, list) else [args.paths]
+    threshold = getattr(args, "threshold", 0.8)
+    report = find_duplicates(collect_sources(paths), threshold)
+
+    if getattr(args, "format", "text") == "json":
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"Scanned {report['files']} files")
+    for group in report["exact"]:
+        kind = "identical" if group["identical"] else "same structure"
+        print(f"\n= Exact duplicates ({kind}):")
+        for path in group["files"]:
+            print(f"  • {path}")
+    for cluster in report["near"]:
+        print(f"\n≈ Near duplicates (≥{cluster['similarity']:.0%} similar):")
+        for path in cluster["files"]:
+            print(f"  • {path}")
+    if not report["exact"] and not report["near"]:
+        print("\n✓ No duplicates found")
+    else:
+        print(f"\n{len(report['skip'])} files can be skipped as identical copies")
+    return 0
+
+
+def collect_sources(paths):
+    """Expand directories into .py files (bricks and tests), sorted."""
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.rglob("*.py")) if path.is_dir() else [path])
+    return files
+
+
+def find_duplicates(files, threshold=0.8):
+    """
+    Group exact duplicates by normalised AST hash and pair near duplicates
+    via MinHash signatures and LSH banding.
+
+    Returns: {files: int, exact: list, near: list, skip: list}
+    """
+    fingerprints = {}
+    for path in files:
+        with phase("fingerprint"):
+            fingerprint = fingerprint_file(path)
+        if fingerprint is not None:
+            fingerprints[str(path)] = fingerprint
+
+    by_hash = defaultdict(list)
+    for path, fp in fingerprints.items():
+        by_hash[fp["ast_hash"]].append(path)
+    exact = [{"files": group,
+              "identical": len({fingerprints[p]["sha256"] for p in group}) == 1}
+             for group in by_hash.values() if len(group) > 1]
+
+    # Only one representative per exact group takes part in near matching
+    representatives = {group[0]: fingerprints[group[0]]["minhash"]
+                       for group in by_hash.values()}
+    with phase("lsh"):
+        near = near_duplicates(representatives, threshold)
+
+    # Only byte-identical copies are safe to skip; same-structure files can
+    # still differ in literals
+    skip = []
+    for group in exact:
+        seen = set()
+        for path in group["files"]:
+            digest = fingerprints[path]["sha256"]
+            if digest in seen:
+                skip.append(path)
+            seen.add(digest)
+    return {"files": len(fingerprints), "exact": exact, "near": near, "skip": skip}
+
+
+def fingerprint_file(path):
+    """Return {sha256, ast_hash, minhash} for a Python file, or None if unparsable."""
+    try:
+        raw = Path(path).read_bytes()
+        tree = ast.parse(raw)
+    except (OSError, SyntaxError, ValueError):
+        return None
+    normalised = ast.dump(Normaliser().visit(tree), annotate_fields=False)
+    return {
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "ast_hash": hashlib.sha256(normalised.encode()).hexdigest(),
+        "minhash": minhash(_TOKEN.findall(normalised)),
+    }
+
+
+class Normaliser(ast.NodeTransformer):
+    """
+    Canonicalise local identifiers (in first-seen order), literals and
+    docstrings. Imported names, builtins the module does not rebind and
+    attribute names are kept, so ``len(x)`` and ``eval(x)`` or
+    ``json.dumps`` and ``pickle.dumps`` still differ.
+    """
+
+    def __init__(self):
+        self.names = {}
+        self.kept = frozenset()
+
+    def canonical(self, name):
+        """Map an identifier to a positional placeholder."""
+        if name in self.kept:
+            return name
+        return self.names.setdefault(name, f"v{len(self.names)}")
+
+    def visit_Name(self, node):
+        node.id = self.canonical(node.id)
+        return node
+
+    def visit_arg(self, node):
+        node.arg = self.canonical(node.arg)
+        node.annotation = None
+        return node
+
+    def visit_FunctionDef(self, node):
+        node.name = self.canonical(node.name)
+        if ast.get_docstring(node, clean=False) is not None:
+            node.body = node.body[1:] or [ast.Pass()]
+        self.generic_visit(node)
+        return node
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        node.name = self.canonical(node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_Module(self, node):
+        imported, bound = set(), set()
+        for child in ast.walk(node):
+            if isinstance(child, (ast.Import, ast.ImportFrom)):
+                imported.update((a.asname or a.name).split(".")[0] for a in child.names)
+            elif isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load):
+                bound.add(child.id)
+            elif isinstance(child, ast.arg):
+                bound.add(child.arg)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bound.add(child.name)
+        self.kept = frozenset(imported | (set(dir(builtins)) - bound))
+        if ast.get_docstring(node, clean=False) is not None:
+            node.body = node.body[1:]
+        self.generic_visit(node)
+        return node
+
+    def visit_Constant(self, node):
+        return ast.Constant(value=type(node.value).__name__)
+
+
+def minhash(tokens):
+    """
+    One-permutation MinHash: hash each distinct shingle once (crc32, so
+    signatures are stable across runs), keep the minimum per bin, then fill
+    empty bins from the next non-empty one. Linear in the number of tokens.
+    """
+    bins = [None] * NUM_BINS
+    shingles = set(zip(*[tokens[i:] for i in range(SHINGLE)])) or {tuple(tokens)}
+    for shingle in shingles:
+        value = zlib.crc32(" ".join(shingle).encode())
+        slot = value % NUM_BINS
+        if bins[slot] is None or value < bins[slot]:
+            bins[slot] = value
+    filled = [b for b in bins if b is not None]
+    if not filled:
+        return [0] * NUM_BINS
+    for slot in range(NUM_BINS):
+        offset = 1
+        while bins[slot] is None:
+            donor = bins[(slot + offset) % NUM_BINS]
+            if donor is not None:
+                bins[slot] = (donor + offset * 0x9E3779B97F4A7C15) & _MASK
+            offset += 1
+    return bins
+
+
+def similarity(left, right):
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return sum(a == b for a, b in zip(left, right)) / NUM_BINS
+
+
+def near_duplicates(signatures, threshold):
+    """
+    Cluster files whose similarity reaches threshold using LSH banding.
+
+    Each bucket member is compared with the bucket's first member only and
+    matches are merged with union-find, so work stays near-linear even when
+    thousands of files share a bucket.
+
+    Returns: [{files: list, similarity: float}] where similarity is the
+    weakest link that joined the cluster
+    """
+    buckets = defaultdict(list)
+    for path, signature in signatures.items():
+        for band in range(BANDS):
+            key = (band, tuple(signature[band * ROWS:(band + 1) * ROWS]))
+            buckets[key].append(path)
+
+    parent = {}
+
+    def find(path):
+        """Return the cluster root for path, compressing the chain."""
+        root = path
+        while root in parent:
+            root = parent[root]
+        while path != root:
+            parent[path], path = root, parent[path]
+        return root
+
+    checked, links = set(), []
+    for members in buckets.values():
+        anchor = members[0]
+        for other in members[1:]:
+            if (anchor, other) in checked:
+                continue
+            checked.add((anchor, other))
+            score = similarity(signatures[anchor], signatures[other])
+            if score >= threshold:
+                root, other_root = find(anchor), find(other)
+                if root != other_root:
+                    parent[other_root] = root
+                links.append((anchor, score))
+
+    clusters = defaultdict(list)
+    for path in signatures:
+        clusters[find(path)].append(path)
+    weakest = {}
+    for anchor, score in links:
+        root = find(anchor)
+        weakest[root] = min(score, weakest.get(root, 1.0))
+    near = [{"files": sorted(files), "similarity": weakest[root]}
+            for root, files in clusters.items() if len(files) > 1]
+    near.sort(key=lambda cluster: (-cluster["similarity"], cluster["files"]))
+    return near
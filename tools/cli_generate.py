@@ -1,34 +1,47 @@
 """CLI command: Generate brick from specification."""
 
 import json
-import yaml
 import hashlib
+import os
 from pathlib import Path
 from datetime import datetime
 
 
+SPEC_SUFFIXES = (".yaml", ".yml", ".json")
+PARALLEL_THRESHOLD = 16
+
+
 def run(args):
     """
-    Generate brick from specification file.
+    Generate brick metadata from one spec file or a directory of specs.
 
     Args:
-        args: Namespace with brick_name, spec attributes
+        args: Namespace with brick_name and spec, or spec_dir (plus
+              optional jobs and force), and output attributes
     """
+    output_dir = Path(args.output) if hasattr(args, "output") else Path(".")
+    if getattr(args, "spec_dir", None):
+        return run_spec_dir(Path(args.spec_dir), output_dir,
+                            getattr(args, "jobs", None), getattr(args, "force", False))
+
     brick_name = args.brick_name
+    if not brick_name:
+        print("Error: brick_name is required with --spec")
+        return 1
     spec_file = Path(args.spec)
-    output_dir = Path(args.output) if hasattr(args, "output") else Path(".")
 
     if not spec_file.exists():
         print(f"Error: Spec file not found: {spec_file}")
         return 1
 
     # Parse specification
-    spec = parse_spec(spec_file)
+    raw = spec_file.read_bytes()
+    spec = parse_spec(spec_file, raw)
     if not spec:
         return 1
 
     # Generate metadata
-    metadata = generate_metadata(spec, spec_file)
+    metadata = generate_metadata(spec, spec_file, raw)
     metadata_path = output_dir / f"{brick_name}.meta.json"
     metadata_path.write_text(json.dumps(metadata, indent=2))
 
@@ -39,22 +52,109 @@ def run(args):
     return 0
 
 
-def parse_spec(spec_file):
-    """Parse YAML or JSON spec file."""
+def run_spec_dir(spec_dir, output_dir, jobs=None, force=False):
+    """Generate metadata for every spec in spec_dir, skipping unchanged ones."""
+    if not spec_dir.is_dir():
+        print(f"Error: Spec directory not found: {spec_dir}")
+        return 1
+    specs = sorted(p for p in spec_dir.iterdir() if p.suffix in SPEC_SUFFIXES)
+    if not specs:
+        print(f"Error: No specs in {spec_dir}")
+        return 1
+
+    results = generate_many(specs, output_dir, jobs, force)
+    counts = {"generated": 0, "unchanged": 0, "error": 0}
+    for result in results:
+        counts[result["status"]] += 1
+        if result["status"] == "generated":
+            print(f"✓ {result['output']}")
+        elif result["status"] == "error":
+            print(f"✗ {result['spec']}: {result['error']}")
+    print(f"\n{counts['generated']} generated, {counts['unchanged']} unchanged, "
+          f"{counts['error']} failed")
+    return 1 if counts["error"] else 0
+
+
+def generate_many(specs, output_dir, jobs=None, force=False):
+    """Run generate_one over specs, using a process pool for large batches."""
+    jobs = jobs or os.cpu_count() or 1
+    arguments = [(spec, output_dir, force) for spec in specs]
+    if jobs == 1 or len(specs) < PARALLEL_THRESHOLD:
+        return [generate_one(*a) for a in arguments]
+    # Imported here: multiprocessing would dominate single-spec startup time
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(specs) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_generate_star, arguments, chunksize=chunksize))
+
+
+def _generate_star(arguments):
+    """Unpack a (spec, output_dir, force) tuple for pool.map."""
+    return generate_one(*arguments)
+
+
+def generate_one(spec_file, output_dir, force=False):
+    """
+    Generate metadata for one spec from a single read of the file.
+
+    The existing .meta.json is left untouched when its prompt_hash
+    already matches the spec, unless force is set.
+
+    Returns: {spec, output, status: generated|unchanged|error, error}
+    """
+    result = {"spec": str(spec_file), "output": None, "status": "error", "error": None}
+    try:
+        raw = Path(spec_file).read_bytes()
+    except OSError as e:
+        result["error"] = str(e)
+        return result
+
+    try:
+        spec = _load(Path(spec_file), raw)
+        metadata = generate_metadata(spec, spec_file, raw)
+    except Exception as e:
+        result["error"] = f"Error parsing spec: {e}"
+        return result
+
+    metadata_path = Path(output_dir) / f"{spec['brick_name']}.meta.json"
+    result["output"] = str(metadata_path)
+    if not force and _existing_hash(metadata_path) == metadata["prompt_hash"]:
+        result["status"] = "unchanged"
+        return result
+    metadata_path.write_text(json.dumps(metadata, indent=2))
+    result["status"] = "generated"
+    return result
+
+
+def _existing_hash(metadata_path):
+    """Return the prompt_hash recorded in a .meta.json, or None."""
+    try:
+        return json.loads(metadata_path.read_text()).get("prompt_hash")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def parse_spec(spec_file, raw=None):
+    """Parse YAML or JSON spec file (from raw bytes when already read)."""
     try:
-        content = spec_file.read_text()
-        if spec_file.suffix in [".yaml", ".yml"]:
-            return yaml.safe_load(content)
-        else:
-            return json.loads(content)
+        return _load(spec_file, spec_file.read_bytes() if raw is None else raw)
     except Exception as e:
         print(f"Error parsing spec: {e}")
         return None
 
 
-def generate_metadata(spec, spec_file):
-    """Generate brick metadata from spec."""
-    spec_hash = hashlib.sha256(spec_file.read_bytes()).hexdigest()
+def _load(spec_file, raw):
+    """Decode raw spec bytes, using libyaml's CSafeLoader when available."""
+    if spec_file.suffix in [".yaml", ".yml"]:
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(raw, Loader=loader)
+    return json.loads(raw)
+
+
+def generate_metadata(spec, spec_file, raw=None):
+    """Generate brick metadata from spec (hashing raw bytes when given)."""
+    spec_hash = hashlib.sha256(Path(spec_file).read_bytes() if raw is None else raw).hexdigest()
     return {
         "brick_id": f"{spec['brick_name']}_v1",
         "generated": datetime.utcnow().isoformat() + "Z",
@@ -0,0 +1,58 @@
+"""CLI command: Build and query the SQLite brick metadata manifest."""
+
+import json
+
+from bricks.manifest import MetadataStore
+
+
+def run(args):
+    """
+    Sync the manifest for a tree, then answer an optional query.
+
+    Args:
+        args: Namespace with root, optional db, rebuild, score, format and
+              query filters (brick_id, depends_on, field, direction,
+              min_score, max_score)
+    """
+    filters = {
+        "brick_id": getattr(args, "brick_id", None),
+        "dependency": getattr(args, "depends_on", None),
+        "field": getattr(args, "field", None),
+        "direction": getattr(args, "direction", None),
+        "min_score": getattr(args, "min_score", None),
+        "max_score": getattr(args, "max_score", None),
+    }
+    querying = any(value is not None for key, value in filters.items() if key != "direction")
+
+    with MetadataStore(args.root, getattr(args, "db", None)) as store:
+        if getattr(args, "rebuild", False):
+            store.clear()
+        scorer = _inspector_score if getattr(args, "score", False) else None
+        stats = store.sync(scorer)
+        rows = store.find(**filters) if querying else None
+
+    as_json = getattr(args, "format", "text") == "json"
+    if rows is None:
+        if as_json:
+            print(json.dumps(stats))
+        else:
+            print(f"✓ Manifest {store.db_path}: {stats['added']} added, "
+                  f"{stats['updated']} updated, {stats['unchanged']} unchanged, "
+                  f"{stats['removed']} removed")
+        return 0
+
+    if as_json:
+        print(json.dumps(rows, indent=2))
+    elif not rows:
+        print("No matching bricks")
+    else:
+        for row in rows:
+            score = "-" if row["inspector_score"] is None else row["inspector_score"]
+            print(f"{row['brick_id']:<36}{score:>5}  {row['path']}")
+    return 0
+
+
+def _inspector_score(path):
+    """Score a brick with the full inspector (imported only when asked)."""
+    from bricks.inspector import inspect_brick
+    return inspect_brick(str(path))["score"]
@@ -1,11 +1,7 @@
 """CLI command: Inspect brick security and quality."""
 
-import sys
-from pathlib import Path
-
-# Add bricks to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "bricks"))
-from inspector import inspect_brick
+from bricks.inspector import inspect_brick
+from tools.cli_validate import bricks_to_run
 
 
 def run(args):
@@ -13,14 +9,23 @@ def run(args):
     Run security and quality inspection.
 
     Args:
-        args: Namespace with brick_file attribute
+        args: Namespace with brick_file (path or list of paths) and
+              optional since (git ref) and plan (bool) attributes
     """
-    brick_file = args.brick_file
+    paths = args.brick_file if isinstance(args.brick_file, list) else [args.brick_file]
+    files, code = bricks_to_run(paths, getattr(args, "since", None), expand=False)
+    if code is not None:
+        return code
+    plan = getattr(args, "plan", False)
+    return max(inspect_one(brick_file, plan) for brick_file in files)
+
 
+def inspect_one(brick_file, plan=False):
+    """Inspect one brick, print the report and return its exit code."""
     print(f"Inspecting: {brick_file}")
     print("=" * 50)
 
-    result = inspect_brick(brick_file)
+    result = inspect_brick(brick_file, plan)
     score = result["score"]
     rating = result["rating"]
     issues = result["issues"]
@@ -0,0 +1,61 @@
+"""CLI command: Flag full table scans and suggest indexes."""
+
+import json
+from pathlib import Path
+
+from tools.inspect_query_plan import PlanError, advise_from_log, advise_from_tests, read_log
+
+
+def run(args):
+    """
+    EXPLAIN the SQL bricks run in their tests, or a recorded query log.
+
+    Args:
+        args: Namespace with brick_file (list of paths) or log and db, plus
+              optional min_rows, create and format attributes
+    """
+    log = getattr(args, "log", None)
+    if log:
+        if not getattr(args, "db", None):
+            print("Error: --log needs --db")
+            return 1
+        min_rows = args.min_rows if args.min_rows is not None else 1000
+        advice = advise_from_log(args.db, read_log(log), min_rows, getattr(args, "create", False))
+    elif args.brick_file:
+        advice = []
+        for brick_file in map(Path, args.brick_file):
+            test_file = brick_file.parent / f"test_{brick_file.name}"
+            if not test_file.exists():
+                print(f"Error: Test file not found for {brick_file.name}")
+                return 1
+            try:
+                advice += advise_from_tests(test_file, args.min_rows or 0)
+            except PlanError as e:
+                print(f"Error: {e}")
+                return 1
+    else:
+        print("Error: Give brick files or --log with --db")
+        return 1
+
+    created = getattr(args, "create", False)
+    if getattr(args, "format", "text") == "json":
+        print(json.dumps(advice, indent=2))
+    else:
+        print_advice(advice, created)
+    errors = any("error" in entry for entry in advice)
+    return 0 if not advice or (created and not errors) else 1
+
+
+def print_advice(advice, created=False):
+    """Print advice in the human-readable format; unexplainable statements are errors."""
+    if not advice:
+        print("✓ No unindexed table scans")
+    for entry in advice:
+        if "error" in entry:
+            print(f"✗ Could not explain: {entry['sql']}")
+            print(f"    error: {entry['error']}")
+            continue
+        print(f"✗ SCAN {entry['table']} ({entry['rows']:,} rows) "
+              f"filtering on {', '.join(entry['filter'])}")
+        print(f"    {entry['sql']}")
+        print(f"    {'created' if created else 'fix'}: {entry['index']}")
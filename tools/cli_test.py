@@ -4,15 +4,27 @@ import subprocess
 import sys
 from pathlib import Path
 
+from tools.cli_validate import bricks_to_run
+
 
 def run(args):
     """
-    Run tests for a brick.
+    Run tests for one or more bricks.
 
     Args:
-        args: Namespace with brick_file attribute
+        args: Namespace with brick_file (path or list of paths) and
+              optional since (git ref) attributes
     """
-    brick_file = Path(args.brick_file)
+    paths = args.brick_file if isinstance(args.brick_file, list) else [args.brick_file]
+    files, code = bricks_to_run(paths, getattr(args, "since", None), expand=False)
+    if code is not None:
+        return code
+    return max(test_one(brick_file) for brick_file in files)
+
+
+def test_one(brick_file):
+    """Run the tests for one brick and return the exit code."""
+    brick_file = Path(brick_file)
 
     if not brick_file.exists():
         print(f"Error: File not found: {brick_file}")
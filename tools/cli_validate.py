@@ -1,52 +1,213 @@
 """CLI command: Validate brick compliance."""
 
 import ast
+import json
+import os
 from pathlib import Path
 
+from tools import profiling
+from tools.profiling import phase
+
+
+# rule_id -> short description, shared by the text, JSON Lines and SARIF output
+RULES = {
+    "BRICK001": "Brick exceeds 50 lines",
+    "BRICK002": "Brick has a syntax error",
+    "BRICK003": "Brick is missing a docstring",
+    "BRICK004": "Brick is missing its .meta.json metadata",
+    "BRICK005": "Brick file not found",
+    "BRICK006": "Brick is not readable UTF-8 text",
+}
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
 
 def run(args):
     """
-    Validate brick meets basic requirements.
+    Validate bricks meet basic requirements.
 
     Args:
-        args: Namespace with brick_file attribute
+        args: Namespace with brick_file (path or list of files/directories),
+              optional format (text, jsonl, sarif), jobs and since attributes
     """
-    brick_file = Path(args.brick_file)
+    paths = args.brick_file if isinstance(args.brick_file, list) else [args.brick_file]
+    output = getattr(args, "format", "text") or "text"
+    files, code = bricks_to_run(paths, getattr(args, "since", None), output=output)
+    if code is not None:
+        if code == 0 and output == "sarif":
+            print(json.dumps(to_sarif([]), indent=2))
+        return code
+    results = validate_many(files, getattr(args, "jobs", None))
 
-    if not brick_file.exists():
-        print(f"Error: File not found: {brick_file}")
-        return 1
+    if output == "jsonl":
+        for result in results:
+            print(json.dumps(result))
+    elif output == "sarif":
+        print(json.dumps(to_sarif(results), indent=2))
+    else:
+        for result in results:
+            print_result(result)
+        if len(results) > 1:
+            failed = sum(1 for r in results if not r["valid"])
+            print(f"\n{len(results) - failed}/{len(results)} bricks valid")
+
+    return 0 if results and all(r["valid"] for r in results) else 1
+
+
+def select_bricks(paths, since=None):
+    """
+    Resolve CLI paths to brick files, narrowed to those affected since a
+    git ref when given. Returns None (after printing why) if nothing to do.
+    """
+    if not paths and not since:
+        print("Error: No brick files given")
+        return None
+    files = collect_bricks(paths or ["."])
+    if since:
+        from tools.affected import affected_bricks
+        files = affected_bricks(since, files)
+    return files
+
+
+def bricks_to_run(paths, since=None, expand=True, output="text"):
+    """
+    Pick the bricks a command should run on, reporting when there are none.
+
+    Without since, paths are used as given unless expand (directories to
+    bricks) is set. "No bricks affected" is only printed for text output.
+
+    Returns: (files, None) to go ahead, or ([], exit code) to stop
+    """
+    files = select_bricks(paths, since) if since or expand else paths
+    if files is None:
+        return [], 1
+    if files:
+        return files, None
+    if since:
+        if output == "text":
+            print(f"✓ No bricks affected since {since}")
+        return [], 0
+    if paths:
+        print(f"Error: No brick files found in {', '.join(map(str, paths))}")
+    else:
+        print("Error: No brick files given")
+    return [], 1
 
+
+def collect_bricks(paths):
+    """Expand directories into brick files (skipping tests and fixtures), keeping order."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(p for p in sorted(path.rglob("*.py"))
+                         if not p.name.startswith("test_")
+                         and p.name not in ("__init__.py", "conftest.py"))
+        else:
+            files.append(path)
+    return files
+
+
+def validate_many(files, jobs=None):
+    """Validate files, using a process pool for large batches."""
+    jobs = jobs or os.cpu_count() or 1
+    # Worker processes cannot report phases, so profiled runs stay serial
+    if jobs == 1 or len(files) < PARALLEL_THRESHOLD or profiling.enabled():
+        return [validate_file(f) for f in files]
+    # Imported here: multiprocessing would dominate single-file startup time
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(validate_file, files, chunksize=chunksize))
+
+
+def validate_file(brick_file):
+    """
+    Validate one brick from a single read of its source.
+
+    Returns: {file: str, valid: bool, violations: list[{rule, message, line}]}
+    """
+    brick_file = Path(brick_file)
     violations = []
-    code = brick_file.read_text()
+
+    try:
+        with phase("file read"):
+            code = brick_file.read_text()
+    except OSError:
+        violations.append(_violation("BRICK005", f"File not found: {brick_file}"))
+        return {"file": str(brick_file), "valid": False, "violations": violations}
+    except ValueError as e:  # UnicodeDecodeError: not UTF-8 text
+        violations.append(_violation("BRICK006", f"Unreadable: {e}"))
+        return {"file": str(brick_file), "valid": False, "violations": violations}
 
     # Check size
     lines = [l for l in code.split("\n") if l.strip()]
     if len(lines) > 50:
-        violations.append(f"Exceeds 50 lines: {len(lines)}")
+        violations.append(_violation("BRICK001", f"Exceeds 50 lines: {len(lines)}"))
 
     # Check syntax
     try:
-        ast.parse(code)
+        with phase("ast.parse"):
+            ast.parse(code)
     except SyntaxError as e:
-        violations.append(f"Syntax error: {e}")
+        violations.append(_violation("BRICK002", f"Syntax error: {e}", e.lineno))
+    except ValueError as e:  # null bytes on older Pythons
+        violations.append(_violation("BRICK002", f"Syntax error: {e}"))
 
     # Check docstring
     if '"""' not in code and "'''" not in code:
-        violations.append("Missing docstring")
+        violations.append(_violation("BRICK003", "Missing docstring"))
 
     # Check metadata
     meta_file = brick_file.with_suffix(".meta.json")
-    if not meta_file.exists():
-        violations.append(f"Missing metadata: {meta_file.name}")
+    with phase("metadata load"):
+        has_meta = meta_file.exists()
+    if not has_meta:
+        violations.append(_violation("BRICK004", f"Missing metadata: {meta_file.name}"))
+
+    return {"file": str(brick_file), "valid": not violations, "violations": violations}
+
 
-    # Report results
-    print(f"Validating: {brick_file}")
-    if violations:
+def print_result(result):
+    """Print one validation result in the human-readable format."""
+    if any(v["rule"] == "BRICK005" for v in result["violations"]):
+        print(f"Error: File not found: {result['file']}")
+        return
+    print(f"Validating: {result['file']}")
+    if result["violations"]:
         print("\n❌ Violations:")
-        for v in violations:
-            print(f"  • {v}")
-        return 1
+        for v in result["violations"]:
+            print(f"  • {v['message']}")
     else:
         print("\n✓ Brick is valid")
-        return 0
+
+
+def to_sarif(results):
+    """Convert validation results to a SARIF 2.1.0 log."""
+    sarif_results = []
+    for result in results:
+        for v in result["violations"]:
+            location = {"artifactLocation": {"uri": Path(result["file"]).as_posix()}}
+            if v["line"]:
+                location["region"] = {"startLine": v["line"]}
+            sarif_results.append({
+                "ruleId": v["rule"],
+                "level": "error",
+                "message": {"text": v["message"]},
+                "locations": [{"physicalLocation": location}],
+            })
+    rules = [{"id": rule_id, "shortDescription": {"text": text}}
+             for rule_id, text in RULES.items()]
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {"name": "brick-validate", "rules": rules}},
+            "results": sarif_results,
+        }],
+    }
+
+
+def _violation(rule, message, line=None):
+    """Build a violation record."""
+    return {"rule": rule, "message": message, "line": line}
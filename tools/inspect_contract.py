@@ -4,6 +4,8 @@ import ast
 import json
 from pathlib import Path
 
+from tools.profiling import phase
+
 
 def inspect_contract(brick_file):
     """
@@ -22,7 +24,8 @@ def inspect_contract(brick_file):
         return {"score_deduction": 20, "violations": violations}
 
     try:
-        metadata = json.loads(meta_path.read_text())
+        with phase("metadata load"):
+            metadata = json.loads(meta_path.read_text())
     except json.JSONDecodeError:
         violations.append("Invalid metadata JSON")
         return {"score_deduction": 20, "violations": violations}
@@ -36,11 +39,13 @@ def inspect_contract(brick_file):
 
     # Validate code matches interface
     try:
-        code = brick_path.read_text()
-        tree = ast.parse(code)
+        with phase("file read"):
+            code = brick_path.read_text()
+        with phase("ast.parse"):
+            tree = ast.parse(code)
 
         # Check for main function
-        funcs = [n for n in tree.body if isinstance(n, ast.FunctionDef)]
+        funcs = [n for n in tree.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]
         if not funcs:
             violations.append("No function defined")
             deduction += 10
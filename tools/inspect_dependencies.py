@@ -3,6 +3,8 @@
 import ast
 from pathlib import Path
 
+from tools.profiling import phase
+
 
 RISKY_IMPORTS = ["pickle", "marshal", "shelve", "os.system"]
 
@@ -17,21 +19,27 @@ def inspect_dependencies(brick_file):
     deduction = 0
 
     try:
-        code = Path(brick_file).read_text()
-        tree = ast.parse(code)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name in RISKY_IMPORTS:
-                        issues.append(f"Risky import: {alias.name}")
-                        deduction += 5
-            elif isinstance(node, ast.ImportFrom):
-                if node.module in RISKY_IMPORTS:
-                    issues.append(f"Risky import: {node.module}")
-                    deduction += 5
+        with phase("file read"):
+            code = Path(brick_file).read_text()
+        with phase("ast.parse"):
+            tree = ast.parse(code)
+
+        for module in imported_modules(tree):
+            if module in RISKY_IMPORTS:
+                issues.append(f"Risky import: {module}")
+                deduction += 5
     except SyntaxError:
         issues.append("Syntax error")
         deduction += 10
 
     return {"score_deduction": deduction, "issues": issues}
+
+
+def imported_modules(tree):
+    """Yield the module name of every import statement in tree, in walk order."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom):
+            yield node.module
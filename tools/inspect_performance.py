@@ -0,0 +1,153 @@
+"""Performance inspector for brick validation."""
+
+import ast
+from pathlib import Path
+
+from tools.profiling import phase
+
+
+REGEX_FUNCS = {"match", "fullmatch", "search", "sub", "subn", "split",
+               "findall", "finditer"}
+
+# (description, fix hint, penalty) per antipattern
+STRING_CONCAT = ("quadratic string concatenation in loop",
+                 "collect parts in a list and ''.join() them", 10)
+UNCOMPILED_REGEX = ("uncompiled regex call inside function",
+                    "re.compile() the pattern once at module level", 3)
+CONSTANT_REBUILD = ("constant collection rebuilt on every call",
+                    "hoist to a module-level frozenset/tuple", 3)
+LIST_REBUILD = ("list rebuilt from itself on every call",
+                "keep a deque and pop expired items from the left", 5)
+FETCHALL = ("fetchall() materialises the whole result set",
+            "iterate the cursor or use fetchmany()", 5)
+COMMIT_IN_LOOP = ("commit() inside loop",
+                  "commit once after the loop in a single transaction", 10)
+COMMIT_PER_CALL = ("commit() on every call",
+                   "let the caller batch writes in one transaction", 5)
+
+
+def inspect_performance(brick_file):
+    """
+    Detect performance antipatterns with fix hints.
+
+    Returns: {score_deduction: int, issues: list}
+    """
+    try:
+        with phase("file read"):
+            code = Path(brick_file).read_text()
+        with phase("ast.parse"):
+            tree = ast.parse(code)
+    except SyntaxError:
+        return {"score_deduction": 10, "issues": ["Syntax error"]}
+
+    visitor = _PerformanceVisitor()
+    visitor.visit(tree)
+
+    issues = []
+    deduction = 0
+    for (desc, hint, penalty), line, detail in visitor.findings:
+        issues.append(f"PERF: {desc}{detail} (line {line}) - fix: {hint}")
+        deduction += penalty
+    return {"score_deduction": deduction, "issues": issues}
+
+
+class _PerformanceVisitor(ast.NodeVisitor):
+    """Walk a module tracking function and loop nesting."""
+
+    def __init__(self):
+        self.findings = []
+        self.functions = 0
+        self.loops = 0
+        self.string_names = set()
+
+    def report(self, rule, node, detail=""):
+        """Record a finding for rule at node's line."""
+        self.findings.append((rule, node.lineno, detail))
+
+    def visit_FunctionDef(self, node):
+        self.functions += 1
+        outer_loops, self.loops = self.loops, 0
+        outer_strings, self.string_names = self.string_names, set()
+        self.generic_visit(node)
+        self._check_commit_per_call(node)
+        self.string_names = outer_strings
+        self.loops = outer_loops
+        self.functions -= 1
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_For(self, node):
+        self.loops += 1
+        self.generic_visit(node)
+        self.loops -= 1
+
+    visit_AsyncFor = visit_While = visit_For
+
+    def visit_Assign(self, node):
+        value = node.value
+        if _is_stringy(value):
+            self.string_names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        if self.functions and _is_constant_collection(value):
+            self.report(CONSTANT_REBUILD, node)
+        if (self.functions and isinstance(value, ast.ListComp)
+                and any(_same(t, value.generators[0].iter) for t in node.targets)):
+            self.report(LIST_REBUILD, node)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node):
+        if (self.loops and isinstance(node.op, ast.Add) and isinstance(node.target, ast.Name)
+                and (_is_stringy(node.value) or node.target.id in self.string_names)):
+            self.report(STRING_CONCAT, node, f" '{node.target.id} +='")
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            if (self.functions and func.attr in REGEX_FUNCS
+                    and isinstance(func.value, ast.Name) and func.value.id == "re"):
+                self.report(UNCOMPILED_REGEX, node, f" 're.{func.attr}'")
+            elif func.attr == "fetchall":
+                self.report(FETCHALL, node)
+            elif func.attr == "commit" and self.loops:
+                self.report(COMMIT_IN_LOOP, node)
+        self.generic_visit(node)
+
+    def _check_commit_per_call(self, func_node):
+        """
+        Flag a function that executes one statement and commits it.
+
+        Several statements, or a loop of them, followed by one commit is
+        already batched and not reported.
+        """
+        nodes = list(ast.walk(func_node))
+        if any(isinstance(n, (ast.For, ast.AsyncFor, ast.While)) for n in nodes):
+            return
+        calls = [n for n in nodes if isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute)]
+        commits = [c for c in calls if c.func.attr == "commit"]
+        executes = [c for c in calls if c.func.attr in ("execute", "executemany")]
+        if len(executes) == 1:
+            for commit in commits:
+                self.report(COMMIT_PER_CALL, commit)
+
+
+def _is_stringy(node):
+    """True for string literals, f-strings and concatenations of them."""
+    if isinstance(node, ast.JoinedStr):
+        return True
+    if isinstance(node, ast.Constant):
+        return isinstance(node.value, str)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _is_stringy(node.left) or _is_stringy(node.right)
+    return False
+
+
+def _is_constant_collection(node):
+    """True for list/set literals of three or more constants."""
+    if not isinstance(node, (ast.List, ast.Set)):
+        return False
+    return len(node.elts) > 2 and all(isinstance(e, ast.Constant) for e in node.elts)
+
+
+def _same(left, right):
+    """True when two expressions are the same source (load/store ignored)."""
+    return ast.unparse(left) == ast.unparse(right)
@@ -3,6 +3,8 @@
 import ast
 from pathlib import Path
 
+from tools.profiling import phase
+
 
 def inspect_quality(brick_file):
     """
@@ -13,7 +15,8 @@ def inspect_quality(brick_file):
     issues = []
     deduction = 0
 
-    code = Path(brick_file).read_text()
+    with phase("file read"):
+        code = Path(brick_file).read_text()
     lines = [l for l in code.split("\n") if l.strip()]
 
     # Check size limit
@@ -23,14 +26,15 @@ def inspect_quality(brick_file):
 
     # Check for docstring
     try:
-        tree = ast.parse(code)
+        with phase("ast.parse"):
+            tree = ast.parse(code)
         if not ast.get_docstring(tree):
             issues.append("Missing module docstring")
             deduction += 5
 
         # Check function docstrings
         for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 if not ast.get_docstring(node):
                     issues.append(f"Missing docstring: {node.name}")
                     deduction += 3
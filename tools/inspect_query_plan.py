@@ -0,0 +1,289 @@
+"""Query-plan inspector: EXPLAIN the SQL a brick runs and suggest indexes.
+
+Statements are captured by running the brick's companion tests against
+traced sqlite3 connections in a child interpreter, or read from a recorded
+query log, and each is checked with EXPLAIN QUERY PLAN. Running tests
+executes their code, so this is opt-in: ``brick plan``, or
+``brick inspect --plan`` to fold the findings into the score. A plain
+``SCAN <table>`` for a filtered statement means no index serves its WHERE
+clause; the advice names the covering index that would (equality columns,
+then one range column, then the selected columns). Statements that cannot
+be explained come back as ``{sql, error}`` entries rather than being
+dropped, and a test run that cannot complete raises PlanError.
+"""
+
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from tools.profiling import phase
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# (description, fix hint, penalty), as in inspect_performance
+FULL_SCAN = ("full table scan", "add index", 5)
+
+STATEMENT = re.compile(r"^\s*(?:SELECT|UPDATE|DELETE)\b", re.I)
+PLAN_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+WHERE = re.compile(r"\bWHERE\b(.*?)(?:\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|$)", re.I | re.S)
+LITERAL = re.compile(r"'(?:[^']|'')*'")
+EQUALITY = re.compile(r"\b([A-Za-z_]\w*)\s*(?:==?|\bIN\b|\bIS\b)", re.I)
+RANGE = re.compile(r"\b([A-Za-z_]\w*)\s*(?:[<>]=?|\bBETWEEN\b|\bLIKE\b|\bGLOB\b)", re.I)
+SELECTED = re.compile(r"^\s*SELECT\s+(.*?)\s+FROM\b", re.I | re.S)
+IDENTIFIER = re.compile(r"^[A-Za-z_]\w*$")
+KEYWORDS = frozenset({"AND", "OR", "NOT", "WHERE"})
+PLACEHOLDER = re.compile(r"\?\d*|[:@$][A-Za-z_]\w*")
+
+
+class PlanError(Exception):
+    """Raised when a brick's tests cannot be run to capture its SQL."""
+
+
+def inspect_query_plan(brick_file, min_rows=0):
+    """
+    Score the full table scans in the SQL a brick runs under its tests.
+
+    Runs the tests (in a child interpreter), so only `brick inspect --plan`
+    calls this.
+
+    Returns: {score_deduction: int, issues: list, advice: list}
+    """
+    brick_file = Path(brick_file)
+    test_file = brick_file.parent / f"test_{brick_file.name}"
+    if not test_file.exists():
+        return {"score_deduction": 0, "issues": [], "advice": []}
+    try:
+        with phase("explain query plan"):
+            advice = advise_from_tests(test_file, min_rows, brick_file)
+    except PlanError as e:
+        return {"score_deduction": 0, "issues": [f"PLAN: query plan unavailable - {e}"],
+                "advice": []}
+    desc, hint, penalty = FULL_SCAN
+    issues, deduction = [], 0
+    for entry in advice:
+        if "error" in entry:
+            issues.append(f"PLAN: could not explain `{entry['sql']}` - {entry['error']}")
+            continue
+        issues.append(f"PERF: {desc} of {entry['table']} filtering on "
+                      f"{', '.join(entry['filter'])} - fix: {hint} `{entry['index']}`")
+        deduction += penalty
+    return {"score_deduction": deduction, "issues": issues, "advice": advice}
+
+
+def advise(conn, sql, min_rows=0):
+    """
+    EXPLAIN one statement on conn and advise on each unindexed filtered scan.
+
+    Unfiltered statements scan by design and are not reported, nor are
+    tables with fewer than min_rows rows. Placeholders are bound to NULL
+    for the EXPLAIN.
+
+    Returns: list of {table, rows, filter, columns, index, sql}, or
+    [{sql, error}] when the statement cannot be explained
+    """
+    where = WHERE.search(sql) if STATEMENT.match(sql) else None
+    if not where:
+        return []
+    try:
+        names = PLACEHOLDER.findall(LITERAL.sub("", sql))
+        params = {n[1:]: None for n in names if n[0] in ":@$"} or [None] * len(names)
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    except sqlite3.Error as e:
+        return [{"sql": sql, "error": str(e)}]
+
+    advice = []
+    for row in plan:
+        scan = PLAN_SCAN.match(row[-1])
+        if not scan:
+            continue
+        table = scan.group(1)
+        if table.startswith("sqlite_"):
+            continue  # the schema catalog cannot be indexed
+        try:
+            rows = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        except sqlite3.Error:
+            continue  # an alias or subquery, not a table
+        filtered, columns = index_columns(sql, where.group(1))
+        if rows < min_rows or not filtered:
+            continue
+        advice.append({
+            "table": table, "rows": rows, "filter": filtered, "columns": columns,
+            "index": (f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(columns)} "
+                      f"ON {table} ({', '.join(columns)})"),
+            "sql": sql,
+        })
+    return advice
+
+
+def index_columns(sql, where):
+    """
+    Return (filter columns, covering index columns) for a statement.
+
+    Equality columns lead, then at most one range column (an index cannot
+    seek past a range); plain selected columns are appended to cover the
+    query without a table lookup.
+    """
+    clause = LITERAL.sub("?", where)
+    filtered = []
+    for column in EQUALITY.findall(clause):
+        if column.upper() not in KEYWORDS and column not in filtered:
+            filtered.append(column)
+    ranges = [c for c in RANGE.findall(clause) if c.upper() not in KEYWORDS and c not in filtered]
+    filtered += ranges[:1]
+
+    columns = list(filtered)
+    selected = SELECTED.match(sql)
+    if selected:
+        names = [c.strip() for c in selected.group(1).split(",")]
+        if all(IDENTIFIER.match(c) for c in names):
+            columns += [c for c in names if c not in columns]
+    return filtered, columns
+
+
+def advise_from_tests(test_file, min_rows=0, brick_file=None, timeout=60):
+    """
+    Run a test module's argument-free test functions in a child interpreter
+    and return advice for the statements the brick itself executed.
+
+    Only statements issued with brick_file (default: the module the test
+    file is named after) on the call stack are explained, so the tests'
+    own setup and assertion queries are not blamed on the brick.
+
+    Returns: list of advice entries as from advise()
+
+    Raises: PlanError if the child fails, times out or prints no advice
+    """
+    test_file = Path(test_file).resolve()
+    if brick_file is None:
+        brick_file = test_file.with_name(test_file.name.removeprefix("test_"))
+    argv = [sys.executable, "-m", "tools.inspect_query_plan",
+            str(test_file), str(Path(brick_file).resolve()), str(min_rows)]
+    try:
+        proc = subprocess.run(argv, cwd=ROOT, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise PlanError(f"{test_file.name} timed out after {timeout}s")
+    if proc.returncode != 0:
+        detail = proc.stderr.strip().splitlines()[-1:] or [f"exit code {proc.returncode}"]
+        raise PlanError(f"{test_file.name}: {detail[0]}")
+    try:
+        return json.loads(proc.stdout)
+    except ValueError:
+        raise PlanError(f"{test_file.name}: unreadable advice output")
+
+
+def advise_from_log(db_path, statements, min_rows=1000, create=False):
+    """
+    EXPLAIN recorded statements against a database; with create, also
+    build the suggested indexes (statements that failed to explain are
+    returned as error entries and skipped).
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        advice = _dedupe([a for sql in dict.fromkeys(statements)
+                          for a in advise(conn, sql, min_rows)])
+        if create:
+            for entry in advice:
+                if "index" in entry:
+                    conn.execute(entry["index"])
+            conn.commit()
+    finally:
+        conn.close()
+    return advice
+
+
+def read_log(path):
+    """Return the statements in a query log (one per line, -- comments skipped)."""
+    lines = (line.strip() for line in Path(path).read_text().splitlines())
+    return [line.rstrip(";") for line in lines if line and not line.startswith("--")]
+
+
+def _test_functions(test_file):
+    """
+    Import a test module and return its test functions that take no fixtures.
+
+    An import failure propagates, failing the child run (and so PlanError).
+    """
+    spec = importlib.util.spec_from_file_location(f"_plan_{test_file.stem}", test_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [func for name, func in vars(module).items()
+            if name.startswith("test_") and inspect.isfunction(func)
+            and not inspect.signature(func).parameters]
+
+
+def _advise_in_process(test_file, brick_file, min_rows):
+    """Trace the brick's statements while its tests run (child interpreter only)."""
+    advice, open_conns, own = [], [], {}
+    brick_file = os.path.realpath(brick_file)
+
+    def from_brick():
+        frame = sys._getframe(2)
+        while frame:
+            name = frame.f_code.co_filename
+            if name not in own:
+                own[name] = os.path.realpath(name) == brick_file
+            if own[name]:
+                return True
+            frame = frame.f_back
+        return False
+
+    def flush(conn):
+        conn.set_trace_callback(None)
+        try:
+            for sql in dict.fromkeys(conn.statements):
+                advice.extend(advise(conn, sql, min_rows))
+        except sqlite3.Error:
+            pass  # closed underneath us
+        conn.statements.clear()
+
+    class TracedConnection(sqlite3.Connection):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.statements = []
+            self.set_trace_callback(self.trace)
+            open_conns.append(self)
+
+        def trace(self, sql):
+            if from_brick():
+                self.statements.append(sql)
+
+        def close(self):
+            if self in open_conns:
+                flush(self)
+                open_conns.remove(self)
+            super().close()
+
+    connect = sqlite3.connect
+    sqlite3.connect = lambda *args, **kwargs: connect(*args, **{"factory": TracedConnection,
+                                                                **kwargs})
+    sys.path.insert(0, str(Path(test_file).parent))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for test in _test_functions(Path(test_file)):
+            try:
+                test()
+            except Exception:
+                pass  # failing tests still show which SQL they ran
+        for conn in list(open_conns):
+            flush(conn)
+    return _dedupe(advice)
+
+
+def _dedupe(advice):
+    """Keep the first advice per suggested index (and error per statement)."""
+    seen = {}
+    for entry in advice:
+        seen.setdefault(entry.get("index") or ("error", entry["sql"]), entry)
+    return list(seen.values())
+
+
+if __name__ == "__main__":
+    print(json.dumps(_advise_in_process(sys.argv[1], sys.argv[2], int(sys.argv[3]))))
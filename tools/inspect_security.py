@@ -3,6 +3,8 @@
 import re
 from pathlib import Path
 
+from tools.profiling import phase
+
 
 BANNED_PATTERNS = [
     (r"eval\s*\(", "eval() on untrusted input", 30),
@@ -29,7 +31,8 @@ def inspect_security(brick_file):
     violations = []
     deduction = 0
 
-    code = Path(brick_file).read_text()
+    with phase("file read"):
+        code = Path(brick_file).read_text()
 
     for pattern, desc, penalty in BANNED_PATTERNS:
         if re.search(pattern, code, re.IGNORECASE):
@@ -0,0 +1,129 @@
+"""Phase timing and allocation profiling for the inspector and CLI commands.
+
+Instrumented code wraps work in ``with phase("name"):``. When nothing is
+listening this is a no-op; when a hook is registered each phase reports
+its wall time and tracemalloc peak to every hook. ``Profiler`` is the
+hook behind ``brick <command> --profile``; CI can register its own:
+
+    from tools import profiling
+
+    timings = []
+    profiling.add_hook(lambda name, seconds, peak: timings.append((name, seconds)))
+"""
+
+import time
+from contextlib import contextmanager
+
+
+_hooks = []
+# Open phases, innermost last: [start_bytes, peak_bytes] for each
+_stack = []
+
+
+def add_hook(hook):
+    """Register hook(name, seconds, peak_bytes), called as each phase ends."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Unregister a hook added with add_hook."""
+    _hooks.remove(hook)
+
+
+def enabled():
+    """True while at least one hook is listening."""
+    return bool(_hooks)
+
+
+@contextmanager
+def phase(name):
+    """Time a block and measure its allocation peak for registered hooks."""
+    if not _hooks:
+        yield
+        return
+    import tracemalloc
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if _stack:
+            _stack[-1][1] = max(_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        _stack.append([current, current])
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        peak_bytes = 0
+        if tracing:
+            frame = _stack.pop()
+            frame[1] = max(frame[1], tracemalloc.get_traced_memory()[1])
+            peak_bytes = frame[1] - frame[0]
+            if _stack:
+                _stack[-1][1] = max(_stack[-1][1], frame[1])
+            tracemalloc.reset_peak()
+        for hook in list(_hooks):
+            hook(name, seconds, peak_bytes)
+
+
+class Profiler:
+    """
+    Collect per-phase timings, optionally under cProfile.
+
+    Usage:
+        with Profiler(pstats_path="run.pstats") as profiler:
+            run_command()
+        profiler.print_report()
+    """
+
+    def __init__(self, pstats_path=None, trace_memory=True):
+        self.pstats_path = pstats_path
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self._cprofile = None
+        self._started_tracing = False
+
+    def __call__(self, name, seconds, peak_bytes):
+        calls, total, peak = self.phases.get(name, (0, 0.0, 0))
+        self.phases[name] = (calls + 1, total + seconds, max(peak, peak_bytes))
+
+    def __enter__(self):
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+        add_hook(self)
+        if self.pstats_path:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.pstats_path)
+        remove_hook(self)
+        if self._started_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+        return False
+
+    def results(self):
+        """Return {phase: {calls, seconds, peak_bytes}} in first-seen order."""
+        return {name: {"calls": calls, "seconds": total, "peak_bytes": peak}
+                for name, (calls, total, peak) in self.phases.items()}
+
+    def print_report(self, file=None):
+        """Print the per-phase breakdown table."""
+        print(f"\n{'phase':<24}{'calls':>7}{'total ms':>11}{'mean ms':>10}{'peak KiB':>11}",
+              file=file)
+        print("-" * 63, file=file)
+        for name, entry in self.results().items():
+            total_ms = entry["seconds"] * 1000
+            print(f"{name:<24}{entry['calls']:>7}{total_ms:>11.2f}"
+                  f"{total_ms / entry['calls']:>10.2f}{entry['peak_bytes'] / 1024:>11.1f}",
+                  file=file)
+        if self.pstats_path:
+            print(f"\ncProfile stats written to {self.pstats_path}", file=file)